@@ -0,0 +1,348 @@
+
+## Matthew Dorsey
+## @sunprancekid
+## 2026.10.18
+
+## FILENAME: examples/benchmark.py
+## PURPOUSE: time plotfig operations against the approaches they replace
+
+## MODULES
+# native / conda
+import sys, time, os, shutil, tempfile, pickle
+import numpy as np
+import pandas as pd
+# local
+from plot.figure import Figure
+from plot.plot import gen_plot, gen_scatter
+from plot.batch import render_batch
+from plot.template import Template
+from plot.rendercache import RenderCache
+from plot.writer import SaveQueue
+from plot.memory import render_bytes, render_rgba
+
+## CONSTANTS / PARAMETERS
+# number of series and points per series used for append benchmark
+n_series = 500
+n_points = 200
+# number of rows in csv file used for cache benchmark
+n_rows = 1000000
+# number of figures rendered in batch benchmark
+n_figures = 16
+# number of series drawn in collection benchmark
+n_many = 300
+
+## METHODS
+# returns the fastest of several calls to method, in seconds
+def best_time (method, repeat = 3):
+	best = None
+	for r in range(repeat):
+		t0 = time.perf_counter()
+		method()
+		t = time.perf_counter() - t0
+		if best is None or t < best:
+			best = t
+	return best
+
+## CLASSES
+# none
+
+## ARGUMENTS
+# boolean for running the append benchmark
+append = ('append' in sys.argv) or ('all' in sys.argv)
+# boolean for running the csv cache benchmark
+cache = ('cache' in sys.argv) or ('all' in sys.argv)
+# boolean for running the batch render benchmark
+batch = ('batch' in sys.argv) or ('all' in sys.argv)
+# boolean for running the render template benchmark
+template = ('template' in sys.argv) or ('all' in sys.argv)
+# boolean for running the collection render benchmark
+collect = ('collect' in sys.argv) or ('all' in sys.argv)
+# boolean for running the decimation benchmark
+decimate = ('decimate' in sys.argv) or ('all' in sys.argv)
+# boolean for running the scatter density benchmark
+density = ('density' in sys.argv) or ('all' in sys.argv)
+# boolean for running the fixed layout benchmark
+layout = ('layout' in sys.argv) or ('all' in sys.argv)
+# boolean for running the render cache benchmark
+rcache = ('rcache' in sys.argv) or ('all' in sys.argv)
+# boolean for running the multiple file type benchmark
+formats = ('formats' in sys.argv) or ('all' in sys.argv)
+# boolean for running the background save benchmark
+queue = ('queue' in sys.argv) or ('all' in sys.argv)
+# boolean for running the in-memory render benchmark
+memory = ('memory' in sys.argv) or ('all' in sys.argv)
+# boolean for running the figure spec benchmark
+spec = ('spec' in sys.argv) or ('all' in sys.argv)
+
+## SCRIPT
+if append: # compare one append_lists call per series against one append_series call
+	rng = np.random.default_rng(0)
+	series = [(rng.random(n_points).tolist(), rng.random(n_points).tolist(), "run{:d}".format(k)) for k in range(n_series)]
+
+	def loop ():
+		fig = Figure()
+		for x, y, l in series:
+			fig.append_lists(x, y, label = l)
+		fig.refresh()
+
+	def bulk ():
+		fig = Figure()
+		fig.append_series(series)
+		fig.refresh()
+
+	t_loop = best_time(loop)
+	t_bulk = best_time(bulk)
+	print("append {:d} series x {:d} points".format(n_series, n_points))
+	print("  append_lists loop : {:.4f} s".format(t_loop))
+	print("  append_series     : {:.4f} s ({:.1f}x)".format(t_bulk, t_loop / t_bulk))
+
+if cache: # compare parsing a csv file against loading its columns from the cache
+	tmp = tempfile.mkdtemp()
+	csv = os.path.join(tmp, "data.csv")
+	rng = np.random.default_rng(0)
+	pd.DataFrame({'x': np.arange(n_rows), 'y': rng.random(n_rows)}).to_csv(csv, index = False)
+
+	def parse ():
+		fig = Figure()
+		fig.append_csv(csv, xcol = 'x', ycol = 'y', label = "data")
+
+	def cached ():
+		fig = Figure()
+		fig.set_cache(os.path.join(tmp, "cache"))
+		fig.append_csv(csv, xcol = 'x', ycol = 'y', label = "data")
+
+	cached() # populate cache
+	t_parse = best_time(parse)
+	t_cache = best_time(cached)
+	print("append_csv {:d} rows".format(n_rows))
+	print("  parse csv         : {:.4f} s".format(t_parse))
+	print("  cached            : {:.4f} s ({:.1f}x)".format(t_cache, t_parse / t_cache))
+	shutil.rmtree(tmp)
+
+if batch: # compare rendering figures one at a time against rendering them in a process pool
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	figs = []
+	for k in range(n_figures):
+		fig = Figure()
+		fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "fig{:d}".format(k))
+		fig.append_series([(np.arange(n_points), rng.random(n_points), "run{:d}".format(j)) for j in range(5)])
+		figs.append(fig)
+
+	def serial ():
+		for fig in figs:
+			gen_plot(fig, show = False, save = True)
+
+	def pooled ():
+		for result in render_batch([(fig, 'plot') for fig in figs]):
+			pass
+
+	t_serial = best_time(serial, repeat = 1)
+	t_pooled = best_time(pooled, repeat = 1)
+	print("render {:d} figures, {:d} cpus".format(n_figures, os.cpu_count() or 1))
+	print("  gen_plot loop     : {:.4f} s".format(t_serial))
+	print("  render_batch      : {:.4f} s ({:.1f}x)".format(t_pooled, t_serial / t_pooled))
+	shutil.rmtree(tmp)
+
+if template: # compare rendering a sequence of frames with gen_plot against a reusable template
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	frames = []
+	for k in range(n_figures):
+		fig = Figure()
+		fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "frame{:03d}".format(k))
+		fig.append_series([(np.arange(n_points), rng.random(n_points), "run{:d}".format(j)) for j in range(5)])
+		fig.set_xaxis_min(0)
+		fig.set_xaxis_max(n_points)
+		fig.set_yaxis_min(0.)
+		fig.set_yaxis_max(1.)
+		frames.append(fig)
+
+	def rebuild ():
+		for fig in frames:
+			gen_plot(fig, show = False, save = True)
+
+	def reuse ():
+		tp = Template('plot')
+		for fig in frames:
+			tp.render(fig)
+
+	t_rebuild = best_time(rebuild, repeat = 1)
+	t_reuse = best_time(reuse, repeat = 1)
+	print("render {:d} frames".format(n_figures))
+	print("  gen_plot          : {:.4f} s".format(t_rebuild))
+	print("  Template.render   : {:.4f} s ({:.1f}x)".format(t_reuse, t_rebuild / t_reuse))
+	shutil.rmtree(tmp)
+
+if collect: # compare drawing each ival with its own artist against drawing them as collections
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	fig = Figure()
+	fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "many")
+	fig.append_series([(np.arange(100), rng.random(100), "run{:03d}".format(k)) for k in range(n_many)])
+
+	t_artist = best_time(lambda: gen_plot(fig, show = False, save = True), repeat = 1)
+	t_collect = best_time(lambda: gen_plot(fig, show = False, save = True, collect = True), repeat = 1)
+	print("gen_plot {:d} series".format(n_many))
+	print("  one line per ival : {:.4f} s".format(t_artist))
+	print("  collect = True    : {:.4f} s ({:.1f}x)".format(t_collect, t_artist / t_collect))
+	shutil.rmtree(tmp)
+
+if decimate: # compare drawing every point of long series against decimating them to the pixel width
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	print("gen_plot, 2 series")
+	for n in [100000, 1000000, 3000000]:
+		x = np.linspace(1., 1000., n)
+		y = np.sin(x / 30.) + rng.normal(0., 0.2, n)
+		fig = Figure()
+		fig.append_series([(x, y, "a"), (x, y + 3., "b")])
+		for method in [None, 'minmax', 'lttb']:
+			fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "{:d}_{}".format(n, method))
+			t = best_time(lambda: gen_plot(fig, show = False, save = True, markersize = 0, linewidth = 1, decimate = method), repeat = 1)
+			print("  {:8d} points, decimate = {:6s} : {:.4f} s, {:d} bytes".format(n, str(method), t, os.path.getsize(fig.get_saveas())))
+	shutil.rmtree(tmp)
+
+if density: # compare drawing one marker per point against drawing a density image
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	print("gen_scatter, 2 series")
+	for n in [100000, 1000000]:
+		fig = Figure()
+		fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "{:d}".format(n))
+		fig.append_series([(rng.normal(0., 1., n), rng.normal(0., 1., n), "a"), (rng.normal(1.5, 1., n), rng.normal(0.5, 0.5, n), "b")])
+		for d in [False, True]:
+			t = best_time(lambda: gen_scatter(fig, show = False, save = True, markersize = 1, density = d), repeat = 1)
+			print("  {:8d} points, density = {:5s} : {:.4f} s".format(2 * n, str(d), t))
+	shutil.rmtree(tmp)
+
+if layout: # compare saving with bbox_inches = 'tight' against reusing margins for each layout shape
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	figs = []
+	for k in range(n_figures):
+		fig = Figure()
+		fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "fig{:d}".format(k))
+		fig.set_title_label("run {:d}".format(k))
+		fig.append_series([(np.arange(n_points), rng.random(n_points), "run{:d}".format(j)) for j in range(5)])
+		figs.append(fig)
+
+	t_tight = best_time(lambda: [gen_plot(fig, show = False, save = True, layout = 'tight') for fig in figs], repeat = 2)
+	t_fixed = best_time(lambda: [gen_plot(fig, show = False, save = True, layout = 'fixed') for fig in figs], repeat = 2)
+	print("render {:d} figures with the same layout".format(n_figures))
+	print("  layout = tight    : {:.4f} s".format(t_tight))
+	print("  layout = fixed    : {:.4f} s ({:.1f}x)".format(t_fixed, t_tight / t_fixed))
+	shutil.rmtree(tmp)
+
+if rcache: # compare rendering unchanged figures against copying them from the render cache
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	figs = []
+	for k in range(n_figures):
+		fig = Figure()
+		fig.set_saveas(savedir = os.path.join(tmp, "out", ""), filename = "fig{:d}".format(k))
+		fig.set_title_label("run {:d}".format(k))
+		fig.append_series([(np.arange(n_points), rng.random(n_points), "run{:d}".format(j)) for j in range(5)])
+		figs.append(fig)
+	rc = RenderCache(os.path.join(tmp, "cache"))
+
+	t_draw = best_time(lambda: [gen_plot(fig, show = False, save = True) for fig in figs], repeat = 1)
+	t_miss = best_time(lambda: [rc.render(fig, gen_plot) for fig in figs], repeat = 1)
+	t_hit = best_time(lambda: [rc.render(fig, gen_plot) for fig in figs], repeat = 3)
+	print("render {:d} unchanged figures".format(n_figures))
+	print("  gen_plot          : {:.4f} s".format(t_draw))
+	print("  cache miss        : {:.4f} s".format(t_miss))
+	print("  cache hit         : {:.4f} s ({:.1f}x)".format(t_hit, t_draw / t_hit))
+	print("  {}".format(rc.get_stats()))
+	shutil.rmtree(tmp)
+
+if formats: # compare one generator call per file type against saving every file type from one draw
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	series = [(np.arange(n_points * 10), rng.random(n_points * 10), "run{:d}".format(j)) for j in range(5)]
+	for filetypes in [[".png", ".tif"], [".png", ".tif", ".pdf", ".svg"]]:
+		def separate ():
+			for t in filetypes:
+				fig = Figure()
+				fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "separate", filetype = t)
+				fig.append_series(series)
+				gen_plot(fig, show = False, save = True)
+		def single ():
+			fig = Figure()
+			fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "single", filetype = filetypes)
+			fig.append_series(series)
+			gen_plot(fig, show = False, save = True)
+		t_separate = best_time(separate, repeat = 2)
+		t_single = best_time(single, repeat = 2)
+		print("gen_plot saved as {}".format(" ".join(filetypes)))
+		print("  one call per type : {:.4f} s".format(t_separate))
+		print("  one draw          : {:.4f} s ({:.1f}x)".format(t_single, t_separate / t_single))
+	shutil.rmtree(tmp)
+
+if queue: # compare saving each figure before rendering the next against writing figures in the background
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	figs = []
+	for k in range(n_figures):
+		fig = Figure()
+		fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "fig{:d}".format(k))
+		fig.append_series([(np.arange(n_points), rng.random(n_points), "run{:d}".format(j)) for j in range(5)])
+		figs.append(fig)
+
+	def background ():
+		with SaveQueue() as q:
+			for fig in figs:
+				gen_plot(fig, show = False, save = True)
+
+	t_sync = best_time(lambda: [gen_plot(fig, show = False, save = True) for fig in figs], repeat = 2)
+	t_queue = best_time(background, repeat = 2)
+	print("render {:d} figures, {:d} cpus".format(n_figures, os.cpu_count()))
+	print("  save immediately  : {:.4f} s".format(t_sync))
+	# with one cpu, the queue writes each figure immediately
+	print("  SaveQueue ({:d} thr) : {:.4f} s ({:.1f}x)".format(SaveQueue().workers, t_queue, t_sync / t_queue))
+	shutil.rmtree(tmp)
+
+if memory: # compare saving a figure and reading the file back against rendering it to memory
+	tmp = tempfile.mkdtemp()
+	rng = np.random.default_rng(0)
+	fig = Figure()
+	fig.set_saveas(savedir = os.path.join(tmp, ""), filename = "memory")
+	fig.append_series([(np.arange(n_points), rng.random(n_points), "run{:d}".format(j)) for j in range(5)])
+
+	def disk ():
+		gen_plot(fig, show = False, save = True)
+		with open(fig.get_saveas(), 'rb') as f:
+			return f.read()
+
+	t_disk = best_time(disk)
+	t_bytes = best_time(lambda: render_bytes(fig))
+	t_rgba = best_time(lambda: render_rgba(fig))
+	print("gen_plot, {:d} series".format(5))
+	print("  save and read png : {:.4f} s".format(t_disk))
+	print("  render_bytes      : {:.4f} s ({:.1f}x)".format(t_bytes, t_disk / t_bytes))
+	print("  render_rgba       : {:.4f} s ({:.1f}x)".format(t_rgba, t_disk / t_rgba))
+	shutil.rmtree(tmp)
+
+if spec: # compare sending a Figure to a worker against sending its spec
+	tmp = tempfile.mkdtemp()
+	csv = os.path.join(tmp, "data.csv")
+	rng = np.random.default_rng(0)
+	pd.DataFrame({'x': np.arange(n_rows), 'y': rng.random(n_rows)}).to_csv(csv, index = False)
+	fig = Figure()
+	fig.append_csv(csv, xcol = 'x', ycol = 'y', label = "data")
+	fig.set_title_label("spec")
+	fig.set_yaxis_scale(log = True)
+	s = fig.to_spec('plot')
+
+	def send_figure ():
+		return pickle.loads(pickle.dumps(fig))
+
+	def send_spec ():
+		return Figure.from_spec(pickle.loads(pickle.dumps(s)))
+
+	t_fig = best_time(send_figure)
+	t_spec = best_time(send_spec)
+	print("send Figure with {:d} rows to worker".format(n_rows))
+	print("  pickle Figure     : {:.4f} s, {:d} bytes".format(t_fig, len(pickle.dumps(fig))))
+	print("  pickle FigureSpec : {:.4f} s, {:d} bytes, including reading csv".format(t_spec, len(pickle.dumps(s))))
+	shutil.rmtree(tmp)
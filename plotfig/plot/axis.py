@@ -314,6 +314,10 @@ class Axis (object):
         returns minor axis tick marks.
     has_major_ticks():
         returns boolean determining if axis has minor tick marks.
+    to_spec():
+        returns dictionary describing axis, which can be written as json or toml.
+    apply_spec():
+        assigns label, scale, limits and ticks described by dictionary.
     """
 
     def __init__ (self):
@@ -1125,6 +1129,70 @@ class Axis (object):
         """
         return self.minor_ticks is not None
 
+    ## AXIS SPECIFICATION
+
+    def to_spec (self, limits = True):
+        """ returns dictionary describing axis, containing only values which can be written as json or toml.
+
+        Parameters:
+        -----------
+        limits : bool (optional, default is 'True')
+            if 'True', the limits and padding assigned to the axis are
+            included, e.g. when they were not computed from data.
+
+        Returns:
+        --------
+        Dict
+            axis label, font size, scale, ticks and optionally limits.
+            unassigned values are omitted.
+        """
+        spec = {'scale': self.get_scale()}
+        if self.is_logscale():
+            spec['base'] = float(self.get_logscale_base())
+        if self.has_label():
+            spec['label'] = self.label.get_label()
+            spec['label_size'] = self.label.get_size()
+        if limits:
+            if self.has_minimum():
+                spec['min'] = float(self.get_minimum(pad = False))
+            if self.has_maximum():
+                spec['max'] = float(self.get_maximum(pad = False))
+            if self.has_pad_val():
+                spec['pad'] = float(self.pad_val)
+        if self.has_major_ticks():
+            spec['major_ticks'] = [float(t) for t in self.major_ticks]
+        if self.has_minor_ticks():
+            spec['minor_ticks'] = [float(t) for t in self.minor_ticks]
+        return spec
+
+    def apply_spec (self, spec = None):
+        """ assigns label, scale, limits and ticks described by dictionary returned from 'to_spec'.
+
+        values which are not in 'spec' are left unchanged.
+
+        Parameters:
+        -----------
+        spec : Dict
+            description of axis.
+
+        Returns:
+        --------
+        None
+        """
+        if 'label' in spec or 'label_size' in spec:
+            self.set_label(spec.get('label', ""), spec.get('label_size'))
+        if 'scale' in spec:
+            self.set_scale(spec['scale'], spec.get('base'))
+        if 'min' in spec or 'max' in spec:
+            # reset before assigning, so new limits are not checked against old ones
+            self.reset_limits()
+            self.set_limits(min_val = spec.get('min'), max_val = spec.get('max'))
+            self.pad_limits(spec.get('pad'))
+        if 'major_ticks' in spec:
+            self.major_ticks = np.asarray(spec['major_ticks'], dtype = float)
+        if 'minor_ticks' in spec:
+            self.minor_ticks = np.asarray(spec['minor_ticks'], dtype = float)
+
 ## ARGUMENTS
 # none
 
@@ -0,0 +1,301 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: batch.py
+## PURPOSE: contains methods for rendering many Figure objects across a pool of processes
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import os
+import sys
+import time
+import traceback
+import argparse
+import matplotlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+# local
+from plot.figure import Figure, accepted_filetypes, default_file_type
+from plot.ingest import list_files
+from plot.plot import gen_plot, gen_scatter, gen_pie_chart, gen_bar_chart
+from plot.rendercache import RenderCache
+from plot.spec import FigureSpec, spec_extensions
+
+
+################
+## PARAMETERS ##
+################
+
+## methods used to render jobs, by name
+generators = {
+    'plot': gen_plot,
+    'scatter': gen_scatter,
+    'pie': gen_pie_chart,
+    'bar': gen_bar_chart}
+default_generator = 'plot'
+
+
+#############
+## METHODS ##
+#############
+
+def get_generator (generator = None):
+    """ returns method used to render job.
+
+    Parameters:
+    -----------
+    generator : str or callable
+        name of generator in 'generators', or method called with Figure
+        and options, e.g. 'plot.plot.gen_plot'.
+
+    Returns:
+    --------
+    callable
+        generator method, or 'None' if 'generator' is not recognized.
+    """
+    if generator is None:
+        return generators[default_generator]
+    if callable(generator):
+        return generator
+    return generators.get(generator)
+
+def render_job (index = None, fig = None, generator = None, options = None, cache = None):
+    """ renders one Figure, recording the time taken and any error raised.
+
+    module level, so that it can be sent to worker processes. figures are
+    never shown, and are saved unless 'options' sets 'save' to 'False'.
+
+    Parameters:
+    -----------
+    index : int
+        position of job in batch.
+    fig : Figure or FigureSpec
+        Figure rendered by job. a spec is built into a Figure by the job,
+        so only the spec is sent to the worker, see 'Figure.from_spec'.
+    generator : str or callable
+        generator used to render Figure, see 'get_generator'. defaults to
+        the generator named in the spec.
+    options : Dict (optional)
+        keyword arguments passed to generator. defaults to the options in
+        the spec.
+    cache : RenderCache (optional)
+        if supplied, saved figures are copied from the cache when their
+        data and formatting are unchanged, see 'RenderCache.render'.
+
+    Returns:
+    --------
+    JobResult
+        outcome of job.
+    """
+    t0 = time.perf_counter()
+    saveas = None
+    error = None
+    trace = None
+    cached = False
+    try:
+        if isinstance(fig, FigureSpec):
+            if generator is None:
+                generator = fig.get_generator()
+            if options is None:
+                options = fig.get_options()
+            fig = Figure.from_spec(fig)
+            if fig is None:
+                raise ValueError("unable to build Figure from spec.")
+        if fig is None:
+            raise ValueError("job does not have a Figure.")
+        method = get_generator(generator)
+        if method is None:
+            raise ValueError("unknown generator '{0}', must be one of {1}.".format(generator, list(generators.keys())))
+        kwargs = dict(options) if options is not None else {}
+        kwargs['show'] = False
+        kwargs.setdefault('save', True)
+        if kwargs['save']:
+            saveas = fig.get_saveas()
+        if cache is not None and kwargs['save']:
+            cached = cache.render(fig, method, **kwargs)
+        else:
+            method(fig, **kwargs)
+    except (Exception, SystemExit) as e:
+        # generators exit when they are not passed a Figure
+        error = repr(e)
+        trace = traceback.format_exc()
+    return JobResult(index, saveas, time.perf_counter() - t0, error, trace, cached)
+
+def init_worker ():
+    """ prepares worker process for rendering, selecting a non-interactive backend. """
+    matplotlib.use('Agg')
+
+def render_batch (jobs = None, workers = None, processes = True, cache = None):
+    """ renders many Figures concurrently, yielding each result as it completes.
+
+    jobs are run in a pool of processes, so that each uses its own core.
+    a job which fails does not stop the batch; its error is recorded in
+    the result. results are yielded in the order the jobs complete, not
+    the order they were passed, and carry the index of their job.
+
+    Parameters:
+    -----------
+    jobs : List[(Figure or FigureSpec, str or callable, Dict)]
+        Figure, generator and generator options for each job. generator
+        and options may be omitted, see 'render_job'. specs are much
+        smaller than Figures, so they are cheaper to send to workers.
+    workers : int (optional)
+        number of processes, defaults to the number of cpus. if '1', jobs
+        are rendered in the calling process, without a pool.
+    processes : bool (optional, default is 'True')
+        if 'False', jobs are rendered in a pool of threads.
+    cache : RenderCache (optional)
+        cache shared by every job, see 'render_job'.
+
+    Returns:
+    --------
+    Generator[JobResult]
+        outcome of each job.
+    """
+    jobs = [tuple(j) if isinstance(j, (tuple, list)) else (j,) for j in jobs]
+    jobs = [j + (None,) * (3 - len(j)) for j in jobs]
+    if workers is None or workers < 1:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        for k, (fig, generator, options) in enumerate(jobs):
+            yield render_job(k, fig, generator, options, cache)
+        return
+    if processes:
+        pool = ProcessPoolExecutor(max_workers = workers, initializer = init_worker)
+    else:
+        pool = ThreadPoolExecutor(max_workers = workers)
+    with pool as executor:
+        futures = {executor.submit(render_job, k, fig, generator, options, cache): k for k, (fig, generator, options) in enumerate(jobs)}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # job could not be sent to, or returned from, its worker
+                yield JobResult(futures[future], None, 0., repr(e), traceback.format_exc())
+
+def parse_column (col = None):
+    """ returns column number if 'col' is an integer string, otherwise column header. """
+    if col is not None and col.isdigit():
+        return int(col)
+    return col
+
+def main (args = None):
+    """ command line entry for rendering one Figure from each csv file, or spec file.
+
+    Usage:
+    ------
+    python -m plot.batch data/*.csv -g scatter -x 0 -y 1 -o figures/ -w 8
+    python -m plot.batch specs/*.toml -w 8
+
+    files ending with one of 'spec_extensions' are read as a FigureSpec,
+    which describes its own data, formatting, generator and save location.
+
+    Returns:
+    --------
+    int
+        '0' if every job succeeded, '1' if any job failed.
+    """
+    p = argparse.ArgumentParser(prog = "plot.batch", description = "Render one figure from each csv or spec file across a pool of processes.")
+    p.add_argument("files", nargs = "+", help = "csv or spec files, or glob patterns matching them.")
+    p.add_argument("-g", "--generator", default = default_generator, choices = list(generators.keys()), help = "type of plot generated for each file.")
+    p.add_argument("-x", "--xcol", default = None, help = "header or column number containing x-axis data.")
+    p.add_argument("-y", "--ycol", default = None, help = "header or column number containing y-axis data.")
+    p.add_argument("-i", "--icol", default = None, help = "header or column number containing i-axis data.")
+    p.add_argument("-o", "--outdir", default = "./", help = "directory figures are saved to, each named after its csv file.")
+    p.add_argument("-t", "--filetype", nargs = "+", default = [default_file_type], choices = accepted_filetypes, help = "file types figures are saved as, all saved from a single draw.")
+    p.add_argument("-c", "--cache", default = None, help = "directory of render cache. figures whose data and formatting are unchanged are copied from the cache.")
+    p.add_argument("-w", "--workers", type = int, default = None, help = "number of worker processes, defaults to number of cpus.")
+    parsed = p.parse_args(args)
+
+    # build one job for each file
+    paths = []
+    for f in parsed.files:
+        paths += list_files(f) if any(c in f for c in "*?[") else [f]
+    jobs = []
+    for path in paths:
+        if os.path.splitext(path)[1].lower() in spec_extensions:
+            # spec is built into a Figure by the worker
+            jobs.append((FigureSpec.load(path), None, None))
+            continue
+        fig = Figure()
+        stem = os.path.splitext(os.path.basename(path))[0]
+        fig.set_saveas(savedir = os.path.join(parsed.outdir, ""), filename = stem, filetype = parsed.filetype)
+        if not fig.append_csv(path, xcol = parse_column(parsed.xcol), ycol = parse_column(parsed.ycol), icol = parse_column(parsed.icol)):
+            print("ERROR :: batch.main() :: unable to read csv file '{0}'.".format(path))
+            fig = None
+        jobs.append((fig, parsed.generator, None))
+
+    # render, reporting each job as it completes
+    cache = RenderCache(parsed.cache) if parsed.cache is not None else None
+    t0 = time.perf_counter()
+    n_failed = 0
+    n_cached = 0
+    for result in render_batch(jobs, workers = parsed.workers, cache = cache):
+        print(result)
+        if not result.is_ok():
+            n_failed += 1
+        elif result.cached:
+            n_cached += 1
+    print("rendered {0} of {1} figures in {2:.3f} s, {3} copied from cache.".format(len(jobs) - n_failed, len(jobs), time.perf_counter() - t0, n_cached))
+    return 1 if n_failed > 0 else 0
+
+
+#############
+## CLASSES ##
+#############
+
+class JobResult (object):
+    """ outcome of rendering one Figure in a batch.
+
+    Attributes:
+    -----------
+    index : int
+        position of job in batch.
+    saveas : str
+        path figure was saved to, or 'None' if it was not saved.
+    seconds : float
+        time taken to render job.
+    error : str
+        description of exception raised by job, or 'None' if it succeeded.
+    traceback : str
+        traceback of exception raised by job, or 'None' if it succeeded.
+    cached : bool
+        'True' if figure was copied from the render cache, rather than drawn.
+
+    Methods:
+    --------
+    is_ok
+    """
+
+    def __init__ (self, index = None, saveas = None, seconds = 0., error = None, traceback = None, cached = False):
+        self.index = index
+        self.saveas = saveas
+        self.seconds = seconds
+        self.error = error
+        self.traceback = traceback
+        self.cached = cached
+
+    def __str__ (self):
+        if self.is_ok():
+            return "{0:d} :: {1} :: {2:.3f} s :: {3}".format(self.index, "cached" if self.cached else "ok", self.seconds, self.saveas)
+        return "{0:d} :: ERROR :: {1:.3f} s :: {2}".format(self.index, self.seconds, self.error)
+
+    def is_ok (self):
+        """ returns 'True' if job succeeded. """
+        return self.error is None
+
+
+###############
+## ARGUMENTS ##
+###############
+# none
+
+
+############
+## SCRIPT ##
+############
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
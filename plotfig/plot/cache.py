@@ -0,0 +1,387 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: cache.py
+## PURPOSE: contains size-bounded on-disk cache used to store parsed data files and rendered figures
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import os
+import shutil
+import threading
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for DiskCache class
+default_cache_bytes = 1 << 30 # maximum number of bytes stored in cache directory, 1 GiB
+hash_block_bytes = 1 << 20 # number of bytes read from file at once when hashing contents
+array_extension = ".npy" # extension of files containing cached arrays
+category_extension = ".json" # extension of files containing the categories of cached object arrays
+
+
+#############
+## METHODS ##
+#############
+
+def make_key (*parts):
+    """ returns hexadecimal digest identifying the objects in 'parts'.
+
+    Parameters:
+    -----------
+    parts : str, int, Dict, ...
+        objects with a stable 'repr', used to identify cache entry.
+
+    Returns:
+    --------
+    str
+        sha256 digest of parts.
+    """
+    h = hashlib.sha256()
+    for p in parts:
+        if isinstance(p, dict):
+            p = sorted(p.items(), key = lambda kv: str(kv[0]))
+        h.update(repr(p).encode())
+        h.update(b'\0')
+    return h.hexdigest()
+
+def hash_file (filename = None):
+    """ returns sha256 digest of the contents of a file. """
+    h = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(hash_block_bytes), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def source_key (filename = None, col_dict = None, dtype = None, content_hash = False):
+    """ returns key identifying columns parsed from a data file.
+
+    by default, the file is identified by its path, size and modification
+    time, which only requires a call to 'os.stat'. if 'content_hash' is
+    'True', the file is identified by the digest of its contents, so
+    copies and touched files which are otherwise unchanged still match.
+
+    Parameters:
+    -----------
+    filename : str
+        path to data file.
+    col_dict : Dict
+        maps axes to columns parsed from file.
+    dtype : Dict (optional)
+        maps axes to data type used to parse column.
+    content_hash : bool (optional, default is 'False')
+        if 'True', key is derived from file contents.
+
+    Returns:
+    --------
+    str
+        key used to store columns in DiskCache.
+    """
+    if content_hash:
+        ident = ('content', hash_file(filename))
+    else:
+        st = os.stat(filename)
+        ident = ('stat', os.path.abspath(filename), st.st_size, st.st_mtime_ns)
+    dtypes = None if dtype is None else {k: str(np.dtype(t)) if not isinstance(t, str) else t for k, t in dtype.items()}
+    return make_key(ident, col_dict, dtypes)
+
+
+#############
+## CLASSES ##
+#############
+
+class DiskCache (object):
+    """ size-bounded cache of numpy arrays and files stored in a directory.
+
+    each entry is a sub-directory named by its key, containing one '.npy'
+    file per array, or copies of the files stored with 'put_file'. entries are written to a temporary directory and
+    renamed into place, so concurrent readers never see a partial entry.
+    numerical arrays are memory-mapped when loaded. the modification time
+    of an entry records when it was last used, and the least recently
+    used entries are removed whenever the cache grows beyond 'max_bytes'.
+
+    Attributes:
+    -----------
+    directory : str
+        path to directory containing cache entries.
+    max_bytes : int
+        maximum number of bytes stored in cache.
+    hits : int
+        number of lookups which found an entry.
+    misses : int
+        number of lookups which did not find an entry.
+
+    Methods:
+    --------
+    has, get_arrays, put_arrays, get_file, get_files, put_file, put_files, remove, evict, clear, get_nbytes, get_stats
+    """
+
+    def __init__ (self, directory = None, max_bytes = default_cache_bytes):
+        if directory is None:
+            raise ValueError("DiskCache requires argument 'directory' with path to cache.")
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok = True)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__ (self):
+        return "DiskCache('{0}', max_bytes = {1})".format(self.directory, self.max_bytes)
+
+    def get_path (self, key = None):
+        """ returns path to directory containing cache entry. """
+        return os.path.join(self.directory, key)
+
+    def get_tmp_path (self, key = None):
+        """ returns path entry is written to before it is renamed into place, unique to the calling thread. """
+        return "{0}.tmp{1}.{2}".format(self.get_path(key), os.getpid(), threading.get_ident())
+
+    def has (self, key = None):
+        """ returns 'True' if cache contains entry for 'key'. """
+        return os.path.isdir(self.get_path(key))
+
+    def touch (self, key = None):
+        """ marks entry as most recently used. """
+        try:
+            os.utime(self.get_path(key))
+        except OSError:
+            pass
+
+    def get_arrays (self, key = None, mmap = True):
+        """ returns arrays stored in cache entry.
+
+        Parameters:
+        -----------
+        key : str
+            key identifying entry.
+        mmap : bool (optional, default is 'True')
+            if 'True', numerical arrays are memory-mapped, rather than
+            read into memory. object arrays are decoded from their codes
+            and categories into new arrays.
+
+        Returns:
+        --------
+        Dict[numpy.ndarray]
+            maps array names to arrays, or 'None' if there is no entry
+            for 'key'.
+        """
+        path = self.get_path(key)
+        try:
+            names = [f for f in os.listdir(path) if f.endswith(array_extension)]
+            arrays = {}
+            for f in names:
+                name = f[:-len(array_extension)]
+                # pickled arrays are never loaded, since they can run code
+                arr = np.load(os.path.join(path, f), mmap_mode = 'r' if mmap else None, allow_pickle = False)
+                cname = os.path.join(path, name + category_extension)
+                if os.path.isfile(cname):
+                    # object array, stored as codes into list of categories
+                    with open(cname, 'r', encoding = 'utf-8') as c:
+                        categories = np.array(json.load(c), dtype = object)
+                    arr = categories[np.asarray(arr)]
+                arrays[name] = arr
+        except OSError:
+            # entry is missing, or was removed while reading
+            self.misses += 1
+            return None
+        except (ValueError, IndexError):
+            # entry is not readable, e.g. pickled by an earlier version, remove it so it can be stored again
+            shutil.rmtree(path, ignore_errors = True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.touch(key)
+        return arrays
+
+    def put_arrays (self, key = None, arrays = None):
+        """ stores arrays in cache entry, evicting old entries if necessary.
+
+        numerical arrays are stored as '.npy' files. arrays of python
+        objects, e.g. strings, are stored as integer codes, with their
+        categories written as json, so that no array is pickled. entries
+        whose objects cannot be written as json are not stored.
+
+        Parameters:
+        -----------
+        key : str
+            key identifying entry.
+        arrays : Dict[numpy.ndarray]
+            maps array names to arrays.
+
+        Returns:
+        --------
+        bool
+            'True' if arrays were stored, else 'False'.
+        """
+        path = self.get_path(key)
+        tmp = self.get_tmp_path(key)
+        try:
+            os.makedirs(tmp, exist_ok = True)
+            for k, arr in arrays.items():
+                arr = np.asarray(arr)
+                if arr.dtype.kind == 'O':
+                    codes, categories = pd.factorize(arr, use_na_sentinel = False)
+                    with open(os.path.join(tmp, str(k) + category_extension), 'w', encoding = 'utf-8') as c:
+                        json.dump([v.item() if isinstance(v, np.generic) else v for v in categories], c)
+                    arr = codes
+                np.save(os.path.join(tmp, str(k) + array_extension), arr, allow_pickle = False)
+            os.rename(tmp, path)
+        except (OSError, TypeError, ValueError):
+            # entry written by another process, cache directory is not writable,
+            # or objects cannot be written as json
+            shutil.rmtree(tmp, ignore_errors = True)
+            return self.has(key)
+        self.evict(keep = key)
+        return True
+
+    def get_file (self, key = None, name = None):
+        """ returns path to file stored in cache entry.
+
+        Parameters:
+        -----------
+        key : str
+            key identifying entry.
+        name : str
+            name of file within entry.
+
+        Returns:
+        --------
+        str
+            path to file, or 'None' if there is no entry for 'key'. the file
+            belongs to the cache and should be copied, not modified.
+        """
+        paths = self.get_files(key, [name])
+        return None if paths is None else paths[0]
+
+    def get_files (self, key = None, names = None):
+        """ returns paths to several files stored in cache entry, counted as one lookup.
+
+        Returns:
+        --------
+        List[str]
+            path to each file, or 'None' if the entry does not contain every file.
+        """
+        paths = [os.path.join(self.get_path(key), n) for n in names]
+        if not all(os.path.isfile(p) for p in paths):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.touch(key)
+        return paths
+
+    def put_file (self, key = None, filename = None, name = None):
+        """ stores copy of file in cache entry, evicting old entries if necessary.
+
+        Parameters:
+        -----------
+        key : str
+            key identifying entry.
+        filename : str
+            path to file copied into cache.
+        name : str (optional)
+            name of file within entry, defaults to the base name of 'filename'.
+
+        Returns:
+        --------
+        bool
+            'True' if file was stored, else 'False'.
+        """
+        if name is None:
+            name = os.path.basename(filename)
+        return self.put_files(key, {name: filename})
+
+    def put_files (self, key = None, files = None):
+        """ stores copies of several files in one cache entry, see 'put_file'.
+
+        Parameters:
+        -----------
+        key : str
+            key identifying entry.
+        files : Dict[str]
+            maps name of each file within entry to the path copied into cache.
+
+        Returns:
+        --------
+        bool
+            'True' if files were stored, else 'False'.
+        """
+        path = self.get_path(key)
+        tmp = self.get_tmp_path(key)
+        try:
+            os.makedirs(tmp, exist_ok = True)
+            for name, filename in files.items():
+                shutil.copyfile(filename, os.path.join(tmp, name))
+            os.rename(tmp, path)
+        except OSError:
+            # entry written by another process, or cache directory is not writable
+            shutil.rmtree(tmp, ignore_errors = True)
+            return all(os.path.isfile(os.path.join(path, n)) for n in files)
+        self.evict(keep = key)
+        return True
+
+    def remove (self, key = None):
+        """ removes entry from cache. """
+        shutil.rmtree(self.get_path(key), ignore_errors = True)
+
+    def list_entries (self):
+        """ returns list of (last used time, bytes, key) for each entry in cache. """
+        entries = []
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if not e.is_dir() or '.tmp' in e.name:
+                    continue
+                try:
+                    nbytes = sum(f.stat().st_size for f in os.scandir(e.path))
+                    entries.append((e.stat().st_mtime_ns, nbytes, e.name))
+                except OSError:
+                    continue
+        return entries
+
+    def evict (self, keep = None):
+        """ removes least recently used entries until cache is below 'max_bytes'.
+
+        Parameters:
+        -----------
+        keep : str (optional)
+            key of entry which is never removed, e.g. the entry just written.
+
+        Returns:
+        --------
+        int
+            number of entries removed.
+        """
+        entries = sorted(self.list_entries())
+        total = sum(e[1] for e in entries)
+        n = 0
+        for t, nbytes, key in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self.remove(key)
+            total -= nbytes
+            n += 1
+        return n
+
+    def clear (self):
+        """ removes every entry from cache. """
+        for t, nbytes, key in self.list_entries():
+            self.remove(key)
+
+    def get_nbytes (self):
+        """ returns number of bytes stored in cache. """
+        return sum(e[1] for e in self.list_entries())
+
+    def get_stats (self):
+        """ returns dictionary containing number of hits, misses, entries and bytes in cache. """
+        entries = self.list_entries()
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(entries), 'bytes': sum(e[1] for e in entries)}
@@ -0,0 +1,219 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: decimate.py
+## PURPOSE: contains methods for reducing line series to the number of points which can be resolved in a figure
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import numpy as np
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for decimation
+decimate_methods = ['minmax', 'lttb']
+minmax_points_per_bin = 4 # points kept from each pixel column: first, last, minimum, maximum
+lttb_points_per_pixel = 2 # points kept per pixel column by largest triangle three buckets
+
+
+#############
+## METHODS ##
+#############
+
+def get_pixel_width (ax = None, dpi = None):
+    """ returns width of axes in pixels, when figure is saved at 'dpi'.
+
+    Parameters:
+    -----------
+    ax : matplotlib.axes.Axes
+        axes series are drawn in.
+    dpi : int
+        resolution figure is saved at.
+
+    Returns:
+    --------
+    int
+        number of pixel columns spanned by axes.
+    """
+    width = ax.get_position().width * ax.figure.get_figwidth() * dpi
+    return max(1, int(round(width)))
+
+def get_pixel_height (ax = None, dpi = None):
+    """ returns height of axes in pixels, when figure is saved at 'dpi'. """
+    height = ax.get_position().height * ax.figure.get_figheight() * dpi
+    return max(1, int(round(height)))
+
+def get_pixel_columns (x = None, n_pixels = None, lims = None, log = False):
+    """ returns the pixel column each x-value is drawn in.
+
+    points left of the axis are assigned column '-1', points right of
+    the axis column 'n_pixels', so that the lines leaving the axes keep
+    their direction. on log-scaled axes, non-positive values are never
+    drawn and are assigned column '-1'.
+
+    Returns:
+    --------
+    numpy.ndarray
+        integer column of each point.
+    """
+    x = np.asarray(x, dtype = float)
+    lo, hi = lims
+    if log:
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            x = np.log(x)
+        lo, hi = np.log(lo), np.log(hi)
+    with np.errstate(invalid = 'ignore'):
+        cols = np.floor((x - lo) / (hi - lo) * n_pixels)
+    cols = np.nan_to_num(cols, nan = -1., posinf = n_pixels, neginf = -1.)
+    return np.clip(cols, -1, n_pixels).astype(np.int64)
+
+def minmax_indices (x = None, y = None, n_pixels = None, lims = None, log = False):
+    """ returns indices of the first, last, minimum and maximum point in each pixel column.
+
+    drawing these points reproduces every vertical extent drawn by the full
+    series, so the rasterized line is unchanged apart from antialiasing at
+    the edges of each pixel column.
+
+    Returns:
+    --------
+    numpy.ndarray
+        sorted indices of points kept.
+    """
+    cols = get_pixel_columns(x, n_pixels, lims, log)
+    if np.all(cols[1:] >= cols[:-1]):
+        # x-values are sorted, each pixel column is a contiguous run of points
+        starts = np.flatnonzero(np.r_[True, cols[1:] != cols[:-1]])
+        ends = np.r_[starts[1:], len(cols)] - 1
+        counts = ends - starts + 1
+        ymin = first_match(y, np.fmin.reduceat(y, starts), cols, counts)
+        ymax = first_match(y, np.fmax.reduceat(y, starts), cols, counts)
+        return np.unique(np.concatenate((starts, ends, ymin, ymax)))
+    # points ordered by pixel column, then by y-value within each column
+    order = np.lexsort((y, cols))
+    sorted_cols = cols[order]
+    starts = np.flatnonzero(np.r_[True, sorted_cols[1:] != sorted_cols[:-1]])
+    ends = np.r_[starts[1:], len(order)] - 1
+    ymin = order[starts]
+    ymax = order[ends]
+    # first and last point in each column, by index
+    order = np.argsort(cols, kind = 'stable')
+    first = order[starts]
+    last = order[ends]
+    return np.unique(np.concatenate((first, last, ymin, ymax)))
+
+def first_match (y = None, vals = None, cols = None, counts = None):
+    """ returns index of the first point in each contiguous pixel column whose y-value equals the column value in 'vals'. """
+    match = np.flatnonzero(y == np.repeat(vals, counts))
+    u, first = np.unique(cols[match], return_index = True)
+    return match[first]
+
+def lttb_indices (x = None, y = None, n_out = None, log = False, lims = None):
+    """ returns indices of points chosen by the largest triangle three buckets algorithm.
+
+    if 'lims' are given, the series is first clipped to the points within
+    the x-axis limits, plus the first point beyond each limit so that the
+    lines leaving the axes keep their direction, so every bucket is drawn.
+    the clipped series is divided into 'n_out - 2' buckets of equal length.
+    from each bucket, the point which forms the largest triangle with the
+    point chosen from the previous bucket and the mean of the next bucket
+    is kept, along with the first and last point. x-values must be sorted,
+    'decimate' uses 'minmax_indices' for unsorted series. buckets are
+    visited by a python loop, with the work in each bucket vectorized, so
+    'n_out' should stay on the order of the pixel width of the axes.
+
+    Returns:
+    --------
+    numpy.ndarray
+        sorted indices of points kept.
+    """
+    x = np.asarray(x, dtype = float)
+    y = np.asarray(y, dtype = float)
+    start = 0
+    if lims is not None and lims[0] is not None and lims[1] is not None and lims[0] < lims[1]:
+        # clip to the visible range, keeping one point beyond each limit
+        start = max(int(np.searchsorted(x, lims[0], side = 'left')) - 1, 0)
+        stop = min(int(np.searchsorted(x, lims[1], side = 'right')) + 1, len(x))
+        if stop - start <= n_out:
+            return np.arange(start, stop)
+        x = x[start:stop]
+        y = y[start:stop]
+    n = len(x)
+    if log:
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            x = np.log(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype = np.int64)
+    idx[0] = 0
+    idx[-1] = n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # mean of next bucket, or the last point
+        if b + 2 < len(edges):
+            cx = np.nanmean(x[hi:edges[b + 2]])
+            cy = np.nanmean(y[hi:edges[b + 2]])
+        else:
+            cx, cy = x[-1], y[-1]
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.nanargmax(area)) if not np.all(np.isnan(area)) else lo
+        idx[b + 1] = a
+    return np.unique(idx) + start
+
+def decimate (x = None, y = None, n_pixels = None, method = 'minmax', lims = None, log = False):
+    """ reduces series to the points which can be resolved in 'n_pixels' pixel columns.
+
+    Parameters:
+    -----------
+    x, y : numpy.ndarray
+        series drawn as a line.
+    n_pixels : int
+        number of pixel columns spanned by axes.
+    method : str (optional, default is 'minmax')
+        'minmax' keeps the first, last, minimum and maximum point in each
+        pixel column, which preserves the drawn shape exactly. 'lttb' keeps
+        a fixed number of points chosen by largest triangle three buckets,
+        which preserves the visual shape of smooth series. series whose
+        x-values are not sorted are always decimated with 'minmax'.
+    lims : (float, float) (optional)
+        x-axis limits, defaults to the range of 'x'. points outside the
+        limits are not drawn, so they are not kept by either method.
+    log : bool (optional, default is 'False')
+        if 'True', the x-axis is log-scaled and pixel columns are spaced
+        logarithmically.
+
+    Returns:
+    --------
+    (numpy.ndarray, numpy.ndarray)
+        decimated series, or the original series if it has no more points
+        than can be resolved.
+    """
+    if method not in decimate_methods:
+        print("ERROR :: decimate.decimate() :: method '{0}' not recognized, must be one of {1}.".format(method, decimate_methods))
+        return x, y
+    n = len(x)
+    if method == 'lttb' and not np.all(x[1:] >= x[:-1]):
+        # lttb buckets and clipping require sorted x-values, min-max does not
+        method = 'minmax'
+    if method == 'lttb':
+        n_out = lttb_points_per_pixel * n_pixels
+        if n <= n_out or n_out < 3:
+            return x, y
+        idx = lttb_indices(x, y, n_out, log, lims)
+    else:
+        if n <= minmax_points_per_bin * n_pixels:
+            return x, y
+        if lims is None or lims[0] is None or lims[1] is None or lims[0] == lims[1] or (log and lims[0] <= 0):
+            finite = x[np.isfinite(x) & (x > 0)] if log else x[np.isfinite(x)]
+            if len(finite) == 0:
+                return x, y
+            lims = (finite.min(), finite.max())
+            if lims[0] == lims[1]:
+                return x, y
+        idx = minmax_indices(x, y, n_pixels, lims, log)
+    return x[idx], y[idx]
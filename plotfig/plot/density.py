@@ -0,0 +1,103 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: density.py
+## PURPOSE: contains methods for drawing large scatter series as density images
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import numpy as np
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for density images
+default_density_threshold = 500000 # number of points above which scatter plots are drawn as density images
+default_density_gamma = 0.5 # exponent applied to normalized log density, brightens sparse regions
+default_density_legendloc = 'upper right' # legend location used instead of 'best' when density is drawn as a mesh
+
+
+#############
+## METHODS ##
+#############
+
+def get_bin_index (vals = None, n = None, lims = None, log = False):
+    """ returns the bin each value falls in, with 'n' bins spanning 'lims', or '-1' for values outside 'lims'. """
+    vals = np.asarray(vals, dtype = float)
+    lo, hi = lims
+    if log:
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            vals = np.log(vals)
+        lo, hi = np.log(lo), np.log(hi)
+    with np.errstate(invalid = 'ignore'):
+        idx = np.floor((vals - lo) / (hi - lo) * n)
+    # points on the upper limit are drawn in the last bin
+    idx[vals == hi] = n - 1
+    idx[~((idx >= 0) & (idx < n))] = -1
+    return idx.astype(np.int64)
+
+def bin_points (x = None, y = None, shape = None, xlims = None, ylims = None, xlog = False, ylog = False):
+    """ counts the number of points in each cell of an image grid.
+
+    Parameters:
+    -----------
+    x, y : numpy.ndarray
+        points binned.
+    shape : (int, int)
+        number of rows and columns in grid.
+    xlims, ylims : (float, float)
+        axis limits spanned by grid.
+    xlog, ylog : bool (optional, default is 'False')
+        if 'True', cells are spaced logarithmically along axis.
+
+    Returns:
+    --------
+    numpy.ndarray
+        count of points in each cell, with shape 'shape'. the first row
+        corresponds to the lower y-axis limit.
+    """
+    ny, nx = shape
+    ix = get_bin_index(x, nx, xlims, xlog)
+    iy = get_bin_index(y, ny, ylims, ylog)
+    keep = (ix >= 0) & (iy >= 0)
+    flat = iy[keep] * nx + ix[keep]
+    return np.bincount(flat, minlength = nx * ny).reshape(ny, nx)
+
+def blend_density (counts = None, colors = None, gamma = default_density_gamma):
+    """ blends grids of counts into one RGBA image.
+
+    the color of each cell is the mean of the colors of each series,
+    weighted by the number of points each series has in the cell. the
+    opacity of each cell is the log of the total number of points in the
+    cell, normalized by the densest cell, so that sparse regions remain
+    visible next to dense ones.
+
+    Parameters:
+    -----------
+    counts : List[numpy.ndarray]
+        count of points in each cell, one grid per series.
+    colors : numpy.ndarray
+        RGBA color of each series, shape (len(counts), 4).
+    gamma : float (optional, default is 'default_density_gamma')
+        exponent applied to opacity.
+
+    Returns:
+    --------
+    numpy.ndarray
+        image with shape (rows, columns, 4).
+    """
+    counts = np.asarray(counts, dtype = np.float32)
+    total = counts.sum(axis = 0)
+    colors = np.asarray(colors, dtype = np.float32)[:, :3]
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        rgb = np.tensordot(counts, colors, axes = (0, 0)) / total[..., None]
+    rgb = np.nan_to_num(rgb)
+    alpha = np.log1p(total)
+    if alpha.max() > 0:
+        alpha = (alpha / alpha.max()) ** gamma
+    return np.dstack((rgb, alpha)).astype(np.float32)
@@ -11,10 +11,14 @@ import pandas as pd
 import numpy as np
 import os # used to check path
 import itertools # used for iterating over markers
+from concurrent.futures import Future
 from matplotlib import colormaps as mcmaps
 # local
 from plot.axis import Label, Axis
-from plot.color import Scheme, Color
+from plot.store import ColumnStore, as_column_array
+from plot.ingest import read_csv_chunks, read_csv_columns, read_csv_files, get_file_label, default_chunksize
+from plot.cache import DiskCache, default_cache_bytes
+from plot.spec import FigureSpec
 
 
 ################
@@ -38,7 +42,8 @@ default_file_type = ".png"
 default_markerset = ["D", "^", "v", "<", "o", "s", "p", "*"]
 default_logscale_base = 10
 minimum_logscale_base = 0.1
-accepted_filetypes = [".png", ".tif"]
+accepted_filetypes = [".png", ".tif", ".pdf", ".svg"]
+raster_filetypes = [".png", ".tif"] # file types drawn by the Agg canvas, which can share one draw
 default_cmap = "tab10"
 # defaults used for figures used in publications
 pubdefault_dpi = 300
@@ -111,6 +116,18 @@ class Figure (object):
         assigns filename and location when saving figure.
     get_saveas:
         returns save path, including directory, filename, and filetype.
+    get_filetypes:
+        returns every file type figure is saved as.
+    get_saveas_list:
+        returns save path for every file type.
+    set_filetype_options:
+        assigns dpi and compression used when saving one file type.
+    get_filetype_options:
+        returns keyword arguments passed to 'savefig' for one file type.
+    set_saved:
+        records the time or future of each file written by the most recent save.
+    get_save_futures:
+        returns futures of the writes queued by the most recent save.
     save_data:
         saves data used for generate figure as csv in save directory.
     reset_axes:
@@ -175,11 +192,17 @@ class Figure (object):
         return string representation of subtitle lable.
     has_subtitle_label:
         determines if string has been assigned to subtitle label.
+    to_spec:
+        returns declarative description of Figure, which can be written to json or toml.
+    from_spec:
+        creates Figure described by spec.
     """
 
     """ standard initialization routine for Figure object. """
     def __init__ (self):
 
+        ## properties derived from data, pending recomputation
+        self.dirty = set()
         ## related to figure formatting, labelling
         self.set_title_label()
         self.set_subtitle_label()
@@ -192,10 +215,16 @@ class Figure (object):
         ## io
         self.set_linscale()
         self.set_dpi()
+        self.filetype_options = {}
         self.set_saveas()
+        self.set_saved()
+        self.set_cache()
 
         ## related to data and specification
         self.reset_data()
+        self.set_dtype_policy()
+        self.reset_colors()
+        self.add_format()
 
     """ output Figure object as string."""
     def __str__ (self):
@@ -276,6 +305,8 @@ class Figure (object):
         else:
             if d < minimum_dpi:
                 self.dpi = minimum_dpi
+            else:
+                self.dpi = d
 
     def get_dpi (self):
         """ returns the dpi assigned to the figure.
@@ -297,10 +328,119 @@ class Figure (object):
 
     ## GOAL :: append in multiple method calls, with differing structures
 
+    @property
+    def df (self):
+        """ pandas.DataFrame containing all data stored in Figure, or 'None'.
+
+        built from the Figure 'store' when accessed and reused until more
+        data is appended. assigning a DataFrame replaces the data in the
+        store.
+        """
+        if self.store is None:
+            return None
+        return self.store.to_df()
+
+    @df.setter
+    def df (self, df):
+        if df is None:
+            self.store = None
+        else:
+            self.store = self.new_store()
+            self.store.append({c: df[c].to_numpy() for c in df.columns})
+
+    def set_dtype_policy (self, categorical_ivals = True, float32 = False, downcast_ints = False):
+        """ assigns data types used to store data appended to Figure.
+
+        by default, ivals are stored as categorical codes so that each
+        unique ival is held in memory once. single precision storage of
+        'x', 'y' and 'c' columns halves their memory, at the cost of
+        precision. downcasting stores integer columns with the smallest
+        integer type which holds their values. if Figure already contains
+        data, it is converted to the new policy.
+
+        Arguments:
+        ----------
+        categorical_ivals : bool (optional, default is 'True')
+            if 'True', 'i' column is stored as categorical codes.
+        float32 : bool (optional, default is 'False')
+            if 'True', 'x', 'y' and 'c' columns are stored as float32.
+        downcast_ints : bool (optional, default is 'False')
+            if 'True', integer columns are downcast.
+
+        Returns:
+        --------
+        None
+        """
+        self.dtype_policy = {
+            'categorical': ['i'] if categorical_ivals else [],
+            'float32': ['x', 'y', 'c'] if float32 else [],
+            'downcast_ints': bool(downcast_ints)}
+        if self.store is not None and len(self.store) > 0:
+            # convert data already stored in Figure
+            old = self.store
+            self.store = self.new_store()
+            self.store.append({c: old.get_column(c) for c in old.get_columns()})
+            self.mark_dirty()
+
+    def set_cache (self, directory = None, max_bytes = default_cache_bytes, content_hash = False):
+        """ assigns directory used to cache columns parsed from csv files.
+
+        columns read by 'append_csv' are stored in the cache as binary
+        arrays. when the same columns are read again from an unchanged
+        file, they are memory-mapped from the cache rather than parsed.
+        the least recently used entries are removed once the cache grows
+        beyond 'max_bytes'. if 'directory' is 'None', caching is disabled.
+
+        Arguments:
+        ----------
+        directory : str (optional)
+            path to cache directory, created if it does not exist.
+        max_bytes : int (optional, default is 'default_cache_bytes')
+            maximum size of cache directory.
+        content_hash : bool (optional, default is 'False')
+            if 'True', files are identified by a hash of their contents,
+            rather than their path, size and modification time.
+
+        Returns:
+        --------
+        None
+        """
+        if directory is None:
+            self.cache = None
+        else:
+            self.cache = DiskCache(directory, max_bytes = max_bytes)
+        self.cache_content_hash = bool(content_hash)
+
+    def get_cache (self):
+        """ returns DiskCache used to store parsed csv columns, or 'None' if disabled. """
+        return self.cache
+
+    def new_store (self):
+        """ returns empty ColumnStore using the Figure dtype policy. """
+        store = ColumnStore()
+        store.set_dtype_policy(**self.dtype_policy)
+        return store
+
+    def get_columns (self):
+        """ returns list of column headers for data stored in Figure.
+
+        Arguments:
+        ----------
+        None
+
+        Returns:
+        --------
+        List[str]
+            column headers, empty if no data has been appended.
+        """
+        if self.store is None:
+            return []
+        return self.store.get_columns()
+
     # method used to initialize data stored withing figure object
     """ initializes data stored withing figure object. dataframe is removed, x, y, c, and i columns are reset. """
     def reset_data (self):
-        self.df = None
+        self.store = None
         self.xcol = None
         self.ycol = None
         self.ccol = None
@@ -308,6 +448,70 @@ class Figure (object):
         self.icol_marker_dict = None
         self.icol_label_dict = None
         self.icol_color_dict = None
+        self.label_dict = {}
+        self.marker_dict = {}
+        self.markerset = default_markerset
+        # files data was read from, described by 'to_spec'
+        self.sources = []
+        # properties derived from the data which must be recomputed
+        self.dirty = set()
+
+    def mark_dirty (self):
+        """ flags properties derived from the data for recomputation.
+
+        axis limits, markers, labels and colors are not recomputed when
+        data is appended. instead they are recomputed once, the next time
+        they are read or modified.
+
+        Arguments:
+        ----------
+        None
+
+        Returns:
+        --------
+        None
+        """
+        self.dirty.update(['xlimits', 'ylimits', 'markers', 'labels', 'colors'])
+        # limits are recomputed from the data, replacing those assigned by the user
+        self.user_limits.difference_update(['x', 'y'])
+
+    def is_dirty (self, prop = None):
+        """ determines if derived property must be recomputed.
+
+        Arguments:
+        ----------
+        prop : str (optional)
+            one of 'xlimits', 'ylimits', 'markers', 'labels', 'colors'.
+            if unspecified, checks all properties.
+
+        Returns:
+        --------
+        bool
+            'True' if property has been flagged for recomputation, else 'False'.
+        """
+        if prop is None:
+            return bool(self.dirty)
+        return prop in self.dirty
+
+    def refresh (self):
+        """ recomputes all derived properties which have been flagged.
+
+        called by generators before rendering, so that derived properties
+        are computed once, after all data has been appended.
+
+        Arguments:
+        ----------
+        None
+
+        Returns:
+        --------
+        None
+        """
+        self.refresh_axis_limits('x')
+        self.refresh_axis_limits('y')
+        self.refresh_markers()
+        self.refresh_labels()
+        self.refresh_colors()
 
     def set_saveas(self, savedir = default_file_location, filename = default_file_name, filetype = default_file_type):
         """ assigns filename and location when saving figure.
@@ -318,8 +522,9 @@ class Figure (object):
             path to save directory.
         filename : str
             name of file without extension.
-        filetype : str
-            must be within 'accepted_filetypes'.
+        filetype : str or List[str]
+            must be within 'accepted_filetypes'. if a list is passed, the
+            figure is drawn once and saved as each file type.
 
         Returns:
         --------
@@ -341,26 +546,129 @@ class Figure (object):
             self.filename = filename
 
         # check the filetype passed to the method
-        if filetype not in accepted_filetypes:
-            self.filetype = default_file_type
-        else:
-            self.filetype = filetype
-
-    def get_saveas(self):
+        filetypes = [filetype] if isinstance(filetype, str) or filetype is None else list(filetype)
+        for t in filetypes:
+            if t not in accepted_filetypes:
+                print("ERROR :: Figure.set_saveas() :: filetype '{0}' not in 'accepted_filetypes' {1}.".format(t, accepted_filetypes))
+        self.filetypes = list(dict.fromkeys(t for t in filetypes if t in accepted_filetypes))
+        if len(self.filetypes) == 0:
+            self.filetypes = [default_file_type]
+        self.filetype = self.filetypes[0]
+
+    def get_saveas(self, filetype = None):
         """ returns save path, including directory, filename, and filetype.
 
         Arguments:
         ----------
-        None
+        filetype : str (optional)
+            file type of path, defaults to the first file type assigned.
 
         Returns:
         --------
         str
             complete path to save file.
         """
-        saveas = self.savedir + self.filename + self.filetype
+        if filetype is None:
+            filetype = self.filetype
+        saveas = self.savedir + self.filename + filetype
         return saveas
 
+    def get_filetypes (self):
+        """ returns list of every file type figure is saved as, in the order they were assigned. """
+        return list(self.filetypes)
+
+    def get_saveas_list (self):
+        """ returns list of save paths, one for each file type figure is saved as. """
+        return [self.get_saveas(t) for t in self.filetypes]
+
+    def set_saved (self, saved = None):
+        """ records the result of the most recent save, see 'render.save_figure'.
+
+        Arguments:
+        ----------
+        saved : Dict[float or concurrent.futures.Future] (optional)
+            maps each path saved to the time taken to save it, or to the
+            future of its write if it was queued by a 'writer.SaveQueue'.
+
+        Returns:
+        --------
+        None
+        """
+        self.saved = {} if saved is None else dict(saved)
+
+    def get_saved (self):
+        """ returns dictionary mapping each path written by the most recent save to its time or future. """
+        return dict(self.saved)
+
+    def get_save_futures (self):
+        """ returns futures of the writes queued by the most recent save, empty if every file was written immediately.
+
+        calling 'result' on a future waits for the write to finish, and
+        raises any exception raised while writing the file.
+        """
+        return [v for v in self.saved.values() if isinstance(v, Future)]
+
+    def __getstate__ (self):
+        # futures of queued writes cannot be pickled, e.g. when sent to batch worker processes
+        state = self.__dict__.copy()
+        state['saved'] = {p: v for p, v in self.saved.items() if not isinstance(v, Future)}
+        return state
+
+    def set_filetype_options (self, filetype = None, dpi = None, compression = None):
+        """ assigns options used when saving one file type.
+
+        Arguments:
+        ----------
+        filetype : str
+            must be within 'accepted_filetypes'.
+        dpi : int (optional)
+            dpi used for file type, defaults to the dpi of the figure.
+        compression : int or str (optional)
+            for '.png', zlib compression level between 0 and 9. for '.tif',
+            name of compression scheme used by pillow, e.g. 'tiff_lzw'.
+            not supported by other file types.
+
+        Returns:
+        --------
+        None
+        """
+        if filetype not in accepted_filetypes:
+            print("ERROR :: Figure.set_filetype_options() :: filetype '{0}' not in 'accepted_filetypes' {1}.".format(filetype, accepted_filetypes))
+            return
+        options = {}
+        if dpi is not None:
+            if not isinstance(dpi, int) or dpi < minimum_dpi:
+                print("ERROR :: Figure.set_filetype_options() :: dpi must be an integer greater than {0}. Using figure dpi.".format(minimum_dpi))
+            else:
+                options['dpi'] = dpi
+        if compression is not None:
+            if filetype == ".png":
+                options['pil_kwargs'] = {'compress_level': int(compression)}
+            elif filetype == ".tif":
+                options['pil_kwargs'] = {'compression': compression}
+            else:
+                print("ERROR :: Figure.set_filetype_options() :: compression is not supported for filetype '{0}'.".format(filetype))
+        self.filetype_options[filetype] = options
+
+    def get_filetype_options (self, filetype = None):
+        """ returns keyword arguments passed to 'savefig' when saving file type.
+
+        Arguments:
+        ----------
+        filetype : str (optional)
+            file type, defaults to the first file type assigned.
+
+        Returns:
+        --------
+        Dict
+            contains 'dpi', and 'pil_kwargs' if compression was assigned.
+        """
+        if filetype is None:
+            filetype = self.filetype
+        options = {'dpi': self.get_dpi()}
+        options.update(self.filetype_options.get(filetype, {}))
+        return options
+
     def save_data(self):
         """ saves data used for generate figure as csv in save directory.
 
@@ -392,21 +700,65 @@ class Figure (object):
             values from 'col' which additionally can match values in 'icol'.
         """
         # check that col exists in the axis dictionary
-        if (col not in list(self.df.columns.values)):
+        if (col not in self.get_columns()):
             print("ERROR :: Figure.get_col_val_list() :: col '{0}' does not exist in figure DataFrame.".format(col))
             return []
         # return the requested data to the user
+        vals = self.store.get_column(col)
         if (icol is not None) and (ival is not None):
             # check that icol exists in the axis dictionary
-            if icol not in list(self.df.columns.values):
+            if icol not in self.get_columns():
                 print("ERROR :: Figure.get_col_val_list() :: icol '{0}' does not exist in figure DataFrame.".format(icol))
                 return []
             # get the isolated values
-            tempdf = self.df[self.df[icol] == ival]
-            return tempdf[col].to_list()
+            return self.store.get_group(col, icol, ival).tolist()
         else:
             # return the entire list
-            return self.df[col].to_list()
+            return vals.tolist()
+
+    def get_col_val_array (self, col = None, icol = None, ival = None):
+        """ returns array of values from column, which can additionally match secondary column.
+
+        unlike 'get_col_val_list', values are not copied into a list. the
+        array returned is a read-only view of the data stored in Figure.
+
+        Arguments:
+        ----------
+        col : str
+            corresponds to column header in Figure 'df'.
+        icol : str
+            secondary column in Figure 'df' which contains matching criteria.
+        ival : str
+            value in 'icol' which exists.
+
+        Returns:
+        --------
+        numpy.ndarray
+            values from 'col' which additionally can match values in 'icol'.
+        """
+        # check that col exists in the axis dictionary
+        if (col not in self.get_columns()):
+            print("ERROR :: Figure.get_col_val_array() :: col '{0}' does not exist in figure DataFrame.".format(col))
+            return np.empty(0)
+        # return the requested data to the user
+        if (icol is not None) and (ival is not None):
+            # check that icol exists in the axis dictionary
+            if icol not in self.get_columns():
+                print("ERROR :: Figure.get_col_val_array() :: icol '{0}' does not exist in figure DataFrame.".format(icol))
+                return np.empty(0)
+            # get the isolated values
+            return self.store.get_group(col, icol, ival)
+        else:
+            # return the entire array
+            return self.store.get_column(col)
+
+    def get_xval_array (self, ival = None):
+        """ returns read-only array of x-axis values, which can match 'ival'. """
+        return self.get_col_val_array(col = 'x', icol = 'i', ival = ival)
+
+    def get_yval_array (self, ival = None):
+        """ returns read-only array of y-axis values, which can match 'ival'. """
+        return self.get_col_val_array(col = 'y', icol = 'i', ival = ival)
 
     def append_lists_from_dict (self, list_dict = None):
         """ append data stored in dictionary to Figure object.
@@ -438,14 +790,14 @@ class Figure (object):
             'True' if operation was successful, else 'False'.
         """
         # check if 'df' has been initialized
-        if self.df is not None:
+        if self.store is not None:
             # check 'list_dict' keys
             for c in list(list_dict.keys()):
-                if c not in list(self.df.columns.values):
+                if c not in self.get_columns():
                     print("ERROR :: Figure.append_lists_from_dict() :: key '{0}' in list_dict not found in Figure 'df' columns.".format(c))
                     return False
             # check 'df' columns again 'list_dict' keys
-            for c in list(self.df.columns.values):
+            for c in self.get_columns():
                 if c not in list(list_dict.keys()):
                     print("ERROR :: Figure.append_lists_from_dict() :: Figure 'df' column {0} not found in 'list_dict'.".format(c))
                     return False
@@ -471,31 +823,93 @@ class Figure (object):
             elif len(list_dict[c]) == 1 and (list_len > 1):
                 list_dict[c] = [list_dict[c][0] for i in range(list_len)]
         # add data to df
-        if self.df is None:
-            # initialize 'df' with list_dict
-            self.df = pd.DataFrame.from_dict(list_dict)
+        return self.append_arrays(list_dict)
+
+
+    def checkpoint_data (self):
+        """ returns state of Figure data, which 'rollback_data' restores.
+
+        Arguments:
+        ----------
+        None
+
+        Returns:
+        --------
+        Dict
+            state of the data store, columns, axes, flagged properties and
+            limits assigned by the user.
+        """
+        return {'store': self.store.checkpoint() if self.store is not None else None,
+            'cols': (self.xcol, self.ycol, self.ccol, self.icol),
+            'axes': list(self.dict_axes.keys()),
+            'dirty': set(self.dirty),
+            'user_limits': set(self.user_limits)}
+
+    def rollback_data (self, state = None):
+        """ removes data appended since 'checkpoint_data' was called.
+
+        Arguments:
+        ----------
+        state : Dict
+            state returned by 'checkpoint_data'.
+
+        Returns:
+        --------
+        None
+        """
+        if state['store'] is None:
+            self.store = None
+        elif self.store is not None:
+            self.store.rollback(state['store'])
+        self.xcol, self.ycol, self.ccol, self.icol = state['cols']
+        for akey in list(self.dict_axes.keys()):
+            if akey not in state['axes']:
+                del self.dict_axes[akey]
+        # properties derived from the data are valid again for the restored rows
+        self.dirty = state['dirty']
+        self.user_limits = state['user_limits']
+
+    def append_arrays (self, col_dict = None):
+        """ copies equal-length arrays into the Figure data store.
+
+        no broadcasting is performed. used by each of the append methods
+        once data has been validated and each column has the same length.
+
+        Parameters:
+        -----------
+        col_dict : Dict[numpy.ndarray]
+            maps column headers to arrays with the same length.
+
+        Returns:
+        --------
+        bool
+            'True' if operation was successful, else 'False'.
+        """
+        if self.store is None:
+            # initialize the store with col_dict
+            self.store = self.new_store()
+            if not self.store.append(col_dict):
+                self.store = None
+                return False
             # initialize axes
-            for c in list(list_dict.keys()):
+            for c in list(col_dict.keys()):
                 self.dict_axes[c] = Axis()
         else:
             # the length of all lists are equal
-            # 'list_dict' keys match all columns exactly
-            # concatenate 'list_dict' to existing df
-            self.df = pd.concat([self.df, pd.DataFrame.from_dict(list_dict)], ignore_index = True)
-        ## TODO update axis limits, ... 
-        if 'x' in list(self.df.columns.values):
+            # 'col_dict' keys match all columns exactly
+            # copy 'col_dict' into the store buffers
+            if not self.store.append(col_dict):
+                return False
+        if 'x' in self.get_columns():
             self.xcol = 'x'
-        if 'y' in list(self.df.columns.values):
+        if 'y' in self.get_columns():
             self.ycol = 'y'
-        if 'c' in list(self.df.columns.values):
+        if 'c' in self.get_columns():
             self.ccol = 'c'
-        if 'i' in list(self.df.columns.values):
+        if 'i' in self.get_columns():
             self.icol = 'i'
-        self.set_xaxis_limits(padval = default_padding_value)
-        self.set_yaxis_limits(padval = default_padding_value)
-        self.reset_markers()
-        self.reset_labels()
-        self.reset_colors()
+        # axis limits, markers, labels and colors are recomputed when next used
+        self.mark_dirty()
         return True
 
     def append_lists (self, xlist = None, ylist = None, clist = None, ilist = None, label = None):
@@ -538,6 +952,85 @@ class Figure (object):
             list_dict.update({'i': label})
         self.append_lists_from_dict(list_dict )
     
+    def append_series (self, series = None):
+        """ append many data series to Figure in a single operation.
+
+        each series is validated and broadcast once, then all series are
+        concatenated and copied into the Figure data store together, rather
+        than one 'append_lists' call per series.
+
+        'series' can either be an iterable or a dictionary. each item in the
+        iterable is a tuple '(xlist, ylist, label)' or '(xlist, ylist, clist,
+        label)', or a dictionary with keys 'x', 'y', 'c' and 'label' (or 'i').
+        if 'series' is a dictionary, each key is a label which points to a
+        tuple '(xlist, ylist)' / '(xlist, ylist, clist)' or a dictionary
+        with keys 'x', 'y', and 'c'. single values in any series are
+        broadcast to match the length of the other lists in the series.
+        every series must contain the same columns, which must match those
+        already existing in 'df'.
+
+        Parameters:
+        -----------
+        series : Iterable or Dict
+            data series to append to Figure.
+
+        Returns:
+        --------
+        bool
+            'True' if operation was successful, else 'False'.
+        """
+        if series is None:
+            print("ERROR :: Figure.append_series() :: 'series' must be provided as argument to method.")
+            return False
+        # convert each series to a dictionary mapping columns to values
+        if isinstance(series, dict):
+            items = []
+            for label, s in series.items():
+                d = dict(s) if isinstance(s, dict) else dict(zip(['x', 'y', 'c'], s))
+                d.update({'i': label})
+                items.append(d)
+        else:
+            items = []
+            for s in series:
+                if isinstance(s, dict):
+                    d = dict(s)
+                    if 'label' in d:
+                        d.update({'i': d.pop('label')})
+                else:
+                    keys = ['x', 'y', 'i'] if len(s) == 3 else ['x', 'y', 'c', 'i']
+                    d = dict(zip(keys, s))
+                items.append(d)
+        if len(items) == 0:
+            return True
+        # check that every series has the same columns as the Figure
+        cols = self.get_columns() if self.store is not None else list(items[0].keys())
+        for d in items:
+            if set(d.keys()) != set(cols):
+                print("ERROR :: Figure.append_series() :: series columns {0} do not match Figure 'df' columns {1}.".format(sorted(d.keys()), sorted(cols)))
+                return False
+        # determine the length of each series
+        lengths = np.empty(len(items), dtype = int)
+        for k, d in enumerate(items):
+            n = 1
+            for c in cols:
+                if np.ndim(d[c]) == 0: continue
+                m = len(d[c])
+                if m == 1 or m == n: continue
+                if n != 1:
+                    print("ERROR :: Figure.append_series() :: lists in series {0} are uneven.".format(k))
+                    return False
+                n = m
+            lengths[k] = n
+        # concatenate each column across all series, broadcasting single values
+        col_dict = {}
+        for c in cols:
+            if all(np.ndim(d[c]) == 0 for d in items):
+                # one value per series, e.g. labels
+                col_dict[c] = np.repeat(as_column_array([d[c] for d in items]), lengths)
+            else:
+                col_dict[c] = np.concatenate([np.broadcast_to(as_column_array(d[c], n), (n,)) for d, n in zip(items, lengths)])
+        return self.append_arrays(col_dict)
+
     def append_df_from_dict (self, df = None, df_dict = None, label = None):
         """ use dictionary to import DataFrame columns to specific Figure axes.
 
@@ -559,26 +1052,28 @@ class Figure (object):
         if df is None:
             print("ERROR :: Figure.append_df_from_dict() :: 'df' must be provided as argument to method.")
             return False
-        # if the Figure already has a data frame
-        if self.df is not None:
-            # check that keys corresponds to column header in Figure 'df'
+        # check that the key values correspond to headers in argument 'df'
+        for k in list(df_dict.keys()):
+            if df_dict[k] not in df.columns:
+                print("ERROR :: Figure.append_df_from_dict() :: 'df_dict' key '{0}' value '{1}'' not found in argument 'df' header.".format(k, df_dict[k]))
+                return False
+        # if the Figure already has data, check that keys correspond to column headers in Figure store
+        if self.store is not None:
             for k in list(df_dict.keys()):
-                if k not in list(self.df.columns.values):
+                if k not in self.get_columns():
                     print("ERROR :: Figure.append_df_from_dict() :: 'df_dict' key '{0}' not found in Figure 'df' column headers.".format(k))
                     return False
-            # check that the key values correspond to headers in argument 'df'
-            for k in list(df_dict.keys()):
-                if df_dict[k] not in list(df.columns.values):
-                    print("ERROR :: Figure.append_df_from_dict() :: 'df_dict' key '{0}' value '{1}'' not found in argument 'df' header.".format(k, df_dict[k]))
-                    return False 
-        # initialize list_dict, import all columns from df
-        list_dict = {}
+        # columns are passed to the store as arrays, without building the Figure 'df'
+        col_dict = {}
         for k in list(df_dict.keys()):
-            list_dict.update({k: df[k].to_list()})
-        if label is not None and 'i' not in list(list_dict.keys()):
-            list_dict.update({'i': label})
-        # import list_dict to Figure 'df'
-        return self.append_lists_from_dict(list_dict)
+            col_dict.update({k: df[df_dict[k]].to_numpy()})
+        if label is not None and 'i' not in list(col_dict.keys()):
+            col_dict.update({'i': as_column_array(label, len(df))})
+        if self.store is not None and set(col_dict.keys()) != set(self.get_columns()):
+            print("ERROR :: Figure.append_df_from_dict() :: columns {0} do not match Figure 'df' columns {1}.".format(sorted(col_dict.keys()), sorted(self.get_columns())))
+            return False
+        # import columns to Figure store
+        return self.append_arrays(col_dict)
 
     def append_df (self, df = None, xcol = None, ycol = None, ccol = None, icol = None, label = None):
         """ import df columns to Figure.
@@ -620,9 +1115,17 @@ class Figure (object):
         # pass the df_dict method
         return self.append_df_from_dict(df, df_dict, label)
 
-    def append_csv_from_dict (self, filename = None, csv_dict = None, label = None):
+    def append_csv_from_dict (self, filename = None, csv_dict = None, label = None, dtype = None, chunksize = default_chunksize, cache = True):
         """ use dictionary to import specific columns from csv file.
 
+        only the columns in 'csv_dict' are parsed, and the file is read in
+        chunks of at most 'chunksize' rows which are copied into the Figure
+        one at a time, so memory used while reading large files is bounded.
+        if a chunk cannot be parsed, rows appended from earlier chunks are
+        removed, so the Figure is left unchanged. if a cache is assigned
+        with 'set_cache', columns are instead read from the cache, or
+        parsed in full and stored in the cache.
+
         Parameters:
         -----------
         filename : str
@@ -631,6 +1134,12 @@ class Figure (object):
             maps csv columns to axes in Figure.
         label : str
             label entire dataset, corresponds to 'i' column
+        dtype : Dict (optional)
+            maps axes to data type used to parse corresponding csv column.
+        chunksize : int (optional, default is 'default_chunksize')
+            maximum number of rows read from file at once.
+        cache : bool (optional, default is 'True')
+            if 'False', the Figure cache is not used for this file.
         
         Returns:
         --------
@@ -644,12 +1153,41 @@ class Figure (object):
         elif not os.path.exists(filename):
             print("ERROR :: Figure.append_csv_from_dict() :: Unable to find csv file '{0}'.".format(filename))
             return False
-        # open the file as a dataframe
-        df = pd.DataFrame.read_csv(filename)
-        # create list dict and import each column
-        return self.append_df_from_dict(df, df_dict, label)
+        # check that the columns match those already in the Figure
+        keys = list(csv_dict.keys())
+        if label is not None and 'i' not in keys:
+            keys.append('i')
+        if self.store is not None and set(keys) != set(self.get_columns()):
+            print("ERROR :: Figure.append_csv_from_dict() :: 'csv_dict' keys {0} do not match Figure 'df' columns {1}.".format(sorted(keys), self.get_columns()))
+            return False
+        if cache and self.cache is not None:
+            # read the mapped columns from the cache, or parse and store them
+            col_dict = read_csv_columns(filename, csv_dict, dtype = dtype, cache = self.cache, content_hash = self.cache_content_hash)
+            chunks = None if col_dict is None else [col_dict]
+        else:
+            # open the file, read the mapped columns one chunk at a time
+            chunks = read_csv_chunks(filename, csv_dict, dtype = dtype, chunksize = chunksize)
+        if chunks is None:
+            return False
+        n = len(self.store) if self.store is not None else 0
+        # rows appended from earlier chunks are removed if a later chunk cannot be read or appended
+        state = self.checkpoint_data()
+        try:
+            for col_dict in chunks:
+                if label is not None and 'i' not in csv_dict:
+                    col_dict.update({'i': as_column_array(label, len(next(iter(col_dict.values()))))})
+                if not self.append_arrays(col_dict):
+                    self.rollback_data(state)
+                    return False
+        except (OSError, ValueError) as e:
+            # malformed row, or value which cannot be parsed as the requested data type
+            print("ERROR :: Figure.append_csv_from_dict() :: unable to read csv file '{0}' :: {1}".format(filename, e))
+            self.rollback_data(state)
+            return False
+        self.sources.append({'file': filename, 'columns': dict(csv_dict), 'label': label, 'dtype': dtype, 'rows': len(self.store) - n})
+        return True
 
-    def append_csv (self, filename = None, xcol = None, ycol = None, ccol = None, icol = None, label = None):
+    def append_csv (self, filename = None, xcol = None, ycol = None, ccol = None, icol = None, label = None, dtype = None, chunksize = default_chunksize, cache = True):
         """ append columns in csv file to Figure DataFramee 'df'.
 
         Parameters:
@@ -666,22 +1204,105 @@ class Figure (object):
             header or column number containing i-axis data.
         label : str or int (optional)
             label dataset, replaces i-axis.
+        dtype : Dict (optional)
+            maps axes to data type used to parse corresponding csv column.
+        chunksize : int (optional, default is 'default_chunksize')
+            maximum number of rows read from file at once.
+        cache : bool (optional, default is 'True')
+            if 'False', the Figure cache is not used for this file.
 
         Returns:
         --------
         bool
             'True' if successful, else 'False'.
         """
-        if filename is None:
-            print("ERROR :: Figure.append_csv_from_dict() :: must specify argument 'filename' with path to csv file.")
+        # create dictionary mapping axes to csv columns
+        csv_dict = {}
+        if xcol is not None:
+            csv_dict.update({'x': xcol})
+        if ycol is not None:
+            csv_dict.update({'y': ycol})
+        if ccol is not None:
+            csv_dict.update({'c': ccol})
+        if icol is not None:
+            csv_dict.update({'i': icol})
+        # pass to append csv method
+        return self.append_csv_from_dict(filename, csv_dict, label = label, dtype = dtype, chunksize = chunksize, cache = cache)
+
+    def append_csv_files (self, files = None, xcol = None, ycol = None, ccol = None, icol = None, label = None, dtype = None, workers = None, processes = False, cache = True):
+        """ append the same columns from many csv files to Figure.
+
+        files are parsed concurrently (see 'ingest.read_csv_files'), then
+        the columns from every file are concatenated and copied into the
+        Figure in one step.
+
+        Parameters:
+        -----------
+        files : str or List[str]
+            glob pattern, or list of paths to csv files.
+        xcol : str or int
+            header or column number containing x-axis data.
+        ycol : str or int
+            header or column number containing y-axis data.
+        ccol : str or int
+            header or column number containing c-axis data.
+        icol : str or int
+            header or column number containing i-axis data.
+        label : str, callable (optional)
+            rule for labelling data from each file, replaces i-axis. either
+            'stem' or 'name' to label by filename, a method which is passed
+            each path and returns the label, or a constant label.
+        dtype : Dict (optional)
+            maps axes to data type used to parse corresponding csv column.
+        workers : int (optional)
+            number of threads or processes used to parse files.
+        processes : bool (optional, default is 'False')
+            if 'True', files are parsed in a process pool, rather than threads.
+        cache : bool (optional, default is 'True')
+            if 'False', the Figure cache is not used for these files.
+
+        Returns:
+        --------
+        bool
+            'True' if successful, else 'False'.
+        """
+        # create dictionary mapping axes to csv columns
+        csv_dict = {}
+        if xcol is not None:
+            csv_dict.update({'x': xcol})
+        if ycol is not None:
+            csv_dict.update({'y': ycol})
+        if ccol is not None:
+            csv_dict.update({'c': ccol})
+        if icol is not None:
+            csv_dict.update({'i': icol})
+        # check that the columns match those already in the Figure
+        keys = list(csv_dict.keys())
+        if label is not None and 'i' not in keys:
+            keys.append('i')
+        if self.store is not None and set(keys) != set(self.get_columns()):
+            print("ERROR :: Figure.append_csv_files() :: columns {0} do not match Figure 'df' columns {1}.".format(sorted(keys), self.get_columns()))
             return False
-        elif not os.path.exists(filename):
-            print("ERROR :: Figure.append_csv_from_dict() :: Unable to find csv file '{0}'.".format(filename))
+        # parse files
+        results = read_csv_files(files, csv_dict, dtype = dtype, workers = workers, processes = processes,
+            cache = self.cache if cache else None, content_hash = self.cache_content_hash)
+        if len(results) == 0:
+            print("ERROR :: Figure.append_csv_files() :: no csv files found matching '{0}'.".format(files))
+            return False
+        for filename, cols in results:
+            if cols is None:
+                print("ERROR :: Figure.append_csv_files() :: unable to read csv file '{0}'.".format(filename))
+                return False
+        # merge columns from every file
+        col_dict = {k: np.concatenate([cols[k] for filename, cols in results]) for k in csv_dict}
+        if label is not None and 'i' not in csv_dict:
+            lengths = [len(cols[keys[0]]) for filename, cols in results]
+            labels = as_column_array([get_file_label(filename, label) for filename, cols in results])
+            col_dict.update({'i': np.repeat(labels, lengths)})
+        if not self.append_arrays(col_dict):
             return False
-        # load df from csv file
-        df = pd.DataFrame.read_csv(filename)
-        # pass to append df method
-        return self.append_df(df = df, xcol = xcol, yxcol = yxcol, ccol = ccol, icol = icol, label = label)
+        self.sources.append({'files': files if isinstance(files, str) else list(files), 'columns': csv_dict, 'label': label, 'dtype': dtype, 'rows': len(col_dict[keys[0]])})
+        return True
 
     # initialize list of labels that correspons to each unique ival in icol
     """ method initializes labels used to describe each unique ival in plots as that ival stored within that Figure dataframe. """
@@ -692,16 +1313,29 @@ class Figure (object):
             self.label_dict.update({i: i}) # assign random marker to each ival
         # empty format string
         self.format_string = None
+        self.dirty.discard('labels')
+
+    # adds labels for ivals appended since labels were last computed
+    """ method assigns default label to each ival without one. labels which have already been assigned are kept. """
+    def refresh_labels(self):
+        if 'labels' not in self.dirty:
+            return
+        self.dirty.discard('labels')
+        for i in self.get_unique_ivals():
+            if i not in self.label_dict:
+                self.label_dict.update({i: i})
 
     # adjusts one label in label dictionary
     """ method changes one label in label dictionary to new string (not Label class). the label that is changed is the one that correspons to the ival used as a key in the label dictionary. """
     def set_label (self, ival = None, label = None):
+        self.refresh_labels()
         if ival in self.label_dict:
             self.label_dict[ival] = label
 
     # returns one label in label dictionary
     """ method returns label that corresponds to ival in label dictionary. """
     def get_label (self, ival = None):
+        self.refresh_labels()
         if self.format_string is None:
             # if the format string is empty, return the label
             return self.label_dict[ival]
@@ -724,7 +1358,7 @@ class Figure (object):
     def get_unique_ivals (self, rev = False):
         if self.icol is not None:
             # if an icol has been specified return all unique items
-            l = self.df[self.icol].unique()
+            l = self.store.get_group_index(self.icol).get_uniques()
             if rev:
                 return list(np.flip(l))
             else:
@@ -760,14 +1394,29 @@ class Figure (object):
                         break
 
         # create empty dictionary
-        marks = itertools.cycle(markerset)
+        self.markerset = markerset
         self.marker_dict = {} # empty dictionary
+        self.dirty.add('markers')
+        self.refresh_markers()
+
+    # adds markers for ivals appended since markers were last computed
+    """ method assigns marker from the marker set to each ival without one. markers which have already been assigned are kept. """
+    def refresh_markers(self):
+        if 'markers' not in self.dirty:
+            return
+        self.dirty.discard('markers')
+        # cycle through the marker set in the same order as the ivals,
+        # so ivals without markers are assigned the same one as a reset
+        marks = itertools.cycle(self.markerset)
         for i in self.get_unique_ivals():
-            self.marker_dict.update({i: next(marks)}) # assign random marker to each ival
+            m = next(marks)
+            if i not in self.marker_dict:
+                self.marker_dict.update({i: m}) # assign random marker to each ival
 
     # adjusts one marker in marker dictionary
     """ method changes one marker in the marker dictionary to a new marker type. the marker that is changed is the one that corresponds to the ival used as a key in the marker dictionary. """
     def set_marker(self, ival = None, marker = None):
+        self.refresh_markers()
         if ival in self.marker_dict:
             self.marker_dict[ival] = marker
 
@@ -777,6 +1426,7 @@ class Figure (object):
         if ival is None:
             return default_markerset[0]
         else:
+            self.refresh_markers()
             return self.marker_dict[ival]
 
     ## COLORS ## 
@@ -833,6 +1483,7 @@ class Figure (object):
 
     def update_colors (self):
         
+        self.dirty.discard('colors')
         if not self.has_cmap():
             # if a color map has not been assigned, skip this routine
             return
@@ -843,21 +1494,22 @@ class Figure (object):
 
         # loop through each ival, assign a color
         self.color_dict = {} # empty dictionary
+        ivals = self.get_unique_ivals()
         if self.cmap in default_matplotlib_cmaps:
             if self.cmap in discrete_matplotlib_cmaps:
                 # the color map is discrete
                 # the colors are sequentially spaced
                 colormap = mcmaps[self.cmap]
                 self.color_dict = {}
-                for i in range(len(self.get_unique_ivals())):
-                    self.color_dict.update({self.get_unique_ivals()[i]: colormap(i)})
+                for i in range(len(ivals)):
+                    self.color_dict.update({ivals[i]: colormap(i)})
             else:
                 # the color map is continuous
                 # the colors are linearly spaced
                 colormap = mcmaps[self.cmap]
-                cmap_ivals = np.linspace(0.,1.,len(self.get_unique_ivals()), endpoint = True)
-                for i in range(len(self.get_unique_ivals())):
-                    self.color_dict.update({self.get_unique_ivals()[i]: colormap(cmap_ivals[i])})
+                cmap_ivals = np.linspace(0.,1.,len(ivals), endpoint = True)
+                for i in range(len(ivals)):
+                    self.color_dict.update({ivals[i]: colormap(cmap_ivals[i])})
         else:
             # if the colormap is not defined in matplotlib, cannot parse colors
             print("ERROR :: Figure.update_colors() :: Unable to parse colors from colormap of type '{0}'.".format(type(self.cmap)))
@@ -865,6 +1517,23 @@ class Figure (object):
         # print(self.color_dict)
         # self.color_dict = None
 
+    def refresh_colors (self):
+        """ recomputes colors if data has been appended since colors were last computed.
+
+        colors assigned from a continuous color map depend on the number of
+        ivals, so the entire color dictionary is recomputed.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        None
+        """
+        if 'colors' in self.dirty:
+            self.update_colors()
+
     def add_color (self):
         pass
 
@@ -872,6 +1541,7 @@ class Figure (object):
 
         if not self.has_cmap():
             return None
+        self.refresh_colors()
 
         if ival is None:
             # if ival is not specified, return the first color in the color map
@@ -908,6 +1578,8 @@ class Figure (object):
         self.dict_axes = {}
         # TODO :: only initialize axis when data is added
         self.dict_axes.update({'y': Axis(), 'x': Axis()})
+        # keys of axes whose limits were assigned by the user, rather than computed from data
+        self.user_limits = set()
         # from previous implementation, depricate
         self.reset_xaxis()
         self.reset_yaxis()
@@ -1027,6 +1699,8 @@ class Figure (object):
         """
         # check that the key exists in the dictionary
         if not self.has_axis(akey): return
+        # limits assigned here replace any which are pending recomputation
+        self.dirty.discard(akey + 'limits')
         # determine the data column corresponding to the axis
         if akey == 'x':
             col = self.xcol
@@ -1040,18 +1714,41 @@ class Figure (object):
             return
         # check the data type corresponding to the column
         # cannot set minimum or maximum for non-numerical formats
-        if (self.df[col].dtype != float) and (self.df[col].dtype != int):
-            print("ERROR :: Figure.set_axis_limits() :: cannot set limits to axis '{0}' for dtype '{1}'".format(akey, self.df[col].dtype))
+        dtype = self.store.get_column(col).dtype
+        if dtype.kind not in ('i', 'u', 'f'):
+            print("ERROR :: Figure.set_axis_limits() :: cannot set limits to axis '{0}' for dtype '{1}'".format(akey, dtype))
             return
-        # if the minimum or maximum values are unassigned, get them from the dataframe
+        if min_val is not None or max_val is not None:
+            self.user_limits.add(akey)
+        # if the minimum or maximum values are unassigned, get them from the
+        # running statistics kept by the store
         if min_val is None:
-            min_val = min(self.df[col].to_list())
+            min_val = self.store.get_stats(col).get_minimum()
         if max_val is None:
-            max_val = max(self.df[col].to_list())
+            max_val = self.store.get_stats(col).get_maximum()
         # assign minimum and maximum values to the axis, pad limits
         self.dict_axes[akey].set_limits(min_val, max_val)
         self.dict_axes[akey].pad_limits(pad_val)
 
+    def refresh_axis_limits (self, akey = None):
+        """ recomputes axis limits from data if data has been appended since limits were last assigned.
+
+        called before any method which reads or modifies the axis limits,
+        so that limits assigned by the user after appending data are not
+        replaced by limits computed from the data.
+
+        Parameters:
+        -----------
+        akey : str
+            key corresponding to axis in 'dict_axes'.
+
+        Returns:
+        --------
+        None
+        """
+        if (akey + 'limits') in self.dirty:
+            self.set_axis_limits(akey, pad_val = default_padding_value)
+
     def set_axis_minimum_value (self, akey = None, val = None):
         """ assigns minimum value to axis.
 
@@ -1068,9 +1765,11 @@ class Figure (object):
         """
         # check that the key exists in the dictionary
         if not self.has_axis(akey): return
+        self.refresh_axis_limits(akey)
         # TODO :: check the axis data type
         # pass the minimum value to the axis
         self.dict_axes[akey].set_minimum(val)
+        self.user_limits.add(akey)
 
     def set_axis_maximum_value (self, akey = None, val = None):
         """ assigns maximum value to axis.
@@ -1088,9 +1787,11 @@ class Figure (object):
         """
         # check that the key exists in the dictionary
         if not self.has_axis(akey): return
+        self.refresh_axis_limits(akey)
         # TODO :: check the axis data type
         # pass the maximum value to the axis
         self.dict_axes[akey].set_maximum(val)
+        self.user_limits.add(akey)
 
     def get_axis_minimum_value (self, akey = None):
         """ get the lower bound value assigned to the axis limits.
@@ -1107,6 +1808,7 @@ class Figure (object):
         """
         # check that the key exists in the axes dictionary
         if not self.has_axis(akey): return
+        self.refresh_axis_limits(akey)
         # return the lower bounds assigned to the axis
         return self.dict_axes[akey].get_minimum()
 
@@ -1125,6 +1827,7 @@ class Figure (object):
         """
         # check that the key exists in the axes dictionary
         if not self.has_axis(akey): return
+        self.refresh_axis_limits(akey)
         # return the upper bounds assigned to the axis
         return self.dict_axes[akey].get_maximum()
 
@@ -1150,6 +1853,8 @@ class Figure (object):
         """
         # check that the axis exists in the dictionary
         if not self.has_axis(akey): return
+        # apply pending limits before they are modified
+        self.refresh_axis_limits(akey)
         # assign the scale
         if linear:
             self.dict_axes[akey].set_scale(s = scale_linear)
@@ -1292,6 +1997,8 @@ class Figure (object):
         """
         # check that the axis exists in the dictionary
         if not self.has_axis(akey): return
+        # apply pending limits before they are modified
+        self.refresh_axis_limits(akey)
         # if mininimum and maximum values are unassigned, get them
         if (not self.dict_axes[akey].has_minimum()) and (min_val is None):
             # assign the minimum value
@@ -1303,6 +2010,8 @@ class Figure (object):
             pass
         # assign the major and minor ticks
         self.dict_axes[akey].set_major_ticks(minval = min_val, maxval = max_val, nticks = n_ticks)
+        # ticks also assign the axis limits
+        self.user_limits.add(akey)
 
     def get_axis_major_ticks (self, akey = None):
         """ returns major ticks assigned to specified axis.
@@ -1523,6 +2232,165 @@ class Figure (object):
         """
         return bool(self.subtitle_label.get_label())
 
+    ## SPECIFICATION ##
+
+    def to_spec (self, generator = None, options = None, data = False):
+        """ returns declarative description of Figure, which can be written to json or toml.
+
+        data read from csv files is described by its sources: the path to
+        each file, the columns mapped to each axis, the label and the data
+        types used to parse them. data appended from memory is only included
+        when 'data' is 'True', in which case every column is written inline
+        instead. axis limits are only included where they were assigned,
+        rather than computed from the data, and labels and markers only
+        where they differ from the defaults, so the spec remains small and
+        describes the same figure when the files it reads change.
+
+        Arguments:
+        ----------
+        generator : str (optional)
+            name of generator used to draw Figure, see 'plot.batch.generators'.
+        options : Dict (optional)
+            keyword arguments passed to generator.
+        data : bool (optional, default is 'False')
+            if 'True', data is written inline rather than as its sources.
+
+        Returns:
+        --------
+        FigureSpec
+            description of Figure, or 'None' if it cannot be described.
+        """
+        if generator is not None and not isinstance(generator, str):
+            print("ERROR :: Figure.to_spec() :: 'generator' must be the name of a generator, not '{0}'.".format(type(generator).__name__))
+            return None
+        self.refresh()
+        spec = {'generator': generator, 'options': dict(options) if options else None}
+        # data
+        if data:
+            if self.store is not None:
+                spec['data'] = {c: self.store.get_column(c) for c in self.get_columns()}
+        else:
+            if self.store is not None and sum(src['rows'] for src in self.sources) != len(self.store):
+                print("ERROR :: Figure.to_spec() :: Figure contains data which was not read from a csv file, use 'data = True' to include it in spec.")
+                return None
+            for src in self.sources:
+                if callable(src['label']):
+                    print("ERROR :: Figure.to_spec() :: data from '{0}' is labelled by a method, which cannot be included in spec.".format(src.get('file', src.get('files'))))
+                    return None
+            spec['sources'] = [{k: v for k, v in src.items() if k != 'rows'} for src in self.sources]
+        spec['dtype_policy'] = dict(self.dtype_policy)
+        # labels
+        if self.has_title_label():
+            spec['title'] = {'label': self.title_label.get_label(), 'size': self.title_label.get_size()}
+        if self.has_subtitle_label():
+            spec['subtitle'] = {'label': self.subtitle_label.get_label(), 'size': self.subtitle_label.get_size()}
+        default = Axis().to_spec()
+        axes = {}
+        for akey, axis in self.dict_axes.items():
+            a = axis.to_spec(limits = akey in self.user_limits)
+            if a != default:
+                axes[akey] = a
+        spec['axes'] = axes
+        # ivals, only those which differ from the defaults
+        ivals = self.get_unique_ivals()
+        marks = itertools.cycle(self.markerset)
+        markers = {
+            'markerset': list(self.markerset) if self.markerset != default_markerset else None,
+            'ivals': [[i, m] for i, m in zip(ivals, [self.marker_dict[i] for i in ivals]) if m != next(marks)] or None}
+        labels = {
+            'format': self.format_string,
+            'ivals': [[i, self.label_dict[i]] for i in ivals if self.label_dict[i] != i] or None}
+        spec['markers'] = {k: v for k, v in markers.items() if v is not None} or None
+        spec['labels'] = {k: v for k, v in labels.items() if v is not None} or None
+        spec['cmap'] = self.cmap
+        spec['dpi'] = self.dpi
+        # save location
+        filetype_options = {}
+        for t, o in self.filetype_options.items():
+            pil_kwargs = o.get('pil_kwargs', {})
+            filetype_options[t] = {'dpi': o.get('dpi'), 'compression': next(iter(pil_kwargs.values()), None)}
+        spec['saveas'] = {'dir': self.savedir, 'name': self.filename, 'types': self.get_filetypes(), 'options': filetype_options}
+        return FigureSpec(spec)
+
+    @classmethod
+    def from_spec (cls, spec = None):
+        """ creates Figure described by spec, see 'to_spec'.
+
+        data is read from the sources in the spec, then formatting is
+        assigned, so limits and ticks which were not assigned in the spec
+        are computed from the data.
+
+        Arguments:
+        ----------
+        spec : FigureSpec, Dict, or str
+            spec, dictionary describing Figure, or path to json or toml file
+            containing spec.
+
+        Returns:
+        --------
+        Figure
+            Figure described by spec, or 'None' if its data could not be read.
+        """
+        if isinstance(spec, str):
+            spec = FigureSpec.load(spec)
+            if spec is None:
+                return None
+        elif not isinstance(spec, FigureSpec):
+            spec = FigureSpec(spec)
+        fig = cls()
+        policy = spec.get('dtype_policy')
+        if policy is not None:
+            fig.set_dtype_policy(categorical_ivals = 'i' in policy.get('categorical', []), float32 = len(policy.get('float32', [])) > 0, downcast_ints = policy.get('downcast_ints', False))
+        # data
+        data = spec.get('data')
+        if data and not fig.append_arrays({c: as_column_array(v) for c, v in data.items()}):
+            print("ERROR :: Figure.from_spec() :: unable to append data in spec.")
+            return None
+        for src in spec.get('sources', []):
+            cols = src.get('columns', {})
+            if 'file' in src:
+                ok = fig.append_csv_from_dict(src['file'], cols, label = src.get('label'), dtype = src.get('dtype'))
+            else:
+                ok = fig.append_csv_files(src.get('files'), xcol = cols.get('x'), ycol = cols.get('y'), ccol = cols.get('c'), icol = cols.get('i'), label = src.get('label'), dtype = src.get('dtype'))
+            if not ok:
+                print("ERROR :: Figure.from_spec() :: unable to read data from '{0}'.".format(src.get('file', src.get('files'))))
+                return None
+        # save location
+        saveas = spec.get('saveas', {})
+        if saveas:
+            fig.set_saveas(savedir = saveas.get('dir', default_file_location), filename = saveas.get('name', default_file_name), filetype = saveas.get('types', default_file_type))
+            for t, o in saveas.get('options', {}).items():
+                fig.set_filetype_options(t, dpi = o.get('dpi'), compression = o.get('compression'))
+        if 'dpi' in spec.spec:
+            fig.set_dpi(spec.get('dpi'))
+        # labels
+        if 'title' in spec.spec:
+            fig.set_title_label(spec.get('title').get('label'), spec.get('title').get('size'))
+        if 'subtitle' in spec.spec:
+            fig.set_subtitle_label(spec.get('subtitle').get('label'), spec.get('subtitle').get('size'))
+        for akey, a in spec.get('axes', {}).items():
+            if not fig.has_axis(akey):
+                print("ERROR :: Figure.from_spec() :: axis '{0}' has no data in Figure.".format(akey))
+                continue
+            # limits not assigned in spec are computed from the data
+            fig.refresh_axis_limits(akey)
+            fig.dict_axes[akey].apply_spec(a)
+            if 'min' in a or 'max' in a:
+                fig.user_limits.add(akey)
+        # ivals
+        if 'cmap' in spec.spec:
+            fig.set_cmap(spec.get('cmap'))
+        markers = spec.get('markers', {})
+        if 'markerset' in markers:
+            fig.reset_markers(markers['markerset'])
+        for i, m in markers.get('ivals', []):
+            fig.set_marker(i, m)
+        labels = spec.get('labels', {})
+        fig.add_format(labels.get('format'))
+        for i, l in labels.get('ivals', []):
+            fig.set_label(i, l)
+        return fig
+
     ## THESE METHODS ARE PERMINANTLY DEPRICATED
 
     def get_xval_list (self, ival = None):
@@ -0,0 +1,251 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: ingest.py
+## PURPOSE: contains methods for reading data files into Figure objects
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import os
+import glob
+import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+# local
+from plot.cache import source_key
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for reading csv files
+default_chunksize = 1000000 # maximum number of rows parsed from file at once
+label_stem = "stem" # label rule, files labelled by name without directory or extension
+label_name = "name" # label rule, files labelled by name without directory
+
+
+#############
+## METHODS ##
+#############
+
+def resolve_csv_columns (filename = None, col_dict = None):
+    """ maps axes to csv column headers, converting column numbers to headers.
+
+    only the header of the file is read.
+
+    Parameters:
+    -----------
+    filename : str
+        path to csv file.
+    col_dict : Dict[str] or Dict[int]
+        maps axes to csv column headers or column numbers.
+
+    Returns:
+    --------
+    Dict[str]
+        maps axes to csv column headers, or 'None' if the header could not
+        be read or a column could not be found in the file.
+    """
+    try:
+        header = pd.read_csv(filename, nrows = 0).columns.tolist()
+    except (OSError, ValueError) as e:
+        # missing, unreadable, or empty file, pandas parser errors are 'ValueError'
+        print("ERROR :: ingest.resolve_csv_columns() :: unable to read header of csv file '{0}' :: {1}".format(filename, e))
+        return None
+    names = {}
+    for k, c in col_dict.items():
+        if isinstance(c, (int, np.integer)) and not isinstance(c, bool):
+            # column number
+            if c < 0 or c >= len(header):
+                print("ERROR :: ingest.resolve_csv_columns() :: column number '{0}' out of range in csv file '{1}'.".format(c, filename))
+                return None
+            names[k] = header[c]
+        elif c in header:
+            names[k] = c
+        else:
+            print("ERROR :: ingest.resolve_csv_columns() :: column '{0}' not found in csv file '{1}'.".format(c, filename))
+            return None
+    return names
+
+def read_csv_chunks (filename = None, col_dict = None, dtype = None, chunksize = default_chunksize):
+    """ reads columns from csv file in chunks of bounded size.
+
+    only the columns mapped in 'col_dict' are parsed. each chunk is
+    returned as a dictionary mapping axes to arrays, so that no more
+    than 'chunksize' rows of the file are held in memory at once.
+
+    Parameters:
+    -----------
+    filename : str
+        path to csv file.
+    col_dict : Dict[str] or Dict[int]
+        maps axes to csv column headers or column numbers.
+    dtype : Dict (optional)
+        maps axes to the data type used to parse the corresponding
+        column. columns which are not included are inferred.
+    chunksize : int (optional, default is 'default_chunksize')
+        maximum number of rows in each chunk.
+
+    Returns:
+    --------
+    Generator[Dict[numpy.ndarray]]
+        maps each axis in 'col_dict' to the values in the chunk, or 'None'
+        if the columns could not be found in the file.
+    """
+    names = resolve_csv_columns(filename, col_dict)
+    if names is None:
+        return None
+    # explicit data types, keyed by csv column header
+    dtypes = None
+    if dtype is not None:
+        dtypes = {names[k]: t for k, t in dtype.items() if k in names}
+    if chunksize is None or chunksize < 1:
+        chunksize = default_chunksize
+    return iter_csv_chunks(filename, names, dtypes, chunksize)
+
+def iter_csv_chunks (filename = None, names = None, dtypes = None, chunksize = default_chunksize):
+    """ generator used by 'read_csv_chunks', parses file one chunk at a time. """
+    with pd.read_csv(filename, usecols = list(set(names.values())), dtype = dtypes, chunksize = chunksize) as reader:
+        for chunk in reader:
+            yield {k: chunk[c].to_numpy() for k, c in names.items()}
+
+def read_csv_columns (filename = None, col_dict = None, dtype = None, cache = None, content_hash = False):
+    """ reads columns from csv file into arrays.
+
+    module level, so that it can be sent to worker processes. if a cache
+    is given, columns parsed from an unchanged file are loaded from the
+    cache, rather than parsed again, and newly parsed columns are stored.
+
+    Parameters:
+    -----------
+    filename : str
+        path to csv file.
+    col_dict : Dict[str] or Dict[int]
+        maps axes to csv column headers or column numbers.
+    dtype : Dict (optional)
+        maps axes to the data type used to parse the corresponding column.
+    cache : DiskCache (optional)
+        cache containing columns previously parsed from csv files.
+    content_hash : bool (optional, default is 'False')
+        if 'True', cached files are identified by their contents, rather
+        than their path, size and modification time.
+
+    Returns:
+    --------
+    Dict[numpy.ndarray]
+        maps each axis in 'col_dict' to the values in the file, or 'None'
+        if the file could not be read or the columns could not be found in
+        the file. cached columns are read-only and may be memory-mapped.
+    """
+    try:
+        key = None
+        if cache is not None:
+            key = source_key(filename, col_dict, dtype, content_hash = content_hash)
+            cols = cache.get_arrays(key)
+            if cols is not None and set(cols.keys()) == set(col_dict.keys()):
+                return cols
+        chunks = read_csv_chunks(filename, col_dict, dtype = dtype, chunksize = default_chunksize)
+        if chunks is None:
+            return None
+        chunks = list(chunks)
+    except (OSError, ValueError) as e:
+        # missing, unreadable, or malformed file, pandas parser errors are 'ValueError'
+        print("ERROR :: ingest.read_csv_columns() :: unable to read csv file '{0}' :: {1}".format(filename, e))
+        return None
+    if len(chunks) == 0:
+        cols = {k: np.empty(0) for k in col_dict}
+    elif len(chunks) == 1:
+        cols = chunks[0]
+    else:
+        cols = {k: np.concatenate([c[k] for c in chunks]) for k in col_dict}
+    if cache is not None:
+        cache.put_arrays(key, cols)
+    return cols
+
+def list_files (files = None):
+    """ returns list of paths from a glob pattern, or list of paths.
+
+    Parameters:
+    -----------
+    files : str or List[str]
+        glob pattern, or list of paths.
+
+    Returns:
+    --------
+    List[str]
+        paths, sorted if 'files' is a glob pattern.
+    """
+    if isinstance(files, (str, os.PathLike)):
+        return sorted(glob.glob(os.fspath(files)))
+    return [os.fspath(f) for f in files]
+
+def get_file_label (filename = None, label = None):
+    """ returns label assigned to data read from file.
+
+    Parameters:
+    -----------
+    filename : str
+        path to file.
+    label : str, callable, or None
+        'label_stem' or 'label_name' label the file by its name, with or
+        without extension. a callable is passed the path and returns the
+        label. any other value is used as the label.
+
+    Returns:
+    --------
+    str, float, or int
+        label for data in file.
+    """
+    if callable(label):
+        return label(filename)
+    if label == label_stem:
+        return os.path.splitext(os.path.basename(filename))[0]
+    if label == label_name:
+        return os.path.basename(filename)
+    return label
+
+def read_csv_files (files = None, col_dict = None, dtype = None, workers = None, processes = False, cache = None, content_hash = False):
+    """ reads the same columns from many csv files concurrently.
+
+    files are parsed by a pool of threads, or processes if 'processes' is
+    'True'. the pandas parser releases the GIL while tokenizing, so threads
+    are usually sufficient and avoid copying the arrays between processes.
+
+    Parameters:
+    -----------
+    files : str or List[str]
+        glob pattern, or list of paths to csv files.
+    col_dict : Dict[str] or Dict[int]
+        maps axes to csv column headers or column numbers.
+    dtype : Dict (optional)
+        maps axes to the data type used to parse the corresponding column.
+    workers : int (optional)
+        number of threads or processes, defaults to the number of cpus.
+    processes : bool (optional, default is 'False')
+        if 'True', files are parsed in a process pool.
+    cache : DiskCache (optional)
+        cache containing columns previously parsed from csv files.
+    content_hash : bool (optional, default is 'False')
+        if 'True', cached files are identified by their contents.
+
+    Returns:
+    --------
+    List[(str, Dict[numpy.ndarray])]
+        path and columns read from each file, in the same order as
+        'files'. columns are 'None' for files which could not be read.
+    """
+    paths = list_files(files)
+    if len(paths) == 0:
+        return []
+    if workers is None or workers < 1:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(paths))
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool(max_workers = workers) as executor:
+        n = len(paths)
+        results = list(executor.map(read_csv_columns, paths, [col_dict] * n, [dtype] * n, [cache] * n, [content_hash] * n))
+    return list(zip(paths, results))
@@ -0,0 +1,141 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: memory.py
+## PURPOSE: contains methods for rendering Figure objects to memory, rather than to files
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import io
+import numpy as np
+# local
+from plot.figure import accepted_filetypes
+from plot.plot import gen_plot
+from plot.render import capture_figures
+
+
+################
+## PARAMETERS ##
+################
+
+## name of each file type used by 'savefig'
+savefig_formats = {'.png': 'png', '.tif': 'tiff', '.pdf': 'pdf', '.svg': 'svg'}
+
+
+#############
+## METHODS ##
+#############
+
+def render_figure (fig = None, generator = gen_plot, **options):
+    """ draws Figure with generator, returning the matplotlib figure rather than saving it.
+
+    Parameters:
+    -----------
+    fig : Figure
+        Figure drawn.
+    generator : callable (optional, default is 'gen_plot')
+        method used to draw Figure, e.g. 'plot.plot.gen_scatter'.
+    options : keyword arguments
+        passed to generator. the figure is never shown.
+
+    Returns:
+    --------
+    (matplotlib.figure.Figure, str or None)
+        figure drawn by generator, and the bounding box it would have been
+        saved with, or '(None, None)' if the generator did not draw a figure.
+    """
+    options['show'] = False
+    options['save'] = True
+    options.pop('ax', None)
+    capture_figures(start = True)
+    try:
+        generator(fig, **options)
+    finally:
+        figures = capture_figures(start = False)
+    if len(figures) == 0:
+        print("ERROR :: memory.render_figure() :: generator '{0}' did not draw a figure.".format(getattr(generator, '__name__', generator)))
+        return None, None
+    return figures[-1]
+
+def render_bytes (fig = None, generator = gen_plot, filetype = None, **options):
+    """ draws Figure with generator, returning the encoded image without writing a file.
+
+    Parameters:
+    -----------
+    fig : Figure
+        Figure drawn. dpi and compression are taken from the options
+        assigned to 'filetype', see 'Figure.set_filetype_options'.
+    generator : callable (optional, default is 'gen_plot')
+        method used to draw Figure.
+    filetype : str (optional)
+        one of 'accepted_filetypes', defaults to the first file type
+        assigned to Figure.
+    options : keyword arguments
+        passed to generator.
+
+    Returns:
+    --------
+    bytes
+        contents of image file, or 'None' if the figure could not be drawn.
+    """
+    if filetype is None:
+        filetype = fig.filetype
+    if filetype not in accepted_filetypes:
+        print("ERROR :: memory.render_bytes() :: filetype '{0}' not in 'accepted_filetypes' {1}.".format(filetype, accepted_filetypes))
+        return None
+    f, bbox_inches = render_figure(fig, generator, **options)
+    if f is None:
+        return None
+    buf = io.BytesIO()
+    f.savefig(buf, format = savefig_formats[filetype], bbox_inches = bbox_inches, **fig.get_filetype_options(filetype))
+    return buf.getvalue()
+
+def render_rgba (fig = None, generator = gen_plot, **options):
+    """ draws Figure with generator, returning the pixels of the Agg canvas without copying them.
+
+    the array is a view of the buffer the figure was drawn into, at the
+    dpi of the Figure and cropped to the bounding box it would be saved
+    with. it stays valid for as long as it is referenced.
+
+    Parameters:
+    -----------
+    fig : Figure
+        Figure drawn.
+    generator : callable (optional, default is 'gen_plot')
+        method used to draw Figure.
+    options : keyword arguments
+        passed to generator.
+
+    Returns:
+    --------
+    numpy.ndarray
+        uint8 array with shape (height, width, 4), or 'None' if the figure
+        could not be drawn.
+    """
+    f, bbox_inches = render_figure(fig, generator, **options)
+    if f is None:
+        return None
+    if bbox_inches is None:
+        f.set_dpi(fig.get_dpi())
+        f.canvas.draw()
+    else:
+        # cropping to the bounding box is only performed by 'savefig', the raw pixels are discarded
+        f.savefig(NullFile(), format = 'raw', bbox_inches = bbox_inches, dpi = fig.get_dpi())
+    return np.asarray(f.canvas.buffer_rgba())
+
+
+#############
+## CLASSES ##
+#############
+
+class NullFile (io.RawIOBase):
+    """ file-like object which discards everything written to it. """
+
+    def writable (self):
+        return True
+
+    def write (self, b = None):
+        return len(b)
@@ -10,13 +10,16 @@
 import pandas as pd
 import numpy as np
 import matplotlib
-import matplotlib.pyplot as plt
 import matplotlib.lines as mlines
-import matplotlib.legend as mlegend
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection
 from matplotlib import colormaps as mcmaps
 # local
 from plot.figure import Figure
 from plot.figure import discrete_matplotlib_cmaps, default_matplotlib_cmaps
+from plot.decimate import decimate, get_pixel_width, get_pixel_height
+from plot.density import bin_points, blend_density, default_density_threshold, default_density_legendloc
+from plot.render import get_axes, set_title_labels, set_axis_labels, set_axis_scales, set_axis_ticks, add_legend, compact_handles, fix_layout, finish, default_layout
 
 
 ################
@@ -28,6 +31,10 @@ default_colormap = 'coolwarm'
 default_legendloc = 'best'
 n_xfits = 100
 
+# defaults associated with figure size, in inches
+default_scatter_figsize = (7, 5)
+default_bar_figsize = (8, 6)
+
 # defaults associated with plot
 default_plot_markersize = 4
 default_plot_linewidth = 2
@@ -37,113 +44,307 @@ default_scatter_markersize = 8
 
 # defaults associated with pie chart
 default_prect_no_label_max = 0.05 # maximum precentage of total pie chart before label is not included
+default_other_label = "Other" # label of slice containing every slice smaller than 'default_prect_no_label_max'
 default_explode = 0.05
 
 
 #############
 ## METHODS ##
 #############
+# colors assigned to each series
+def get_series_colors (fig = None, ivals = None):
+    """ returns array containing the RGBA color of each ival.
+
+    if the Figure does not have a color map, the matplotlib default color
+    cycle is used, as when each series is drawn with its own call.
+
+    Returns:
+    --------
+    numpy.ndarray
+        array of shape (len(ivals), 4).
+    """
+    if fig.has_cmap():
+        return np.array([mcolors.to_rgba(fig.get_color(i)) for i in ivals]).reshape(-1, 4)
+    cycle = matplotlib.rcParams['axes.prop_cycle'].by_key()['color']
+    return np.array([mcolors.to_rgba(cycle[k % len(cycle)]) for k in range(len(ivals))]).reshape(-1, 4)
+
+# data drawn for each series
+def get_plot_arrays (fig = None, ival = None, method = None, n_pixels = None):
+    """ returns x- and y-values of ival, decimated to 'n_pixels' pixel columns if 'method' is given.
+
+    see 'decimate.decimate' for the decimation methods. the x-axis limits
+    and scale of the Figure determine the pixel column of each point.
+
+    Returns:
+    --------
+    (numpy.ndarray, numpy.ndarray)
+        x- and y-values drawn for ival.
+    """
+    x = fig.get_xval_array(ival)
+    y = fig.get_yval_array(ival)
+    if method is None or n_pixels is None:
+        return x, y
+    return decimate(x, y, n_pixels, method = method, lims = (fig.get_xaxis_min(), fig.get_xaxis_max()), log = fig.xaxis_is_logscale())
+
+# draw the markers of every ival, with one collection per marker
+def draw_marker_collections (fig = None, ax = None, ivals = None, colors = None, s = None, zorder = None, xy = None):
+    """ draws the points of each ival, grouping ivals which share a marker into one collection.
+
+    'xy' optionally contains the x- and y-values drawn for each ival,
+    otherwise they are taken from the Figure.
+
+    Returns:
+    --------
+    List[matplotlib.collections.PathCollection]
+        one collection per marker.
+    """
+    markers = [fig.get_marker(i) for i in ivals]
+    collections = []
+    for m in dict.fromkeys(markers):
+        idx = [k for k in range(len(ivals)) if markers[k] == m]
+        if xy is None:
+            x = [fig.get_xval_array(ivals[k]) for k in idx]
+            y = [fig.get_yval_array(ivals[k]) for k in idx]
+        else:
+            x = [xy[k][0] for k in idx]
+            y = [xy[k][1] for k in idx]
+        c = np.repeat(colors[idx], [len(a) for a in x], axis = 0)
+        collections.append(ax.scatter(np.concatenate(x), np.concatenate(y), marker = m, s = s, color = c, zorder = zorder))
+    return collections
+
+# draw every ival as one line collection
+def draw_line_collection (fig = None, ax = None, linewidth = default_plot_linewidth, markersize = default_plot_markersize, decimate = None, n_pixels = None):
+    """ draws every ival with one LineCollection, and one marker collection per marker.
+
+    each ival is decimated if 'decimate' is given, see 'get_plot_arrays'.
+
+    Returns:
+    --------
+    List[matplotlib.lines.Line2D]
+        legend proxy for each ival.
+    """
+    ivals = fig.get_unique_ivals(rev = False)
+    colors = get_series_colors(fig, ivals)
+    xy = [get_plot_arrays(fig, i, decimate, n_pixels) for i in ivals]
+    segments = [np.column_stack(a) for a in xy]
+    # segments are drawn in order, reverse so that the first ival is on top
+    ax.add_collection(LineCollection(segments[::-1], colors = colors[::-1], linewidths = linewidth, zorder = 2), autolim = False)
+    if markersize is not None and markersize > 0:
+        # line marker size is in points, scatter size in points squared
+        draw_marker_collections(fig, ax, ivals, colors, s = markersize ** 2, zorder = 2.5, xy = xy)
+    ls = '-' if linewidth else ''
+    return [mlines.Line2D([], [], marker = fig.get_marker(i), ls = ls, label = fig.get_label(i), color = colors[k]) for k, i in enumerate(ivals)]
+
+# sum values by category
+def sum_by_category (x = None, y = None, keys = None, groups = None, group_keys = None):
+    """ sums y-values which share an x-value, and optionally an i-value.
+
+    categories are converted to integer codes with a single hash lookup,
+    then summed with 'numpy.bincount', so aggregation is linear in the
+    number of rows. rows whose x-value is not in 'keys', or whose i-value
+    is not in 'group_keys', are ignored.
+
+    Parameters:
+    -----------
+    x : numpy.ndarray
+        category of each row.
+    y : numpy.ndarray
+        value of each row.
+    keys : List
+        categories summed, in the order they are returned.
+    groups : numpy.ndarray (optional)
+        group of each row, e.g. the i-value.
+    group_keys : List (optional)
+        groups summed, in the order they are returned.
+
+    Returns:
+    --------
+    numpy.ndarray
+        sum for each category, shape (len(keys),), or for each group and
+        category, shape (len(group_keys), len(keys)).
+    """
+    nx = len(keys)
+    codes = pd.Index(keys).get_indexer(x)
+    y = np.asarray(y, dtype = float)
+    if groups is None:
+        keep = codes >= 0
+        return np.bincount(codes[keep], weights = y[keep], minlength = nx)
+    ng = len(group_keys)
+    gcodes = pd.Index(group_keys).get_indexer(groups)
+    keep = (codes >= 0) & (gcodes >= 0)
+    flat = gcodes[keep] * nx + codes[keep]
+    return np.bincount(flat, weights = y[keep], minlength = ng * nx).reshape(ng, nx)
+
+# draw every ival as one density image
+def draw_density (fig = None, ax = None, ivals = None, colors = None):
+    """ draws the points of each ival as one image, with one cell per pixel of the saved figure.
+
+    the points of each ival are counted in each cell, and the colors of
+    the ivals are blended according to their counts, see
+    'density.blend_density'. log-scaled axes are drawn with a mesh,
+    rather than an image, so that cells match the log-spaced pixels.
+
+    Returns:
+    --------
+    matplotlib.artist.Artist
+        image or mesh containing density.
+    """
+    shape = (get_pixel_height(ax, fig.get_dpi()), get_pixel_width(ax, fig.get_dpi()))
+    xlims = (fig.get_xaxis_min(), fig.get_xaxis_max())
+    ylims = (fig.get_yaxis_min(), fig.get_yaxis_max())
+    xlog = fig.xaxis_is_logscale()
+    ylog = fig.yaxis_is_logscale()
+    counts = [bin_points(fig.get_xval_array(i), fig.get_yval_array(i), shape, xlims, ylims, xlog, ylog) for i in ivals]
+    rgba = blend_density(counts, colors)
+    if xlog or ylog:
+        xedges = np.geomspace(*xlims, shape[1] + 1) if xlog else np.linspace(*xlims, shape[1] + 1)
+        yedges = np.geomspace(*ylims, shape[0] + 1) if ylog else np.linspace(*ylims, shape[0] + 1)
+        return ax.pcolormesh(xedges, yedges, rgba, shading = 'flat', zorder = 2)
+    return ax.imshow(rgba, origin = 'lower', extent = (xlims[0], xlims[1], ylims[0], ylims[1]), aspect = 'auto', interpolation = 'nearest', zorder = 2)
+
 # scatter plot
-def gen_scatter (fig = None, markersize = default_scatter_markersize, legendloc = default_legendloc, show = True, save = True):
+def gen_scatter (fig = None, markersize = default_scatter_markersize, legendloc = default_legendloc, show = True, save = True, ax = None, collect = False, density = None, density_threshold = default_density_threshold, layout = default_layout):
+    """ draws Figure data as scatter plot.
+
+    the plot is drawn onto 'ax' if it is supplied, otherwise onto a new
+    matplotlib figure, which is closed after it is saved or shown. if
+    'collect' is 'True', ivals which share a marker are drawn as a single
+    collection with one color per point, and the legend shows an evenly
+    spaced subset of the ivals. this is much faster for many ivals.
+    if 'density' is 'True', points are counted in a grid with one cell
+    per pixel and drawn as an image, with the colors of the ivals blended
+    in each cell. if 'density' is 'None', density mode is used when the
+    Figure has more than 'density_threshold' points, by default
+    'default_density_threshold'.
+    if 'layout' is 'fixed', the margins of the figure are measured once for
+    each layout shape and reused, rather than measured again when saving
+    with 'bbox_inches = tight', see 'render.fix_layout'.
+
+    Returns:
+    --------
+    matplotlib.axes.Axes
+        axes containing the plot.
+    """
 
     # check that figure exists
     if fig is None:
         ("ERROR :: scatter :: must specify 'fig'.")
         exit()
+    # compute limits, markers, labels and colors pending since data was appended
+    fig.refresh()
 
     # establish scatter plot
-    plt.figure(figsize=(7,5))
+    f, ax, owned = get_axes(ax, figsize = default_scatter_figsize, show = show)
     leg = [] # empty list used for legend
-    if fig.has_ivals():
+    if density is None:
+        density = len(fig.get_xval_array()) > density_threshold
+    if density:
+        # draw points as an image, blending the color of each ival
+        ivals = fig.get_unique_ivals(rev = False) if fig.has_ivals() else [None]
+        colors = get_series_colors(fig, ivals)
+        draw_density(fig, ax, ivals, colors)
+        if fig.has_ivals():
+            leg = compact_handles([mlines.Line2D([], [], marker = 's', label = fig.get_label(i), color = colors[k], ls = '') for k, i in enumerate(ivals)])
+    elif fig.has_ivals() and collect:
+        # draw ivals in as few collections as possible
+        ivals = fig.get_unique_ivals(rev = False)
+        colors = get_series_colors(fig, ivals)
+        draw_marker_collections(fig, ax, ivals, colors, s = markersize)
+        leg = compact_handles([mlines.Line2D([], [], marker = fig.get_marker(i), label = fig.get_label(i), color = colors[k], ls = '') for k, i in enumerate(ivals)])
+    elif fig.has_ivals():
         # if the figure has unique isolated values
         for i in fig.get_unique_ivals(rev = False):
-            sc = plt.scatter(fig.get_xval_list(i), fig.get_yval_list(i), marker = fig.get_marker(i), s = markersize, c = fig.get_color(i)) 
+            sc = ax.scatter(fig.get_xval_array(i), fig.get_yval_array(i), marker = fig.get_marker(i), s = markersize, color = fig.get_color(i))
             leg.append(mlines.Line2D([], [], marker = fig.get_marker(i), label = fig.get_label(i), color = sc.get_facecolors()[0].tolist(), ls = ''))
     else:
         # otherwise the figure does not have isolated values, so just create one plot
-        plt.scatter(fig.get_xval_list(), fig.get_yval_list(), marker = fig.get_marker(), s = markersize, c = fig.get_color())
+        ax.scatter(fig.get_xval_array(), fig.get_yval_array(), marker = fig.get_marker(), s = markersize, color = fig.get_color())
 
     # add xaxis min and max, used min and max to plot fits
-    xlim = plt.xlim(fig.get_xaxis_min(), fig.get_xaxis_max())
+    xlim = ax.set_xlim(fig.get_xaxis_min(), fig.get_xaxis_max())
 
     # set yaxis min and max
-    ylim = plt.ylim(fig.get_yaxis_min(), fig.get_yaxis_max())
-    if fig.get_title_label() is not None:
-        plt.suptitle(fig.get_title_label().get_label(), fontsize = fig.get_title_label().get_size())
-    if fig.get_subtitle_label() is not None:
-        plt.title(fig.get_subtitle_label().get_label(), fontsize = fig.get_subtitle_label().get_size())
+    ylim = ax.set_ylim(fig.get_yaxis_min(), fig.get_yaxis_max())
+    set_title_labels(fig, f, ax)
 
     # add axis labels
-    plt.xlabel(fig.get_xaxis_label().get_label(), fontsize = fig.get_xaxis_label().get_size())
-    plt.ylabel(fig.get_yaxis_label().get_label(), fontsize = fig.get_yaxis_label().get_size())
+    set_axis_labels(fig, ax)
 
-    # add the legend
-    # check legend code
-    if legendloc in mlegend.Legend.codes.keys():
-        # matplotlib legend defaults
-        plt.legend(handles = leg, loc = legendloc)
-    elif legendloc == "above":
-        # custom formatting - add legend above plot
-        plt.legend(handles = leg, bbox_to_anchor=(0, 1.02, 1, .02), loc="lower left", ncol = 3) 
-    else:
-        print("ERROR :: plot.scatter() :: unable to place legend in '{0}'. Using default legend location '{1}'.".format(legendloc, default_legendloc))
-        plt.legend(handles = leg, loc = default_legendloc)
+    # add the legend, the best location is found by testing every cell of a density mesh
+    if density and legendloc == 'best' and (fig.xaxis_is_logscale() or fig.yaxis_is_logscale()):
+        legendloc = default_density_legendloc
+    add_legend(ax, leg, legendloc, caller = "plot.scatter()")
 
     # adjust major and minor ticks for x and y axis
-    if fig.yaxis_has_major_ticks():
-        plt.yticks(fig.get_yaxis_major_ticks())
-        if fig.yaxis_has_minor_ticks():
-            plt.yticks(fig.get_yaxis_minor_ticks(), minor = True)
-
-    if fig.xaxis_has_major_ticks():
-        plt.xticks(fig.get_xaxis_major_ticks())
-        if fig.xaxis_has_minor_ticks():
-            plt.xticks(fig.get_xaxis_minor_ticks(), minor = True)
+    set_axis_ticks(fig, ax)
 
     # add logscale
-    if fig.xaxis_is_logscale():
-        plt.xscale(fig.get_xaxis_scale(), base = fig.get_xaxis_scale_base())
-    if fig.yaxis_is_logscale():
-        plt.yscale(fig.get_yaxis_scale(), base = fig.get_yaxis_scale_base())
-
-    if save:
-        plt.savefig(fig.get_saveas(), dpi = fig.get_dpi(), bbox_inches='tight')
-    if show:
-        plt.show()
+    set_axis_scales(fig, ax)
 
-    plt.close()
+    if layout == 'fixed' and owned:
+        fix_layout('scatter', fig, f, ax, legendloc)
+    finish(fig, f, owned = owned, save = save, show = show, bbox_inches = None if layout == 'fixed' else 'tight')
+    return ax
 
 # generate plot
-def gen_plot (fig = None, linewidth = default_plot_linewidth, markersize = default_plot_markersize, legendloc = default_legendloc, fit = None, show = True, save = True):
+def gen_plot (fig = None, linewidth = default_plot_linewidth, markersize = default_plot_markersize, legendloc = default_legendloc, fit = None, show = True, save = True, ax = None, collect = False, decimate = None, layout = default_layout):
+    """ draws Figure data as line plot.
+
+    the plot is drawn onto 'ax' if it is supplied, otherwise onto a new
+    matplotlib figure, which is closed after it is saved or shown. if
+    'collect' is 'True', every ival is drawn with a single LineCollection,
+    their markers with one collection per marker, and the legend shows an
+    evenly spaced subset of the ivals. this is much faster for many ivals.
+    if 'decimate' is 'minmax' or 'lttb', each series is reduced to a few
+    points per pixel column of the saved figure before it is drawn, see
+    'decimate.decimate'. the x-axis limits should be set before decimating
+    series which extend beyond them.
+    if 'layout' is 'fixed', the margins of the figure are measured once for
+    each layout shape and reused, rather than measured again when saving
+    with 'bbox_inches = tight', see 'render.fix_layout'.
+
+    Returns:
+    --------
+    matplotlib.axes.Axes
+        axes containing the plot.
+    """
 
     # if no figure was provided ..
     if fig is None:
         # if a figure has not been specified, we have a problem: cannot generate a default
         # if figure and data are seperate objects, then maybe figure can be default while data would be mandatory
         exit()
+    # compute limits, markers, labels and colors pending since data was appended
+    fig.refresh()
         
     ## TODO :: check figure 
 
-    # f, ax = plt.subplots()
+    f, ax, owned = get_axes(ax, show = show)
+    n_pixels = get_pixel_width(ax, fig.get_dpi()) if decimate is not None else None
     # ax.spines['top'].set_visible(False)
     # ax.spines['right'].set_visible(False)
     
     # plot scatter
     leg = [] # empty list used for legend
-    if fig.has_ivals():
+    if fig.has_ivals() and collect:
+        # draw ivals in as few collections as possible
+        leg = compact_handles(draw_line_collection(fig, ax, linewidth = linewidth, markersize = markersize, decimate = decimate, n_pixels = n_pixels))
+    elif fig.has_ivals():
         n = len(fig.get_unique_ivals())
         # if the figure has unique isolated values
         for i in fig.get_unique_ivals(rev = False):
             # print(i)
-            line = plt.plot(fig.get_xval_list(i), fig.get_yval_list(i), linewidth = linewidth, marker = fig.get_marker(i), markersize = markersize, zorder = n, c = fig.get_color(i)) 
+            x, y = get_plot_arrays(fig, i, decimate, n_pixels)
+            line = ax.plot(x, y, linewidth = linewidth, marker = fig.get_marker(i), markersize = markersize, zorder = n, c = fig.get_color(i)) 
             leg.append(mlines.Line2D([], [], marker = fig.get_marker(i), ls = line[-1].get_ls(), label = fig.get_label(i), color = line[-1].get_color()))
             n -= 1
     else:
         # otherwise the figure does not have isolated values, so just create one plot
-        plt.plot(fig.get_xval_list(), fig.get_yval_list(), linewidth = linewidth, marker = fig.get_marker(), markersize = markersize)
+        x, y = get_plot_arrays(fig, None, decimate, n_pixels)
+        ax.plot(x, y, linewidth = linewidth, marker = fig.get_marker(), markersize = markersize)
 
     # add xaxis min and max, used min and max to plot fits
-    xlim = plt.xlim(fig.get_xaxis_min(), fig.get_xaxis_max())
+    xlim = ax.set_xlim(fig.get_xaxis_min(), fig.get_xaxis_max())
 
     # add fits, if any were passed to the method
     if fit is not None:
@@ -156,80 +357,76 @@ def gen_plot (fig = None, linewidth = default_plot_linewidth, markersize = defau
             n = len(fig.get_unique_ivals()) + len(fit)
             if fit[i] is not None:
                 # there is only one fit, add it to the graph
-                line = plt.plot(fit[i].get_xval_list(lims = xlim, n = n_xfits, log = fig.xaxis_is_logscale()), fit[i].get_yval_list(lims = xlim, n = n_xfits, log = fig.xaxis_is_logscale()), linewidth = fit[i].get_linewidth(), marker = fit[i].get_marker(), markersize = fit[i].get_markersize(), ls = fit[i].get_linestyle(), color = fit[i].get_linecolor(), zorder = n)
+                line = ax.plot(fit[i].get_xval_list(lims = xlim, n = n_xfits, log = fig.xaxis_is_logscale()), fit[i].get_yval_list(lims = xlim, n = n_xfits, log = fig.xaxis_is_logscale()), linewidth = fit[i].get_linewidth(), marker = fit[i].get_marker(), markersize = fit[i].get_markersize(), ls = fit[i].get_linestyle(), color = fit[i].get_linecolor(), zorder = n)
                 leg.append(mlines.Line2D([], [], marker = fit[i].get_marker(), ls = fit[i].get_linestyle(), label = fit[i].get_label().get_label(), color = fit[i].get_linecolor()))
                 n -= 1
 
     # set yaxis min and max, add labels
-    ylim = plt.ylim(fig.get_yaxis_min(), fig.get_yaxis_max())
-    if fig.get_title_label() is not None:
-        plt.suptitle(fig.get_title_label().get_label(), fontsize = fig.get_title_label().get_size())
-    if fig.get_subtitle_label() is not None:
-        plt.title(fig.get_subtitle_label().get_label(), fontsize = fig.get_subtitle_label().get_size())
-
-    plt.xlabel(fig.get_xaxis_label().get_label(), fontsize = fig.get_xaxis_label().get_size())
-    plt.ylabel(fig.get_yaxis_label().get_label(), fontsize = fig.get_yaxis_label().get_size())
+    ylim = ax.set_ylim(fig.get_yaxis_min(), fig.get_yaxis_max())
+    set_title_labels(fig, f, ax)
+    set_axis_labels(fig, ax)
     # add the legend
-    plt.legend(handles = leg, loc = legendloc) # TODO increase size of legend labels
+    ax.legend(handles = leg, loc = legendloc) # TODO increase size of legend labels
     
     # add logscale
-    if fig.xaxis_is_logscale():
-        plt.xscale(fig.get_xaxis_scale(), base = fig.get_xaxis_scale_base())
-    if fig.yaxis_is_logscale():
-        plt.yscale(fig.get_yaxis_scale(), base = fig.get_yaxis_scale_base())
+    set_axis_scales(fig, ax)
 
     # adjust major and minor ticks for x and y axis
-    if fig.yaxis_has_major_ticks():
-        plt.yticks(fig.get_yaxis_major_ticks())
-        if fig.yaxis_has_minor_ticks():
-            plt.yticks(fig.get_yaxis_minor_ticks(), minor = True)
-
-    if fig.xaxis_has_major_ticks():
-        plt.xticks(fig.get_xaxis_major_ticks())
-        if fig.xaxis_has_minor_ticks():
-            plt.xticks(fig.get_xaxis_minor_ticks(), minor = True)
-
-    if save:
-        plt.savefig(fig.get_saveas(), dpi = fig.get_dpi(), bbox_inches='tight')
-    if show:
-        plt.show()
+    set_axis_ticks(fig, ax)
 
-    plt.close()
+    if layout == 'fixed' and owned:
+        fix_layout('plot', fig, f, ax, legendloc)
+    finish(fig, f, owned = owned, save = save, show = show, bbox_inches = None if layout == 'fixed' else 'tight')
+    return ax
 
 # generate pie chart
-def gen_pie_chart (fig = None, labels = None, legend = True, explode = default_explode, add_amount = False, curr = None, cmap = default_colormap, show = True, save = True):
+def gen_pie_chart (fig = None, labels = None, legend = True, explode = default_explode, add_amount = False, curr = None, cmap = default_colormap, show = True, save = True, ax = None, other_max = None):
+    """ draws Figure data as pie chart, with one wedge per unique x-value.
+
+    the chart is drawn onto 'ax' if it is supplied, otherwise onto a new
+    matplotlib figure, which is closed after it is saved or shown. if
+    'other_max' is assigned, e.g. 'default_prect_no_label_max', and two or
+    more wedges are smaller than that fraction of the total, they are
+    combined into a single wedge labelled 'default_other_label'. by
+    default, wedges are never combined.
+
+    Returns:
+    --------
+    matplotlib.axes.Axes
+        axes containing the chart.
+    """
 
     # check for fig
     if fig is None:
         exit()
+    fig.refresh()
 
     # get data and establish labels
-    x = fig.get_xval_list()
-    y = fig.get_yval_list()
+    x = fig.get_xval_array()
+    y = fig.get_yval_array()
     if labels is None:
         # if no labels were specified by the user, get them from the figure data
-        labels = list(dict.fromkeys(x))
+        labels = list(pd.unique(x))
+    else:
         # otherwise use the user specified date
+        labels = list(labels)
 
     # accumulate data
-    s = [0.] * len(labels) # amount organized by each catagorey
-    t = 0. # total amount 
-    for i in range(len(y)):
-        if x[i] not in labels:
-            continue
-        # s[labels.index(x[i])] += abs(y[i])
-        s[labels.index(x[i])] += y[i]
-        # t += abs(y[i])
-        t += y[i]
-
-    # remove any labels with 0., starting from the back
-    pop_list = []
-    for i in range(len(s)):
-        if s[i] <= 0.01:
-            pop_list.append(i)
-    for i in reversed(pop_list):
-        s.pop(i)
-        labels.pop(i)
+    s = sum_by_category(x, y, labels) # amount organized by each catagorey
+    t = s.sum() # total amount
+
+    # remove any labels with 0.
+    keep = s > 0.01
+    # combine wedges which are too small to label
+    if other_max is not None and t > 0.:
+        small = keep & (s < other_max * t)
+        if np.count_nonzero(small) > 1:
+            keep &= ~small
+            labels = [labels[k] for k in np.flatnonzero(keep)] + [default_other_label]
+            s = np.append(s[keep], s[small].sum())
+            keep = np.ones(len(s), dtype = bool)
+    labels = [labels[k] for k in np.flatnonzero(keep)]
+    s = s[keep].tolist()
 
     # add the total amount to the label if asked
     if add_amount:
@@ -263,8 +460,7 @@ def gen_pie_chart (fig = None, labels = None, legend = True, explode = default_e
         c = None
 
     # add figure labels
-    f = plt.figure()
-    ax = plt.subplot(111)
+    f, ax, owned = get_axes(ax, show = show)
     if fig.get_title_label() is not None:
         f.suptitle(fig.get_title_label().get_label(), fontsize = fig.get_title_label().get_size())
     if add_amount and not fig.has_subtitle_label():
@@ -272,7 +468,7 @@ def gen_pie_chart (fig = None, labels = None, legend = True, explode = default_e
             ax.set_title("({:.2f} {:s})".format(t, curr), fontsize = fig.get_title_label().get_size())
         else:
             ax.set_title("({:.2f})".format(t), fontsize = fig.get_subtitle_label().get_size())
-    else:
+    elif fig.get_subtitle_label() is not None:
         ax.set_title(fig.get_subtitle_label().get_label(), fontsize = fig.get_title_label().get_size())
 
     # plot
@@ -282,80 +478,65 @@ def gen_pie_chart (fig = None, labels = None, legend = True, explode = default_e
         ax.legend(labels = labels, bbox_to_anchor=(0.075, 0.75))
     else:
         ax.pie(s, labels = labels, explode = explode_array, colors = c, wedgeprops = wedgeprops)
-    # save / show
-    if save:
-        plt.savefig(fig.get_saveas(), dpi = fig.get_dpi()) # bbox_inches='tight'
-    if show:
-        plt.show()
-    # close
-    plt.close('all')
+    # save / show, close
+    finish(fig, f, owned = owned, save = save, show = show, bbox_inches = None)
+    return ax
 
 """ method for generating bar chart """
-def gen_bar_chart (fig = None, xlabel_dict = None, stack = True, show = True, save = False):
+def gen_bar_chart (fig = None, xlabel_dict = None, stack = True, show = True, save = False, ax = None, layout = default_layout):
+    """ draws Figure data as bar chart, stacked by i-value.
+
+    the chart is drawn onto 'ax' if it is supplied, otherwise onto a new
+    matplotlib figure, which is closed after it is saved or shown.
+    if 'layout' is 'fixed', the margins of the figure are measured once for
+    each layout shape and reused, rather than measured again when saving
+    with 'bbox_inches = tight', see 'render.fix_layout'.
+
+    Returns:
+    --------
+    matplotlib.axes.Axes
+        axes containing the chart.
+    """
 
     # check for the figure
     if fig is None:
         exit()
+    fig.refresh()
 
     # get data and establish labels
-    x = fig.get_xval_list()
+    x = fig.get_xval_array()
+    y = fig.get_yval_array()
     if xlabel_dict is None:
         # if no labels were specified by the user
-        # the keys are the unique xcol values
-        xkeys = list(dict.fromkeys(x))
+        # the keys are the unique xcol values, in order of appearance
+        xkeys = list(pd.unique(x))
         xlabels = xkeys
         # otherwise use the user specified date
     else:
         xkeys = list(xlabel_dict.keys())
         # generate labels
-        xlabels = []
-        for i in range(len(xkeys)):
-            xlabels.append(xlabel_dict[xkeys[i]])
+        xlabels = [xlabel_dict[k] for k in xkeys]
 
-    # plot
-    f = plt.figure(figsize=(8,6))
-    ax1 = plt.gca()
+    # plot, onto axes supplied by caller or a new figure
+    f, ax1, owned = get_axes(ax, figsize = default_bar_figsize, show = show)
 
     if fig.has_ivals():
 
         ## accumulate data according to each x- and i-val
-        # multi-dimensional array corresponding to the height of each layer
-        # after accumulation
-        b = [[0.] * len(xkeys) for i in range(len(fig.get_unique_ivals()) + 1)]
-        for i in fig.get_unique_ivals():
-            # sum corresponding to each x- and i-val
-            s = [0.] * len(xkeys) # amount organized by each catagorey
-            t = 0. # sum of all values
-            x = fig.get_xval_list(i)
-            y = fig.get_yval_list(i)
-            # cascade the base value to the next level
-            for j in range(len(xkeys)):
-                b[fig.get_unique_ivals().index(i) + 1][j] = b[fig.get_unique_ivals().index(i)][j]
-            for j in range(len(x)):
-                if x[j] not in xkeys:
-                    continue
-                s[xkeys.index(x[j])] += y[j]
-                b[fig.get_unique_ivals().index(i) + 1][xkeys.index(x[j])] += y[j]
-                t += y[j]
-
-            ## check
-            # for j in range(len(s)):
-            #     print(i, xkeys[j], s[j], b[fig.get_unique_ivals().index(i)])
+        # matrix containing the height of each ival (row) in each category (column)
+        ivals = fig.get_unique_ivals()
+        s = sum_by_category(x, y, xkeys, groups = fig.get_col_val_array(fig.icol), group_keys = ivals)
+        # base of each layer is the cumulative height of the layers below it
+        b = np.zeros_like(s)
+        b[1:] = np.cumsum(s, axis = 0)[:-1]
+        for k, i in enumerate(ivals):
             # plot with shifted base
-            ax1.bar(xlabels, s, bottom = b[fig.get_unique_ivals().index(i)], color = fig.get_color(i), edgecolor = default_edgecolor, label = i)
+            ax1.bar(xlabels, s[k], bottom = b[k], color = fig.get_color(i), edgecolor = default_edgecolor, label = i)
 
     else:
         
         # accumulate data
-        s = [0.] * len(xkeys) # amount organized by each catagorey
-        t = 0. # total amount 
-        x = fig.get_xval_list()
-        y = fig.get_yval_list()
-        for i in range(len(y)):
-            if x[i] not in xkeys:
-                continue
-            s[xkeys.index(x[i])] += y[i]
-            t += y[i]
+        s = sum_by_category(x, y, xkeys)
 
         # isolation values have not been specified
         ax1.bar(xlabels, s, color = fig.get_color(), edgecolor = default_edgecolor)
@@ -376,12 +557,8 @@ def gen_bar_chart (fig = None, xlabel_dict = None, stack = True, show = True, sa
 
     # set y-axis min and max, labels
     # ylim = plt.ylim(fig.get_yaxis_min(), fig.get_yaxis_max())
-    if fig.get_title_label() is not None:
-        plt.suptitle(fig.get_title_label().get_label(), fontsize = fig.get_title_label().get_size())
-    if fig.get_subtitle_label() is not None:
-        plt.title(fig.get_subtitle_label().get_label(), fontsize = fig.get_subtitle_label().get_size())
-    plt.xlabel(fig.get_xaxis_label().get_label(), fontsize = fig.get_xaxis_label().get_size())
-    plt.ylabel(fig.get_yaxis_label().get_label(), fontsize = fig.get_yaxis_label().get_size())
+    set_title_labels(fig, f, ax1)
+    set_axis_labels(fig, ax1)
 
     # add legend
     if fig.has_ivals():
@@ -394,12 +571,10 @@ def gen_bar_chart (fig = None, xlabel_dict = None, stack = True, show = True, sa
         ax1.set_yticks(fig.get_yaxis_minor_ticks(), minor = True)
 
     # save and show for user
-    if save:
-        plt.savefig(fig.get_saveas(), dpi = fig.get_dpi(), bbox_inches='tight')
-    if show:
-        plt.show()
-
-    plt.close(f)
+    if layout == 'fixed' and owned:
+        fix_layout('bar', fig, f, ax1, 'best')
+    finish(fig, f, owned = owned, save = save, show = show, bbox_inches = None if layout == 'fixed' else 'tight')
+    return ax1
 
 
 
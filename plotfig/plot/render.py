@@ -0,0 +1,385 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: render.py
+## PURPOSE: contains methods for drawing Figure objects onto explicit matplotlib figures and axes
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import io
+import time
+import threading
+import numpy as np
+import matplotlib.image as mimage
+import matplotlib.figure as mfigure
+import matplotlib.legend as mlegend
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+# local
+from plot.figure import raster_filetypes
+from plot.writer import get_active_queue
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for rendering
+default_figsize = None # size of figure in inches, 'None' uses matplotlib default
+default_legendloc = 'best'
+default_bbox_inches = 'tight'
+default_pad_inches = 0.1 # padding added to tight bounding box when saving, matches matplotlib default
+pil_formats = {'.png': 'png', '.tif': 'tiff'} # name of each raster file type used by pillow
+default_legend_max_entries = 12 # maximum number of entries in compact legend
+layout_modes = ['tight', 'fixed'] # 'tight' measures each figure when saving, 'fixed' reuses margins per layout shape
+default_layout = 'tight'
+
+## margins computed for each layout shape, shared by every figure rendered in the process
+layout_cache = {}
+
+## figures captured by each thread instead of being saved, see 'capture_figures'
+captured = threading.local()
+
+
+#############
+## METHODS ##
+#############
+
+def new_figure (figsize = default_figsize, dpi = None, show = False):
+    """ returns new matplotlib figure.
+
+    figures are created with their own Agg canvas, rather than through
+    pyplot, so they hold no global state and can be drawn in several
+    threads at once. figures which are shown to the user must be created
+    by pyplot, which attaches them to the interactive backend.
+
+    Parameters:
+    -----------
+    figsize : (float, float) (optional)
+        width and height of figure in inches.
+    dpi : int (optional)
+        resolution of figure.
+    show : bool (optional, default is 'False')
+        if 'True', figure is created by pyplot so that it can be shown.
+
+    Returns:
+    --------
+    matplotlib.figure.Figure
+        empty figure.
+    """
+    if show:
+        return plt.figure(figsize = figsize, dpi = dpi)
+    f = mfigure.Figure(figsize = figsize, dpi = dpi)
+    FigureCanvasAgg(f)
+    return f
+
+def get_axes (ax = None, figsize = default_figsize, show = False):
+    """ returns figure and axes used to draw plot.
+
+    Parameters:
+    -----------
+    ax : matplotlib.axes.Axes (optional)
+        axes supplied by caller. if 'None', new figure and axes are created.
+    figsize : (float, float) (optional)
+        width and height of new figure in inches.
+    show : bool (optional, default is 'False')
+        if 'True', new figure is created by pyplot so that it can be shown.
+
+    Returns:
+    --------
+    (matplotlib.figure.Figure, matplotlib.axes.Axes, bool)
+        figure, axes, and 'True' if the figure was created by this method.
+    """
+    if ax is not None:
+        return ax.figure, ax, False
+    f = new_figure(figsize = figsize, show = show)
+    return f, f.add_subplot(111), True
+
+def set_title_labels (fig = None, f = None, ax = None):
+    """ adds Figure title to matplotlib figure and subtitle to axes. """
+    if fig.get_title_label() is not None:
+        f.suptitle(fig.get_title_label().get_label(), fontsize = fig.get_title_label().get_size())
+    if fig.get_subtitle_label() is not None:
+        ax.set_title(fig.get_subtitle_label().get_label(), fontsize = fig.get_subtitle_label().get_size())
+
+def set_axis_labels (fig = None, ax = None):
+    """ adds Figure x- and y-axis labels to axes. """
+    ax.set_xlabel(fig.get_xaxis_label().get_label(), fontsize = fig.get_xaxis_label().get_size())
+    ax.set_ylabel(fig.get_yaxis_label().get_label(), fontsize = fig.get_yaxis_label().get_size())
+
+def set_axis_scales (fig = None, ax = None):
+    """ applies Figure logscales to axes. """
+    if fig.xaxis_is_logscale():
+        ax.set_xscale(fig.get_xaxis_scale(), base = fig.get_xaxis_scale_base())
+    if fig.yaxis_is_logscale():
+        ax.set_yscale(fig.get_yaxis_scale(), base = fig.get_yaxis_scale_base())
+
+def set_axis_ticks (fig = None, ax = None):
+    """ applies Figure major and minor ticks for x- and y-axis to axes. """
+    if fig.yaxis_has_major_ticks():
+        ax.set_yticks(fig.get_yaxis_major_ticks())
+        if fig.yaxis_has_minor_ticks():
+            ax.set_yticks(fig.get_yaxis_minor_ticks(), minor = True)
+    if fig.xaxis_has_major_ticks():
+        ax.set_xticks(fig.get_xaxis_major_ticks())
+        if fig.xaxis_has_minor_ticks():
+            ax.set_xticks(fig.get_xaxis_minor_ticks(), minor = True)
+
+def add_legend (ax = None, handles = None, legendloc = default_legendloc, caller = "render.add_legend()"):
+    """ adds legend to axes.
+
+    Parameters:
+    -----------
+    ax : matplotlib.axes.Axes
+        axes legend is added to.
+    handles : List[matplotlib.artist.Artist]
+        artists shown in legend.
+    legendloc : str
+        matplotlib legend location, or 'above' to place legend above axes.
+    caller : str
+        name of method reported in error messages.
+
+    Returns:
+    --------
+    matplotlib.legend.Legend
+        legend added to axes.
+    """
+    if legendloc in mlegend.Legend.codes.keys():
+        # matplotlib legend defaults
+        return ax.legend(handles = handles, loc = legendloc)
+    elif legendloc == "above":
+        # custom formatting - add legend above plot
+        return ax.legend(handles = handles, bbox_to_anchor = (0, 1.02, 1, .02), loc = "lower left", ncol = 3)
+    print("ERROR :: {0} :: unable to place legend in '{1}'. Using default legend location '{2}'.".format(caller, legendloc, default_legendloc))
+    return ax.legend(handles = handles, loc = default_legendloc)
+
+def compact_handles (handles = None, max_entries = default_legend_max_entries):
+    """ returns evenly spaced subset of legend handles, including the first and last.
+
+    Parameters:
+    -----------
+    handles : List[matplotlib.artist.Artist]
+        artists shown in legend, one per series.
+    max_entries : int (optional, default is 'default_legend_max_entries')
+        maximum number of handles returned.
+
+    Returns:
+    --------
+    List[matplotlib.artist.Artist]
+        handles shown in legend.
+    """
+    if len(handles) <= max_entries:
+        return handles
+    idx = np.unique(np.linspace(0, len(handles) - 1, max_entries).round().astype(int))
+    return [handles[k] for k in idx]
+
+def get_tick_label_length (axis = None):
+    """ returns length of the longest major tick label on axis, formatted without drawing the figure. """
+    labels = axis.get_major_formatter().format_ticks(axis.get_majorticklocs())
+    return max([len(l) for l in labels], default = 0)
+
+def get_layout_shape (kind = None, fig = None, f = None, ax = None, legendloc = None):
+    """ returns key identifying the properties of a figure which determine its margins.
+
+    two figures with the same shape have the same margins, so the
+    margins measured for one can be reused for the other. the shape is
+    defined by the type of plot, the figure size, the presence and size
+    of the title, subtitle and axis labels, the length of the tick
+    labels, and the legend location.
+
+    Parameters:
+    -----------
+    kind : str
+        type of plot, e.g. 'plot' or 'scatter'.
+    fig : plot.figure.Figure
+        Figure drawn.
+    f : matplotlib.figure.Figure
+        figure drawn.
+    ax : matplotlib.axes.Axes
+        axes drawn.
+    legendloc : str
+        location of legend.
+
+    Returns:
+    --------
+    tuple
+        layout shape.
+    """
+    def label_shape (l):
+        return None if l is None or not l.get_label() else l.get_size()
+    legend = ax.get_legend()
+    n_legend = 0 if legend is None else len(legend.get_texts())
+    return (kind, tuple(f.get_size_inches()),
+        label_shape(fig.get_title_label()), label_shape(fig.get_subtitle_label()),
+        label_shape(fig.get_xaxis_label()), label_shape(fig.get_yaxis_label()),
+        get_tick_label_length(ax.xaxis), get_tick_label_length(ax.yaxis),
+        legendloc, n_legend if legendloc == "above" else n_legend > 0)
+
+def fix_layout (kind = None, fig = None, f = None, ax = None, legendloc = None):
+    """ assigns margins to figure, measuring them only for the first figure of each shape.
+
+    the first figure of each shape is laid out with 'tight_layout', and
+    its margins are stored in 'layout_cache'. later figures with the same
+    shape reuse those margins, so they can be saved without
+    'bbox_inches = tight', which measures the figure with an extra draw.
+
+    Returns:
+    --------
+    tuple
+        layout shape of figure, see 'get_layout_shape'.
+    """
+    shape = get_layout_shape(kind, fig, f, ax, legendloc)
+    params = layout_cache.get(shape)
+    if params is None:
+        f.tight_layout()
+        p = f.subplotpars
+        params = {'left': p.left, 'right': p.right, 'bottom': p.bottom, 'top': p.top}
+        layout_cache[shape] = params
+    else:
+        f.subplots_adjust(**params)
+    return shape
+
+def clear_layout_cache ():
+    """ discards margins measured for each layout shape. """
+    layout_cache.clear()
+
+def finish (fig = None, f = None, owned = True, save = True, show = True, bbox_inches = default_bbox_inches):
+    """ saves and shows matplotlib figure, then releases it.
+
+    Parameters:
+    -----------
+    fig : plot.figure.Figure
+        Figure containing save location and dpi.
+    f : matplotlib.figure.Figure
+        figure which was drawn.
+    owned : bool (optional, default is 'True')
+        'True' if figure was created by the renderer, rather than supplied
+        by the caller. only figures owned by the renderer are closed.
+    save : bool (optional, default is 'True')
+        if 'True', figure is saved to each path in 'fig.get_saveas_list()',
+        or captured if the calling thread is capturing figures.
+    show : bool (optional, default is 'True')
+        if 'True', figure is shown to the user.
+    bbox_inches : str (optional, default is 'tight')
+        passed to 'savefig'.
+
+    Returns:
+    --------
+    None
+    """
+    if save:
+        if getattr(captured, 'figures', None) is not None:
+            captured.figures.append((f, bbox_inches))
+        else:
+            save_figure(fig, f, bbox_inches)
+    if show:
+        plt.show()
+    if owned and is_pyplot_figure(f):
+        plt.close(f)
+
+def capture_figures (start = True):
+    """ starts or stops capturing figures in the calling thread.
+
+    while capturing, figures which would be saved are kept in memory
+    instead, along with the bounding box they would be saved with.
+
+    Parameters:
+    -----------
+    start : bool (optional, default is 'True')
+        if 'True', capturing starts, otherwise it stops.
+
+    Returns:
+    --------
+    List[(matplotlib.figure.Figure, str or None)]
+        figures captured since capturing started, and their bounding boxes.
+        empty when capturing starts.
+    """
+    figures = getattr(captured, 'figures', None)
+    captured.figures = [] if start else None
+    return [] if figures is None or start else figures
+
+def get_tight_bbox (f = None, dpi = None):
+    """ returns tight bounding box of figure in inches, padded by 'default_pad_inches', measured without drawing. """
+    f.set_dpi(dpi)
+    return f.get_tightbbox(f.canvas.get_renderer()).padded(default_pad_inches)
+
+def save_figure (fig = None, f = None, bbox_inches = default_bbox_inches):
+    """ saves matplotlib figure as each file type assigned to Figure, drawing it as few times as possible.
+
+    a figure saved as a single file type is passed to 'savefig'. otherwise
+    the tight bounding box is measured once and shared by every file type.
+    raster file types with the same dpi share one draw: the first is saved
+    with 'savefig', the rest are encoded from the RGBA buffer left in the
+    Agg canvas. vector file types are drawn by their own backend.
+
+    if the calling thread has activated a 'writer.SaveQueue', each raster
+    is drawn into a copy of the Agg buffer, which is encoded and written
+    by the queue, so that the caller can render the next figure. the
+    result is also recorded with 'fig.set_saved', so that the caller can
+    wait for its writes with 'fig.get_save_futures'.
+
+    Parameters:
+    -----------
+    fig : plot.figure.Figure
+        Figure containing save locations, file types and their options.
+    f : matplotlib.figure.Figure
+        figure which was drawn.
+    bbox_inches : str or matplotlib.transforms.Bbox (optional, default is 'tight')
+        passed to 'savefig'.
+
+    Returns:
+    --------
+    Dict[float or concurrent.futures.Future]
+        maps each path saved to the time taken to save it, in seconds, or
+        to the future of its write if it was queued.
+    """
+    filetypes = fig.get_filetypes()
+    queue = get_active_queue()
+    times = {}
+    if len(filetypes) == 1 and queue is None:
+        t0 = time.perf_counter()
+        f.savefig(fig.get_saveas(), bbox_inches = bbox_inches, **fig.get_filetype_options())
+        times[fig.get_saveas()] = time.perf_counter() - t0
+        fig.set_saved(times)
+        return times
+    t0 = time.perf_counter()
+    if bbox_inches == 'tight' and len(filetypes) > 1:
+        bbox_inches = get_tight_bbox(f, fig.get_dpi())
+    shared = time.perf_counter() - t0
+    agg = isinstance(f.canvas, FigureCanvasAgg)
+    drawn = {} # dpi of each raster drawn by the Agg canvas
+    for t in filetypes:
+        t0 = time.perf_counter()
+        saveas = fig.get_saveas(t)
+        options = fig.get_filetype_options(t)
+        dpi = options['dpi']
+        raster = t in raster_filetypes and agg
+        if raster and queue is not None and drawn.get('dpi') != dpi:
+            # draw without encoding, then copy buffer so the canvas can be reused
+            f.savefig(io.BytesIO(), format = 'raw', bbox_inches = bbox_inches, dpi = dpi)
+            drawn = {'dpi': dpi, 'buffer': np.array(f.canvas.buffer_rgba())}
+        if raster and drawn.get('dpi') == dpi:
+            # reuse buffer drawn by the previous raster
+            if queue is not None:
+                times[saveas] = queue.submit(saveas, write_buffer, drawn['buffer'], saveas, t, dpi, options.get('pil_kwargs'))
+                continue
+            write_buffer(drawn['buffer'], saveas, t, dpi, options.get('pil_kwargs'))
+        else:
+            f.savefig(saveas, bbox_inches = bbox_inches, **options)
+            if raster:
+                drawn = {'dpi': dpi, 'buffer': np.asarray(f.canvas.buffer_rgba())}
+        times[saveas] = time.perf_counter() - t0 + shared
+        shared = 0.
+    fig.set_saved(times)
+    return times
+
+def write_buffer (buffer = None, saveas = None, filetype = None, dpi = None, pil_kwargs = None):
+    """ encodes RGBA buffer drawn by the Agg canvas, and writes it to 'saveas' as raster file type. """
+    mimage.imsave(saveas, buffer, format = pil_formats[filetype], dpi = dpi, pil_kwargs = pil_kwargs)
+
+def is_pyplot_figure (f = None):
+    """ returns 'True' if matplotlib figure is managed by pyplot. """
+    return getattr(f.canvas, 'manager', None) is not None
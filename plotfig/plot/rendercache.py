@@ -0,0 +1,203 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: rendercache.py
+## PURPOSE: contains on-disk cache which skips rendering figures that have been rendered before
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import os
+import shutil
+import numpy as np
+import matplotlib
+from concurrent.futures import wait
+# local
+from plot.cache import DiskCache, make_key, default_cache_bytes
+from plot.writer import get_active_queue
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for RenderCache class
+render_cache_version = 1 # incremented when generators change the images they draw
+render_file_name = "figure" # name of each rendered file within cache entry, followed by its file type
+## Figure attributes which do not change the rendered image
+ignored_figure_attributes = ['store', 'dirty', 'cache', 'cache_content_hash', 'savedir', 'filename', 'sources', 'user_limits']
+## generator options which do not change the rendered image
+ignored_generator_options = ['show', 'save', 'ax']
+
+
+#############
+## METHODS ##
+#############
+
+def get_state (obj = None):
+    """ returns nested tuples describing object, with a 'repr' which does not depend on the process.
+
+    dictionaries are sorted by key, numpy arrays are described by their
+    data type, shape and bytes, and objects defined in the 'plot' package,
+    such as 'Axis' and 'Label', by their attributes. methods are described
+    by their module and name.
+
+    Parameters:
+    -----------
+    obj : object
+        object described.
+
+    Returns:
+    --------
+    tuple, str, int, float, bool or None
+        description of object.
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((repr(k), get_state(v)) for k, v in obj.items()))
+    if isinstance(obj, (set, frozenset)):
+        return tuple(sorted(repr(get_state(v)) for v in obj))
+    if isinstance(obj, (list, tuple)):
+        return tuple(get_state(v) for v in obj)
+    if isinstance(obj, np.ndarray):
+        return ('ndarray', str(obj.dtype), obj.shape, obj.tobytes() if obj.dtype.kind != 'O' else repr(obj.tolist()))
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if callable(obj) and hasattr(obj, '__qualname__'):
+        return (getattr(obj, '__module__', None), obj.__qualname__)
+    if type(obj).__module__.startswith('plot.') and hasattr(obj, '__dict__'):
+        return (type(obj).__name__, get_state(vars(obj)))
+    return obj
+
+def get_figure_state (fig = None):
+    """ returns description of every Figure attribute which changes the rendered image, apart from its data.
+
+    derived properties, such as axis limits and colors, are refreshed first.
+    the save location is not included, so the same figure saved to two
+    locations has the same state.
+
+    Parameters:
+    -----------
+    fig : Figure
+        Figure described.
+
+    Returns:
+    --------
+    tuple
+        description of Figure formatting.
+    """
+    fig.refresh()
+    return get_state({k: v for k, v in vars(fig).items() if k not in ignored_figure_attributes})
+
+
+#############
+## CLASSES ##
+#############
+
+class RenderCache (DiskCache):
+    """ size-bounded cache of rendered figures, addressed by their contents.
+
+    the key of each figure is the digest of its data, formatting, and the
+    generator and options used to draw it. if an image has been stored
+    for the key, it is copied to the save location of the Figure instead
+    of drawing the figure. otherwise the figure is drawn and saved, and
+    the saved image is stored in the cache. least recently used images
+    are removed when the cache grows beyond 'max_bytes'.
+
+    styles applied through 'matplotlib.rcParams' are not part of the key,
+    so the cache should be cleared when they change.
+
+    Attributes:
+    -----------
+    directory : str
+        path to directory containing cached images.
+    max_bytes : int
+        maximum number of bytes stored in cache.
+    hits : int
+        number of figures copied from the cache.
+    misses : int
+        number of figures drawn.
+
+    Methods:
+    --------
+    get_key, render, put_written
+    """
+
+    def __init__ (self, directory = None, max_bytes = default_cache_bytes):
+        DiskCache.__init__(self, directory, max_bytes = max_bytes)
+
+    def __repr__ (self):
+        return "RenderCache('{0}', max_bytes = {1})".format(self.directory, self.max_bytes)
+
+    def get_key (self, fig = None, generator = None, options = None):
+        """ returns key identifying image drawn by generator.
+
+        Parameters:
+        -----------
+        fig : Figure
+            Figure drawn.
+        generator : callable
+            method used to draw Figure, e.g. 'plot.plot.gen_plot'.
+        options : Dict (optional)
+            keyword arguments passed to generator.
+
+        Returns:
+        --------
+        str
+            key used to store image in cache.
+        """
+        options = {} if options is None else {k: v for k, v in options.items() if k not in ignored_generator_options}
+        data = fig.store.get_digest() if fig.store is not None else None
+        return make_key(render_cache_version, matplotlib.__version__, get_state(generator), get_state(options), data, get_figure_state(fig))
+
+    def render (self, fig = None, generator = None, **options):
+        """ saves image of Figure, copying it from the cache if it has been drawn before.
+
+        Parameters:
+        -----------
+        fig : Figure
+            Figure drawn, saved to each path in 'fig.get_saveas_list()'.
+        generator : callable
+            method used to draw Figure, e.g. 'plot.plot.gen_plot'.
+        options : keyword arguments
+            passed to generator. figures are never shown, and are always saved.
+
+        Returns:
+        --------
+        bool
+            'True' if image was copied from the cache, 'False' if it was drawn.
+        """
+        if fig is None or generator is None:
+            print("ERROR :: RenderCache.render() :: must specify 'fig' and 'generator'.")
+            return False
+        options['show'] = False
+        options['save'] = True
+        options.pop('ax', None)
+        key = self.get_key(fig, generator, options)
+        files = {render_file_name + t: fig.get_saveas(t) for t in fig.get_filetypes()}
+        paths = self.get_files(key, list(files.keys()))
+        if paths is not None:
+            try:
+                for path, saveas in zip(paths, files.values()):
+                    shutil.copyfile(path, saveas)
+                return True
+            except OSError:
+                # entry was evicted before it could be copied
+                self.hits -= 1
+                self.misses += 1
+        generator(fig, **options)
+        queue = get_active_queue()
+        if queue is not None:
+            # files are stored once the writer threads have written them
+            queue.submit(None, self.put_written, key, files, queue.get_futures(files.values()))
+        else:
+            self.put_written(key, files)
+        return False
+
+    def put_written (self, key = None, files = None, futures = None):
+        """ stores rendered files in cache entry, once the writes in 'futures' have finished. """
+        if futures:
+            wait(futures)
+        if all(os.path.isfile(saveas) for saveas in files.values()):
+            self.put_files(key, files)
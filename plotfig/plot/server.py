@@ -0,0 +1,389 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: server.py
+## PURPOSE: contains local http server which renders figures described by a FigureSpec with a pool of warm worker processes
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import collections
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+# local
+from plot.figure import Figure
+from plot.spec import FigureSpec
+from plot.batch import generators, default_generator, init_worker
+from plot.memory import render_bytes
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for RenderServer class
+default_host = "127.0.0.1"
+default_port = 8000
+default_max_body_bytes = 64 << 20 # largest request accepted, 64 MiB
+n_latency_samples = 1000 # number of recent requests used for latency percentiles
+
+## content type returned for each file type
+content_types = {
+    '.png': "image/png",
+    '.tif': "image/tiff",
+    '.pdf': "application/pdf",
+    '.svg': "image/svg+xml"}
+
+
+#############
+## METHODS ##
+#############
+
+def build_figure (request = None, allow_files = False):
+    """ returns Figure described by request.
+
+    Parameters:
+    -----------
+    request : Dict or FigureSpec
+        FigureSpec written as json, see 'Figure.to_spec'. its data must be
+        included inline, e.g. with 'Figure.to_spec(data = True)', unless
+        'allow_files' is 'True'. the save location is ignored, since the
+        image is returned rather than saved.
+    allow_files : bool (optional, default is 'False')
+        if 'True', the spec may read data from csv files on the server.
+
+    Returns:
+    --------
+    Figure
+        Figure containing data and formatting.
+    """
+    spec = request.to_dict() if isinstance(request, FigureSpec) else dict(request)
+    if spec.get('sources') and not allow_files:
+        raise ValueError("spec reads data from files, which is not allowed by the server. include data in spec with 'Figure.to_spec(data = True)'.")
+    if not spec.get('data') and not spec.get('sources'):
+        raise ValueError("spec does not contain any data.")
+    # only the file types and their options are used, nothing is written
+    spec['saveas'] = {k: v for k, v in spec.get('saveas', {}).items() if k in ['types', 'options']}
+    fig = Figure.from_spec(FigureSpec(spec))
+    if fig is None:
+        raise ValueError("unable to build Figure from spec.")
+    return fig
+
+def render_request (request = None, allow_files = False):
+    """ renders figure described by request, in a worker process.
+
+    Parameters:
+    -----------
+    request : Dict or FigureSpec
+        FigureSpec written as json, see 'build_figure'. the figure is drawn
+        by the generator named in the spec with its options, and returned
+        as the first file type in the spec.
+    allow_files : bool (optional, default is 'False')
+        if 'True', the spec may read data from csv files on the server.
+
+    Returns:
+    --------
+    (bytes, str)
+        contents of image, and its content type.
+    """
+    fig = build_figure(request, allow_files)
+    spec = request if isinstance(request, FigureSpec) else FigureSpec(request)
+    generator = spec.get_generator() or default_generator
+    if generator not in generators:
+        raise ValueError("unknown generator '{0}', must be one of {1}.".format(generator, list(generators.keys())))
+    options = spec.get_options()
+    if not isinstance(options, dict):
+        raise ValueError("'options' must map generator arguments to values.")
+    try:
+        body = render_bytes(fig, generators[generator], filetype = fig.filetype, **options)
+    except SystemExit:
+        # generators exit when they are not passed a Figure
+        body = None
+    if body is None:
+        raise ValueError("generator '{0}' did not draw a figure.".format(generator))
+    return body, content_types[fig.filetype]
+
+def warm_up ():
+    """ renders a small figure, so that fonts and caches are loaded before the first request. """
+    render_request({'data': {'x': [0., 1.], 'y': [0., 1.]}})
+
+def init_server_worker ():
+    """ prepares worker process for rendering, then warms it up. """
+    init_worker()
+    warm_up()
+
+def main (args = None):
+    """ command line entry for serving figures over http.
+
+    Usage:
+    ------
+    python -m plot.server --port 8000 --workers 4
+
+    POST /render with a FigureSpec written as json, see 'render_request',
+    returns the image. GET /stats returns the server counters, GET /health returns 'ok'.
+
+    Returns:
+    --------
+    int
+        '0' when the server is stopped.
+    """
+    p = argparse.ArgumentParser(prog = "plot.server", description = "Render figures on request over http, with a pool of warm worker processes.")
+    p.add_argument("--host", default = default_host, help = "address server listens on.")
+    p.add_argument("-p", "--port", type = int, default = default_port, help = "port server listens on.")
+    p.add_argument("-w", "--workers", type = int, default = None, help = "number of worker processes, defaults to number of cpus.")
+    p.add_argument("--allow-files", action = "store_true", help = "allow specs to read data from csv files on the server.")
+    parsed = p.parse_args(args)
+
+    server = RenderServer(workers = parsed.workers, allow_files = parsed.allow_files)
+    server.start(parsed.host, parsed.port)
+    print("serving figures on http://{0}:{1}/ with {2} workers.".format(parsed.host, server.get_port(), server.workers))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
+
+
+#############
+## CLASSES ##
+#############
+
+class RenderServer (object):
+    """ local http server which renders figures with a pool of worker processes.
+
+    worker processes are started, and each renders a small figure, before
+    the server accepts requests, so that no request pays for importing
+    pandas and matplotlib. each request is handled in its own thread,
+    which waits for a worker to render the figure.
+
+    Attributes:
+    -----------
+    workers : int
+        number of worker processes.
+    processes : bool
+        if 'False', figures are rendered in a pool of threads.
+    allow_files : bool
+        if 'True', specs may read data from csv files on the server.
+    httpd : http.server.ThreadingHTTPServer
+        server accepting requests, or 'None' before 'start' is called.
+    n_requests : int
+        number of render requests received.
+    n_failed : int
+        number of render requests which failed.
+    n_pending : int
+        number of render requests waiting for, or being rendered by, a worker.
+    latencies : collections.deque
+        time taken by recent render requests, in seconds.
+
+    Methods:
+    --------
+    start, serve_forever, shutdown, render, get_stats, get_port
+    """
+
+    def __init__ (self, workers = None, processes = True, allow_files = False):
+        if workers is None or workers < 1:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.processes = processes
+        self.allow_files = allow_files
+        self.pool = None
+        self.httpd = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.n_requests = 0
+        self.n_failed = 0
+        self.n_pending = 0
+        self.total_seconds = 0.
+        self.max_seconds = 0.
+        self.latencies = collections.deque(maxlen = n_latency_samples)
+
+    def start (self, host = default_host, port = default_port, background = False):
+        """ starts and warms worker pool, then binds server to address.
+
+        each worker renders a small figure when it starts. one job is
+        submitted for each worker before any has finished starting, so
+        that every worker is started, and warm, before requests are served.
+
+        Parameters:
+        -----------
+        host : str (optional, default is '127.0.0.1')
+            address server listens on.
+        port : int (optional, default is '8000')
+            port server listens on, '0' selects a free port.
+        background : bool (optional, default is 'False')
+            if 'True', requests are served from a background thread.
+
+        Returns:
+        --------
+        None
+        """
+        if self.processes:
+            self.pool = ProcessPoolExecutor(max_workers = self.workers, initializer = init_server_worker)
+        else:
+            # threads share the caches of the server process, which is warmed once
+            warm_up()
+            self.pool = ThreadPoolExecutor(max_workers = self.workers)
+        wait([self.pool.submit(os.getpid) for w in range(self.workers)])
+        self.httpd = ThreadingHTTPServer((host, port), RenderHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.app = self
+        if background:
+            self.thread = threading.Thread(target = self.httpd.serve_forever, daemon = True)
+            self.thread.start()
+
+    def serve_forever (self):
+        """ serves requests until 'shutdown' is called. """
+        self.httpd.serve_forever()
+
+    def shutdown (self):
+        """ stops accepting requests, then stops worker pool. """
+        if self.httpd is not None:
+            if self.thread is not None:
+                self.httpd.shutdown()
+                self.thread.join()
+                self.thread = None
+            self.httpd.server_close()
+            self.httpd = None
+        if self.pool is not None:
+            self.pool.shutdown(wait = True)
+            self.pool = None
+
+    def get_port (self):
+        """ returns port server is bound to. """
+        return self.httpd.server_address[1]
+
+    def render (self, request = None):
+        """ renders request in worker pool, recording its latency.
+
+        Parameters:
+        -----------
+        request : Dict
+            FigureSpec written as json, see 'render_request'.
+
+        Returns:
+        --------
+        (bytes, str)
+            contents of image, and its content type.
+        """
+        t0 = time.perf_counter()
+        with self.lock:
+            self.n_requests += 1
+            self.n_pending += 1
+        try:
+            return self.pool.submit(render_request, request, self.allow_files).result()
+        except Exception:
+            with self.lock:
+                self.n_failed += 1
+            raise
+        finally:
+            dt = time.perf_counter() - t0
+            with self.lock:
+                self.n_pending -= 1
+                self.total_seconds += dt
+                self.max_seconds = max(self.max_seconds, dt)
+                self.latencies.append(dt)
+
+    def get_stats (self):
+        """ returns dictionary of server counters.
+
+        'queue_depth' is the number of requests waiting for a free worker,
+        latencies are in seconds, and percentiles are computed from the
+        most recent 'n_latency_samples' requests.
+        """
+        with self.lock:
+            lat = sorted(self.latencies)
+            n = self.n_requests
+            stats = {
+                'workers': self.workers,
+                'requests': n,
+                'failed': self.n_failed,
+                'pending': self.n_pending,
+                'queue_depth': max(0, self.n_pending - self.workers),
+                'latency_mean': self.total_seconds / n if n > 0 else 0.,
+                'latency_max': self.max_seconds}
+        stats['latency_p50'] = lat[len(lat) // 2] if lat else 0.
+        stats['latency_p95'] = lat[min(len(lat) - 1, int(0.95 * len(lat)))] if lat else 0.
+        return stats
+
+
+class RenderHandler (BaseHTTPRequestHandler):
+    """ handles http requests sent to RenderServer.
+
+    Methods:
+    --------
+    do_GET, do_POST, send_body, send_json
+    """
+
+    def log_message (self, format, *args):
+        # requests are counted by the server, rather than logged
+        pass
+
+    def send_body (self, code = 200, body = None, content_type = "application/json"):
+        """ sends response with body. """
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json (self, code = 200, obj = None):
+        """ sends response with body encoded as json. """
+        self.send_body(code, json.dumps(obj).encode())
+
+    def do_GET (self):
+        if self.path == "/stats":
+            self.send_json(200, self.server.app.get_stats())
+        elif self.path == "/health":
+            self.send_body(200, b"ok", "text/plain")
+        else:
+            self.send_json(404, {'error': "unknown path '{0}'.".format(self.path)})
+
+    def do_POST (self):
+        if self.path != "/render":
+            self.send_json(404, {'error': "unknown path '{0}'.".format(self.path)})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        if length <= 0 or length > default_max_body_bytes:
+            self.send_json(413 if length > 0 else 400, {'error': "request body must contain between 1 and {0} bytes.".format(default_max_body_bytes)})
+            return
+        try:
+            request = json.loads(self.rfile.read(length))
+            if not isinstance(request, dict):
+                raise ValueError("request must be a json object.")
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+            return
+        try:
+            body, content_type = self.server.app.render(request)
+        except (ValueError, TypeError) as e:
+            # invalid request, or options not accepted by generator
+            self.send_json(400, {'error': str(e)})
+            return
+        except Exception as e:
+            self.send_json(500, {'error': repr(e)})
+            return
+        self.send_body(200, body, content_type)
+
+
+###############
+## ARGUMENTS ##
+###############
+# none
+
+
+############
+## SCRIPT ##
+############
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
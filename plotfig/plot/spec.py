@@ -0,0 +1,321 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: spec.py
+## PURPOSE: contains declarative description of Figure objects, which can be read from and written to json or toml
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import os
+import re
+import copy
+import json
+import math
+import hashlib
+import numpy as np
+try:
+    import tomllib # python 3.11 and later
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for FigureSpec class
+spec_version = 1 # incremented when the meaning of a spec changes
+spec_extensions = ['.json', '.toml'] # file types specs are read from and written to
+## keys which can be written to toml without quotes
+toml_bare_key = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+#############
+## METHODS ##
+#############
+
+def to_builtin (obj = None):
+    """ converts numpy values, tuples and sets to types which can be written as json.
+
+    passed to 'json.dumps' as 'default', which calls it for every value
+    the json encoder does not recognize.
+
+    Parameters:
+    -----------
+    obj : object
+        value converted.
+
+    Returns:
+    --------
+    int, float, bool, str or List
+        built-in equivalent of 'obj'.
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key = repr)
+    if isinstance(obj, (type, np.dtype)):
+        # data types used to parse csv columns are described by their name
+        try:
+            return np.dtype(obj).name
+        except TypeError:
+            pass
+    raise TypeError("unable to describe object of type '{0}' in a spec.".format(type(obj).__name__))
+
+def strip_none (obj = None):
+    """ returns copy of nested dictionaries and lists without dictionary entries which are 'None'.
+
+    toml has no equivalent to 'None', so unassigned values are omitted,
+    and a spec read from json or toml is identical.
+    """
+    if isinstance(obj, dict):
+        return {k: strip_none(v) for k, v in obj.items() if v is not None}
+    if isinstance(obj, list):
+        return [strip_none(v) for v in obj]
+    return obj
+
+def get_toml_key (key = None):
+    """ returns key written as toml, quoted unless it only contains letters, digits, dashes and underscores. """
+    key = str(key)
+    if toml_bare_key.match(key):
+        return key
+    return json.dumps(key, ensure_ascii = False)
+
+def get_toml_value (value = None):
+    """ returns value written as toml.
+
+    Parameters:
+    -----------
+    value : bool, int, float, str, List or Dict
+        value written. dictionaries are written as inline tables.
+
+    Returns:
+    --------
+    str
+        toml representation of value.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "nan"
+        if math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return repr(value)
+    if isinstance(value, str):
+        # json escapes are a subset of toml basic string escapes
+        return json.dumps(value, ensure_ascii = False)
+    if isinstance(value, list):
+        return "[" + ", ".join(get_toml_value(v) for v in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ", ".join("{0} = {1}".format(get_toml_key(k), get_toml_value(v)) for k, v in value.items()) + "}"
+    raise ValueError("unable to write value of type '{0}' as toml.".format(type(value).__name__))
+
+def dump_toml (d = None, path = ()):
+    """ returns nested dictionary written as toml document.
+
+    values are written before tables. dictionaries are written as tables,
+    and lists of dictionaries as arrays of tables.
+
+    Parameters:
+    -----------
+    d : Dict
+        dictionary written.
+    path : tuple (optional)
+        keys of tables containing 'd', when called recursively.
+
+    Returns:
+    --------
+    str
+        toml document.
+    """
+    lines = []
+    tables = []
+    for k, v in d.items():
+        if isinstance(v, dict) or (isinstance(v, list) and len(v) > 0 and all(isinstance(e, dict) for e in v)):
+            tables.append((k, v))
+        else:
+            lines.append("{0} = {1}".format(get_toml_key(k), get_toml_value(v)))
+    for k, v in tables:
+        p = path + (k,)
+        name = ".".join(get_toml_key(s) for s in p)
+        for e in ([v] if isinstance(v, dict) else v):
+            lines.append("")
+            lines.append(("[{0}]" if isinstance(v, dict) else "[[{0}]]").format(name))
+            body = dump_toml(e, p)
+            if body:
+                lines.append(body)
+    return "\n".join(lines).strip("\n")
+
+
+#############
+## CLASSES ##
+#############
+
+class FigureSpec (object):
+    """ declarative description of a Figure, which can be written to json or toml.
+
+    a spec contains the data sources of a Figure and the columns mapped to
+    each axis, its formatting (labels, scales, limits and ticks which were
+    assigned, color map, markers and dpi), where it is saved, and the
+    generator used to draw it. data is only included inline when it did
+    not come from a file. specs are small, immutable, hashable and
+    picklable, so they can be sent to worker processes or used as keys in
+    place of the data they describe. see 'Figure.to_spec' and
+    'Figure.from_spec'.
+
+    Attributes:
+    -----------
+    spec : Dict
+        description of Figure, containing only values which can be written
+        as json or toml.
+    text : str
+        canonical json of 'spec', with sorted keys.
+
+    Methods:
+    --------
+    get, to_dict, get_generator, get_options, get_key, to_json, from_json,
+    to_toml, from_toml, save, load
+    """
+
+    def __init__ (self, spec = None):
+        if isinstance(spec, FigureSpec):
+            spec = spec.spec
+        if spec is None:
+            spec = {}
+        if not isinstance(spec, dict):
+            raise TypeError("spec must be a dictionary, not '{0}'.".format(type(spec).__name__))
+        spec = dict(spec)
+        spec.setdefault('version', spec_version)
+        if spec['version'] > spec_version:
+            raise ValueError("spec version {0} is newer than supported version {1}.".format(spec['version'], spec_version))
+        # round trip through json, so that the spec only contains built-in types
+        self.spec = strip_none(json.loads(json.dumps(spec, default = to_builtin)))
+        self.text = json.dumps(self.spec, sort_keys = True, separators = (',', ':'), ensure_ascii = False)
+
+    def __eq__ (self, other):
+        return isinstance(other, FigureSpec) and self.text == other.text
+
+    def __ne__ (self, other):
+        return not self.__eq__(other)
+
+    def __hash__ (self):
+        return hash(self.text)
+
+    def __getstate__ (self):
+        # only the canonical json is pickled, which is smaller than the dictionary
+        return self.text
+
+    def __setstate__ (self, text):
+        self.text = text
+        self.spec = json.loads(text)
+
+    def __repr__ (self):
+        return "FigureSpec('{0}')".format(self.get_key()[:12])
+
+    def get (self, key = None, default = None):
+        """ returns copy of value assigned to key, or 'default' if the key is not in the spec. """
+        if key not in self.spec:
+            return default
+        return copy.deepcopy(self.spec[key])
+
+    def to_dict (self):
+        """ returns copy of spec as a dictionary. """
+        return copy.deepcopy(self.spec)
+
+    def get_generator (self):
+        """ returns name of generator used to draw Figure, or 'None' if unassigned. """
+        return self.spec.get('generator')
+
+    def get_options (self):
+        """ returns keyword arguments passed to generator. """
+        return self.get('options', {})
+
+    def get_key (self):
+        """ returns hex digest which identifies spec. """
+        return hashlib.sha256(self.text.encode()).hexdigest()
+
+    def to_json (self, indent = None):
+        """ returns spec written as json, with sorted keys. """
+        return json.dumps(self.spec, sort_keys = True, indent = indent, ensure_ascii = False)
+
+    @classmethod
+    def from_json (cls, text = None):
+        """ returns FigureSpec read from json string. """
+        return cls(json.loads(text))
+
+    def to_toml (self):
+        """ returns spec written as toml, with sorted keys. """
+        return dump_toml(json.loads(self.text)) + "\n"
+
+    @classmethod
+    def from_toml (cls, text = None):
+        """ returns FigureSpec read from toml string.
+
+        requires 'tomllib', included with python 3.11 and later, or the
+        'tomli' package for earlier versions.
+        """
+        if tomllib is None:
+            raise ImportError("reading toml requires python 3.11 or later, or the 'tomli' package.")
+        return cls(tomllib.loads(text))
+
+    def save (self, filename = None):
+        """ writes spec to file, as json or toml depending on the file extension.
+
+        Parameters:
+        -----------
+        filename : str
+            path to file ending with one of 'spec_extensions'.
+
+        Returns:
+        --------
+        bool
+            'True' if successful, else 'False'.
+        """
+        ext = os.path.splitext(str(filename))[1].lower()
+        if ext not in spec_extensions:
+            print("ERROR :: FigureSpec.save() :: file extension '{0}' not in 'spec_extensions' {1}.".format(ext, spec_extensions))
+            return False
+        text = self.to_json(indent = 2) + "\n" if ext == ".json" else self.to_toml()
+        with open(filename, "w", encoding = "utf-8") as f:
+            f.write(text)
+        return True
+
+    @classmethod
+    def load (cls, filename = None):
+        """ reads spec from file, as json or toml depending on the file extension.
+
+        Parameters:
+        -----------
+        filename : str
+            path to file ending with one of 'spec_extensions'.
+
+        Returns:
+        --------
+        FigureSpec
+            spec read from file, or 'None' if the file could not be read.
+        """
+        ext = os.path.splitext(str(filename))[1].lower()
+        if ext not in spec_extensions:
+            print("ERROR :: FigureSpec.load() :: file extension '{0}' not in 'spec_extensions' {1}.".format(ext, spec_extensions))
+            return None
+        if not os.path.exists(filename):
+            print("ERROR :: FigureSpec.load() :: unable to find spec file '{0}'.".format(filename))
+            return None
+        with open(filename, "r", encoding = "utf-8") as f:
+            text = f.read()
+        try:
+            return cls.from_json(text) if ext == ".json" else cls.from_toml(text)
+        except (ValueError, TypeError, ImportError) as e:
+            print("ERROR :: FigureSpec.load() :: unable to read spec file '{0}' :: {1}".format(filename, e))
+            return None
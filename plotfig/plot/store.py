@@ -0,0 +1,905 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: store.py
+## PURPOSE: contains columnar data storage used by the Figure class
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import pandas as pd
+import numpy as np
+import copy
+import hashlib
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for ColumnStore class
+default_initial_capacity = 64 # number of rows allocated when store is first initialized
+default_growth_factor = 2 # factor capacity increases by when buffers are full
+category_code_dtype = np.int32 # data type used to store codes for categorical columns
+
+
+#############
+## METHODS ##
+#############
+
+def as_column_array (values = None, n = 1):
+    """ converts list, array, or single value to one-dimensional numpy array.
+
+    single values are broadcast to an array of length 'n'. strings and
+    other non-numerical values are stored as numpy objects, rather than
+    fixed-width unicode arrays, so they behave like pandas object columns.
+
+    Parameters:
+    -----------
+    values : List, numpy.ndarray, pandas.Series, or single value
+        data converted to array.
+    n : int
+        length of array when broadcasting single value.
+
+    Returns:
+    --------
+    numpy.ndarray
+        one-dimensional array containing values.
+    """
+    if isinstance(values, (list, tuple)):
+        arr = np.asarray(values)
+        # unicode, byte strings are stored as the original python objects
+        if arr.dtype.kind in ('U', 'S'):
+            arr = np.array(values, dtype = object)
+    elif isinstance(values, (np.ndarray, pd.Series, pd.Index)):
+        arr = np.asarray(values)
+        if arr.dtype.kind in ('U', 'S'):
+            arr = arr.astype(object)
+    else:
+        # single value, broadcast to the requested length
+        arr = np.full(n, values, dtype = object if isinstance(values, str) else None)
+    return arr.reshape(-1)
+
+def downcast_int_array (arr = None):
+    """ converts integer array to the smallest integer type which holds its values.
+
+    Parameters:
+    -----------
+    arr : numpy.ndarray
+        array to convert, arrays which do not contain integers are returned
+        unchanged.
+
+    Returns:
+    --------
+    numpy.ndarray
+        array with the smallest integer data type possible.
+    """
+    if arr.dtype.kind not in ('i', 'u') or len(arr) == 0:
+        return arr
+    dtype = np.result_type(np.min_scalar_type(arr.min()), np.min_scalar_type(arr.max()))
+    if dtype.itemsize < arr.dtype.itemsize:
+        return arr.astype(dtype)
+    return arr
+
+def read_only (arr = None):
+    """ returns view of array which cannot be written to.
+
+    Parameters:
+    -----------
+    arr : numpy.ndarray
+        array to view.
+
+    Returns:
+    --------
+    numpy.ndarray
+        view sharing memory with 'arr', with the writeable flag unset.
+    """
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+#############
+## CLASSES ##
+#############
+
+## ColumnStore class
+class ColumnStore (object):
+
+    """ contains figure data as numpy buffers, one per column.
+
+    each buffer is allocated with extra capacity which is doubled when
+    full, so appending data in many small batches costs amortized O(1)
+    per row rather than copying every existing row. the data is only
+    materialized as a pandas DataFrame when requested.
+
+    Attributes:
+    -----------
+    buffers : Dict[numpy.ndarray]
+        buffer for each column, only the first 'size' rows contain data.
+        categorical columns store integer codes rather than values.
+    categories : Dict[List]
+        unique values of each categorical column, indexed by code.
+    size : int
+        number of rows stored.
+    capacity : int
+        number of rows allocated in each buffer.
+    stats : Dict[ColumnStats]
+        running statistics for each column.
+    categorical : set
+        columns stored as categorical codes.
+    float32 : set
+        columns with numerical values stored as single precision floats.
+    downcast_ints : bool
+        if 'True', integer values are stored with the smallest integer type.
+
+    Methods:
+    --------
+    set_dtype_policy:
+        assigns how data types are chosen for appended columns.
+    is_categorical:
+        determines if column is stored as categorical codes.
+    get_nbytes:
+        returns number of bytes used by stored rows.
+    get_digest:
+        returns digest identifying the data stored in every column.
+    reset:
+        removes all columns and data from store.
+    get_columns:
+        returns list of column headers.
+    has_column:
+        determines if column exists in store.
+    get_size:
+        returns number of rows stored.
+    get_capacity:
+        returns number of rows allocated.
+    append:
+        appends equal-length arrays to each column.
+    checkpoint:
+        returns state which 'rollback' restores.
+    rollback:
+        removes rows appended since checkpoint.
+    get_column:
+        returns view of data stored in column.
+    get_stats:
+        returns running statistics for column.
+    get_group_index:
+        returns index grouping rows by the values in a column.
+    get_group:
+        returns rows of column that match value in another column.
+    to_df:
+        returns data as pandas DataFrame.
+    """
+
+    def __init__ (self, columns = None, capacity = default_initial_capacity):
+        """ initializes ColumnStore object.
+
+        Parameters:
+        -----------
+        columns : List[str] (optional)
+            column headers, if not provided columns are assigned on first append.
+        capacity : int (optional, default is 'default_initial_capacity')
+            number of rows allocated when buffers are created.
+
+        Returns:
+        --------
+        None
+        """
+        self.set_dtype_policy()
+        self.reset(columns, capacity)
+
+    def __len__ (self):
+        return self.size
+
+    def set_dtype_policy (self, categorical = None, float32 = None, downcast_ints = False):
+        """ assigns how data types are chosen for appended columns.
+
+        categorical columns store each unique value once, and an integer
+        code for each row. columns in 'float32' store numerical values as
+        single precision floats. if 'downcast_ints' is 'True', each chunk
+        of integers is stored with the smallest integer type that holds
+        it. the policy only changes how data is stored; values returned
+        from the store are the same, apart from the lost precision of
+        single precision floats.
+
+        policy applies to data appended after the method is called.
+
+        Parameters:
+        -----------
+        categorical : List[str] (optional)
+            columns stored as categorical codes.
+        float32 : List[str] (optional)
+            columns stored as single precision floats.
+        downcast_ints : bool (optional, default is 'False')
+            determines if integer columns are downcast.
+
+        Returns:
+        --------
+        None
+        """
+        self.categorical = set() if categorical is None else set(categorical)
+        self.float32 = set() if float32 is None else set(float32)
+        self.downcast_ints = bool(downcast_ints)
+
+    def is_categorical (self, col = None):
+        """ returns 'True' if column is stored as categorical codes. """
+        return col in self.categories
+
+    def get_nbytes (self):
+        """ returns number of bytes used by stored rows.
+
+        unused capacity and the python objects referenced by object or
+        categorical columns are not included.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        int
+            bytes used by the first 'size' rows of every buffer.
+        """
+        return sum(self.buffers[c].itemsize * self.size for c in self.columns)
+
+    def get_digest (self):
+        """ returns hexadecimal digest identifying the data stored in every column.
+
+        numerical buffers are hashed as raw bytes, and categorical columns
+        as their codes and categories, so no column is decoded. object
+        columns are hashed with 'pandas.util.hash_array'. two stores with
+        the same digest hold the same columns, data types and rows.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        str
+            sha256 digest of stored rows.
+        """
+        h = hashlib.sha256()
+        for c in self.columns:
+            arr = self.buffers[c][:self.size]
+            h.update(repr((c, str(arr.dtype), self.size)).encode())
+            if c in self.categories:
+                h.update(repr(self.categories[c]).encode())
+            if arr.dtype.kind == 'O':
+                try:
+                    arr = pd.util.hash_array(arr)
+                except TypeError:
+                    # values which cannot be hashed by pandas are hashed by their representation
+                    arr = np.frombuffer(repr(arr.tolist()).encode(), dtype = np.uint8)
+            h.update(np.ascontiguousarray(arr).view(np.uint8).data)
+        return h.hexdigest()
+
+    def reset (self, columns = None, capacity = default_initial_capacity):
+        """ removes all columns and data from store.
+
+        Parameters:
+        -----------
+        columns : List[str] (optional)
+            column headers assigned to store.
+        capacity : int (optional, default is 'default_initial_capacity')
+            number of rows allocated when buffers are created.
+
+        Returns:
+        --------
+        None
+        """
+        self.buffers = {}
+        self.stats = {}
+        self.categories = {}
+        self.category_lookup = {}
+        self.size = 0
+        if capacity is None or not isinstance(capacity, int) or capacity < 1:
+            capacity = default_initial_capacity
+        self.capacity = capacity
+        self.columns = [] if columns is None else list(columns)
+        # cached DataFrame and group indices, removed when data is appended
+        self.clear_cache()
+
+    def clear_cache (self):
+        """ removes DataFrame and group indices built from stored data.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        None
+        """
+        self.df = None
+        self.groups = {}
+        self.grouped_columns = {}
+
+    def get_columns (self):
+        """ returns list of column headers.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        List[str]
+            column headers, in the order they were added.
+        """
+        return list(self.columns)
+
+    def has_column (self, col = None):
+        """ determines if column exists in store.
+
+        Parameters:
+        -----------
+        col : str
+            column header.
+
+        Returns:
+        --------
+        bool
+            'True' if column exists, else 'False'.
+        """
+        return col in self.columns
+
+    def get_size (self):
+        """ returns number of rows stored. """
+        return self.size
+
+    def get_capacity (self):
+        """ returns number of rows allocated in each buffer. """
+        return self.capacity
+
+    def append (self, col_dict = None):
+        """ appends arrays to each column in the store.
+
+        all arrays in 'col_dict' must be the same length. if the store
+        already contains columns, the keys in 'col_dict' must match them
+        exactly. buffers are grown by 'default_growth_factor' whenever
+        the appended rows exceed the allocated capacity. if the data type
+        of the appended rows differs from the buffer, the buffer is
+        promoted to a type which can contain both.
+
+        Parameters:
+        -----------
+        col_dict : Dict[numpy.ndarray]
+            maps column headers to arrays of equal length.
+
+        Returns:
+        --------
+        bool
+            'True' if operation was successful, else 'False'.
+        """
+        if not col_dict:
+            print("ERROR :: ColumnStore.append() :: 'col_dict' must contain at least one column.")
+            return False
+        # check that the keys match the existing columns
+        if self.buffers and set(col_dict.keys()) != set(self.columns):
+            print("ERROR :: ColumnStore.append() :: keys in 'col_dict' do not match store columns.")
+            return False
+        # convert to arrays, check lengths
+        arrays = {c: as_column_array(v) for c, v in col_dict.items()}
+        n = len(next(iter(arrays.values())))
+        for c in arrays:
+            if len(arrays[c]) != n:
+                print("ERROR :: ColumnStore.append() :: arrays in 'col_dict' are uneven.")
+                return False
+        # initialize buffers the first time data is appended
+        if not self.buffers:
+            self.columns = list(arrays.keys())
+            while self.capacity < n:
+                self.capacity *= default_growth_factor
+            for c in self.columns:
+                self.stats[c] = ColumnStats()
+                if c in self.categorical:
+                    self.categories[c] = []
+                    self.category_lookup[c] = {}
+                    self.buffers[c] = np.empty(self.capacity, dtype = category_code_dtype)
+                else:
+                    self.buffers[c] = np.empty(self.capacity, dtype = self.apply_dtype_policy(c, arrays[c]).dtype)
+        # grow the buffers if needed
+        self.reserve(self.size + n)
+        # copy new rows into the buffers, update statistics with new rows only
+        for c in self.columns:
+            self.stats[c].update(arrays[c])
+            arr = self.apply_dtype_policy(c, arrays[c])
+            self.promote(c, arr.dtype)
+            self.buffers[c][self.size:self.size + n] = arr
+        self.size += n
+        self.clear_cache()
+        return True
+
+    def checkpoint (self):
+        """ returns state of store, which 'rollback' restores.
+
+        used to remove rows appended by an operation which fails partway,
+        e.g. a csv file with a malformed row after the first chunk.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        Dict
+            number of rows, statistics and number of categories in each column.
+        """
+        return {'size': self.size, 'stats': copy.deepcopy(self.stats), 'categories': {c: len(v) for c, v in self.categories.items()}}
+
+    def rollback (self, state = None):
+        """ removes rows appended since 'checkpoint' was called.
+
+        buffers keep their capacity and any promoted data type.
+
+        Parameters:
+        -----------
+        state : Dict
+            state returned by 'checkpoint'.
+
+        Returns:
+        --------
+        None
+        """
+        self.size = state['size']
+        self.stats = state['stats']
+        for c, n in state['categories'].items():
+            for u in self.categories[c][n:]:
+                del self.category_lookup[c][u]
+            del self.categories[c][n:]
+        self.clear_cache()
+
+    def apply_dtype_policy (self, col = None, arr = None):
+        """ converts chunk of values to the data type stored in column.
+
+        Parameters:
+        -----------
+        col : str
+            column header.
+        arr : numpy.ndarray
+            values appended to column.
+
+        Returns:
+        --------
+        numpy.ndarray
+            values converted according to the store dtype policy.
+        """
+        if col in self.categories:
+            return self.encode(col, arr)
+        if col in self.float32 and arr.dtype.kind in ('i', 'u', 'f'):
+            return arr.astype(np.float32, copy = False)
+        if self.downcast_ints:
+            return downcast_int_array(arr)
+        return arr
+
+    def encode (self, col = None, arr = None):
+        """ converts values to codes for categorical column.
+
+        unique values which have not been stored in the column before are
+        added to the column categories, in the order they first appear.
+        missing values are assigned code -1.
+
+        Parameters:
+        -----------
+        col : str
+            header of categorical column.
+        arr : numpy.ndarray
+            values appended to column.
+
+        Returns:
+        --------
+        numpy.ndarray
+            integer code for each value.
+        """
+        codes, uniques = pd.factorize(arr, use_na_sentinel = True)
+        lookup = self.category_lookup[col]
+        for u in uniques:
+            if u not in lookup:
+                lookup[u] = len(self.categories[col])
+                self.categories[col].append(u)
+        # map codes within chunk to codes within column, last entry maps missing values
+        lut = np.array([lookup[u] for u in uniques] + [-1], dtype = category_code_dtype)
+        return lut[codes]
+
+    def decode (self, col = None, codes = None):
+        """ converts codes for categorical column to values.
+
+        Parameters:
+        -----------
+        col : str
+            header of categorical column.
+        codes : numpy.ndarray
+            integer codes stored in column.
+
+        Returns:
+        --------
+        numpy.ndarray
+            value corresponding to each code, NaN or 'None' where missing.
+        """
+        cats = as_column_array(self.categories[col])
+        if len(codes) > 0 and codes.min() < 0:
+            # append missing value, which is indexed by code -1
+            cats = np.append(cats, np.nan if cats.dtype.kind in ('i', 'u', 'f') else None)
+        return cats[codes]
+
+    def reserve (self, n = 0):
+        """ grows buffers so that they can hold at least 'n' rows.
+
+        Parameters:
+        -----------
+        n : int
+            minimum number of rows allocated after operation.
+
+        Returns:
+        --------
+        None
+        """
+        if n <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < n:
+            capacity *= default_growth_factor
+        for c in self.columns:
+            buf = np.empty(capacity, dtype = self.buffers[c].dtype)
+            buf[:self.size] = self.buffers[c][:self.size]
+            self.buffers[c] = buf
+        self.capacity = capacity
+
+    def promote (self, col = None, dtype = None):
+        """ changes buffer data type so that it can hold values of 'dtype'.
+
+        Parameters:
+        -----------
+        col : str
+            column header.
+        dtype : numpy.dtype
+            data type of values being added to column.
+
+        Returns:
+        --------
+        None
+        """
+        current = self.buffers[col].dtype
+        if current == dtype:
+            return
+        if current == object or dtype == object:
+            new = np.dtype(object)
+        else:
+            new = np.result_type(current, dtype)
+        if new != current:
+            self.buffers[col] = self.buffers[col].astype(new)
+
+    def get_column (self, col = None):
+        """ returns view of data stored in column.
+
+        Parameters:
+        -----------
+        col : str
+            column header.
+
+        Returns:
+        --------
+        numpy.ndarray
+            read-only view of the first 'size' rows in column buffer, or
+            'None' if column does not exist.
+        """
+        if col not in self.buffers:
+            return None
+        if col in self.categories:
+            # categorical values are decoded into new array
+            return read_only(self.decode(col, self.buffers[col][:self.size]))
+        return read_only(self.buffers[col][:self.size])
+
+    def get_stats (self, col = None):
+        """ returns running statistics for column.
+
+        statistics are updated with each appended chunk, so they never
+        require a scan over all stored rows.
+
+        Parameters:
+        -----------
+        col : str
+            column header.
+
+        Returns:
+        --------
+        ColumnStats
+            statistics for column, or 'None' if column does not exist.
+        """
+        return self.stats.get(col)
+
+    def get_group_index (self, icol = None):
+        """ returns index grouping rows by the values in column 'icol'.
+
+        index is built once and reused until more data is appended.
+
+        Parameters:
+        -----------
+        icol : str
+            column header containing values used to group rows.
+
+        Returns:
+        --------
+        GroupIndex
+            index for column, or 'None' if column does not exist.
+        """
+        if icol not in self.buffers:
+            return None
+        if icol not in self.groups:
+            if icol in self.categories:
+                # codes are already factorized in order of first appearance
+                self.groups[icol] = GroupIndex(codes = self.buffers[icol][:self.size], uniques = self.categories[icol])
+            else:
+                self.groups[icol] = GroupIndex(self.get_column(icol))
+        return self.groups[icol]
+
+    def get_group (self, col = None, icol = None, ival = None):
+        """ returns rows of column 'col' where column 'icol' matches 'ival'.
+
+        the first time a column is grouped, a copy of the column sorted by
+        group is stored so that every group is a contiguous slice. rows
+        within each group keep the order they were appended in.
+
+        Parameters:
+        -----------
+        col : str
+            column header containing values to return.
+        icol : str
+            column header containing values used to group rows.
+        ival : str, float, or int
+            value in 'icol' which rows must match.
+
+        Returns:
+        --------
+        numpy.ndarray
+            read-only view of rows in 'col' which match 'ival', or 'None'
+            if either column does not exist.
+        """
+        if col not in self.buffers:
+            return None
+        index = self.get_group_index(icol)
+        if index is None:
+            return None
+        key = (col, icol)
+        if key not in self.grouped_columns:
+            self.grouped_columns[key] = self.get_column(col)[index.get_order()]
+        start, stop = index.get_bounds(ival)
+        return read_only(self.grouped_columns[key][start:stop])
+
+    def to_df (self):
+        """ returns data as pandas DataFrame.
+
+        DataFrame is built once and reused until more data is appended.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        pandas.DataFrame
+            contains copy of all data in store.
+        """
+        if self.df is None:
+            data = {}
+            for c in self.columns:
+                if c in self.categories:
+                    data[c] = pd.Categorical.from_codes(self.buffers[c][:self.size], categories = pd.Index(self.categories[c]))
+                else:
+                    data[c] = self.get_column(c)
+            self.df = pd.DataFrame(data)
+        return self.df
+
+    @classmethod
+    def from_df (cls, df = None):
+        """ creates ColumnStore containing data in DataFrame.
+
+        Parameters:
+        -----------
+        df : pandas.DataFrame
+            contains data to store.
+
+        Returns:
+        --------
+        ColumnStore
+            store containing a copy of every column in 'df'.
+        """
+        store = cls(capacity = max(len(df), 1))
+        store.append({c: df[c].to_numpy() for c in df.columns})
+        return store
+
+## ColumnStats class
+class ColumnStats (object):
+
+    """ running statistics for one column of numerical data.
+
+    statistics are updated one appended chunk at a time. if non-numerical
+    values are appended, the minimum and maximum are no longer tracked.
+
+    Attributes:
+    -----------
+    count : int
+        number of values appended.
+    nan_count : int
+        number of appended values which are NaN.
+    min : float or int
+        smallest value appended, ignoring NaN.
+    max : float or int
+        largest value appended, ignoring NaN.
+    numeric : bool
+        'True' if every value appended is numerical.
+
+    Methods:
+    --------
+    update:
+        updates statistics with chunk of appended values.
+    is_numeric:
+        determines if every appended value is numerical.
+    get_count:
+        returns number of values appended.
+    get_nan_count:
+        returns number of NaN values appended.
+    get_minimum:
+        returns smallest value appended.
+    get_maximum:
+        returns largest value appended.
+    """
+
+    def __init__ (self):
+        """ initializes empty ColumnStats object. """
+        self.count = 0
+        self.nan_count = 0
+        self.min = None
+        self.max = None
+        self.numeric = True
+
+    def update (self, arr = None):
+        """ updates statistics with chunk of appended values.
+
+        Parameters:
+        -----------
+        arr : numpy.ndarray
+            values appended to column.
+
+        Returns:
+        --------
+        None
+        """
+        self.count += len(arr)
+        if not self.numeric or len(arr) == 0:
+            return
+        if arr.dtype.kind not in ('i', 'u', 'f'):
+            # minimum and maximum cannot be tracked for non-numerical values
+            self.numeric = False
+            self.min = None
+            self.max = None
+            return
+        if arr.dtype.kind == 'f':
+            self.nan_count += int(np.count_nonzero(np.isnan(arr)))
+        # fmin, fmax ignore NaN unless every value is NaN
+        cmin = np.fmin.reduce(arr).item()
+        cmax = np.fmax.reduce(arr).item()
+        if cmin != cmin:
+            # every value in chunk is NaN
+            return
+        self.min = cmin if self.min is None else min(self.min, cmin)
+        self.max = cmax if self.max is None else max(self.max, cmax)
+
+    def is_numeric (self):
+        """ returns 'True' if every value appended is numerical. """
+        return self.numeric
+
+    def get_count (self):
+        """ returns number of values appended. """
+        return self.count
+
+    def get_nan_count (self):
+        """ returns number of NaN values appended. """
+        return self.nan_count
+
+    def get_minimum (self):
+        """ returns smallest value appended, or 'None'. """
+        return self.min
+
+    def get_maximum (self):
+        """ returns largest value appended, or 'None'. """
+        return self.max
+
+## GroupIndex class
+class GroupIndex (object):
+
+    """ groups rows of a column by their unique values.
+
+    rows are factorized into integer codes, which are stable sorted so
+    that the rows belonging to each unique value are contiguous. the
+    position of each group in the sorted order is stored as an offset,
+    so that looking up a group is a slice rather than a mask over every
+    row. missing values (NaN, None) do not belong to any group.
+
+    Attributes:
+    -----------
+    uniques : List
+        unique values, in the order they first appear.
+    lookup : Dict[int]
+        maps each unique value to its position in 'uniques'.
+    order : numpy.ndarray
+        row indices sorted by group.
+    offsets : numpy.ndarray
+        position in 'order' where each group starts, the last entry is
+        the total number of rows.
+
+    Methods:
+    --------
+    get_uniques:
+        returns unique values in order of first appearance.
+    get_order:
+        returns row indices sorted by group.
+    get_bounds:
+        returns start and stop position of group in sorted rows.
+    get_count:
+        returns number of rows in group.
+    """
+
+    def __init__ (self, vals = None, codes = None, uniques = None):
+        """ initializes GroupIndex object from column values.
+
+        if the column has already been factorized, 'codes' and 'uniques'
+        can be provided instead of 'vals'.
+
+        Parameters:
+        -----------
+        vals : numpy.ndarray
+            values used to group rows.
+        codes : numpy.ndarray (optional)
+            integer code for each row, -1 for missing values.
+        uniques : List (optional)
+            unique value corresponding to each code.
+
+        Returns:
+        --------
+        None
+        """
+        if codes is None:
+            codes, uniques = pd.factorize(vals, use_na_sentinel = True)
+        self.uniques = list(uniques)
+        self.lookup = {u: k for k, u in enumerate(self.uniques)}
+        self.order = np.argsort(codes, kind = 'stable')
+        counts = np.bincount(codes[codes >= 0], minlength = len(self.uniques))
+        # rows with missing values are sorted to the front
+        n_missing = len(codes) - int(counts.sum())
+        self.offsets = n_missing + np.concatenate(([0], np.cumsum(counts)))
+
+    def get_uniques (self):
+        """ returns unique values in order of first appearance. """
+        return list(self.uniques)
+
+    def get_order (self):
+        """ returns row indices sorted by group. """
+        return self.order
+
+    def get_bounds (self, ival = None):
+        """ returns start and stop position of group in sorted rows.
+
+        Parameters:
+        -----------
+        ival : str, float, or int
+            unique value corresponding to group.
+
+        Returns:
+        --------
+        (int, int)
+            start and stop position of group in 'order', equal if 'ival'
+            is not a unique value.
+        """
+        k = self.lookup.get(ival)
+        if k is None:
+            return (0, 0)
+        return (int(self.offsets[k]), int(self.offsets[k + 1]))
+
+    def get_count (self, ival = None):
+        """ returns number of rows in group corresponding to 'ival'. """
+        start, stop = self.get_bounds(ival)
+        return stop - start
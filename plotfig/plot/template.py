@@ -0,0 +1,236 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: template.py
+## PURPOSE: contains class for re-rendering the same chart layout with new data
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import numpy as np
+# local
+from plot.plot import gen_plot, gen_scatter, get_plot_arrays, default_scatter_figsize
+from plot.decimate import get_pixel_width
+from plot.render import new_figure, save_figure, get_tight_bbox, default_figsize
+
+
+################
+## PARAMETERS ##
+################
+
+## generators which support templates, and size of the figures they create
+template_generators = {
+    'plot': (gen_plot, default_figsize),
+    'scatter': (gen_scatter, default_scatter_figsize)}
+default_template_generator = 'plot'
+
+
+#############
+## METHODS ##
+#############
+
+def get_ticks (ticks = None):
+    """ returns axis ticks as a tuple, which can be compared, or 'None' if they are unassigned. """
+    if ticks is None:
+        return None
+    return tuple(np.ravel(ticks).tolist())
+
+
+#############
+## CLASSES ##
+#############
+
+class Template (object):
+    """ chart layout which is built once, then redrawn with new data.
+
+    the first Figure rendered by the template builds the matplotlib figure,
+    axes, labels, ticks and legend with 'gen_plot' or 'gen_scatter'. each
+    following Figure only replaces the data held by the existing lines or
+    scatter collections, then saves the figure. the layout is rebuilt if
+    the axis limits, scales, labels or ticks, or the ivals, labels, markers
+    or colors of the Figure differ from those the layout was built with.
+    the tight bounding box of the figure is computed when the layout is
+    built and reused for each save, which avoids drawing the figure twice.
+    titles are updated in place, and the bounding box is only recomputed
+    when their text or size changes.
+
+    Attributes:
+    -----------
+    generator : str
+        name of generator in 'template_generators'.
+    options : Dict
+        keyword arguments passed to generator.
+    figure : matplotlib.figure.Figure
+        figure containing layout.
+    ax : matplotlib.axes.Axes
+        axes containing layout.
+    artists : List[matplotlib.artist.Artist]
+        line or scatter collection drawing each ival.
+    signature : tuple
+        properties of the Figure the layout was built with.
+    bbox : matplotlib.transforms.Bbox
+        tight bounding box of figure, in inches.
+    titles : tuple
+        text and size of the title and subtitle drawn in the figure.
+    n_builds : int
+        number of times layout was built.
+    n_updates : int
+        number of times layout was redrawn with new data.
+
+    Methods:
+    --------
+    render, build, update, save, get_signature, get_titles, reset
+    """
+
+    def __init__ (self, generator = default_template_generator, **options):
+        if generator not in template_generators:
+            print("ERROR :: Template.__init__() :: generator '{0}' does not support templates. Using default generator '{1}'.".format(generator, default_template_generator))
+            generator = default_template_generator
+        self.generator = generator
+        options.pop('ax', None)
+        options.pop('show', None)
+        options.pop('save', None)
+        # artists are updated one ival at a time, so ivals are never collected
+        options.pop('collect', None)
+        if generator == 'scatter':
+            options['density'] = False
+        self.options = options
+        self.n_builds = 0
+        self.n_updates = 0
+        self.reset()
+
+    def reset (self):
+        """ discards layout, so that the next Figure rendered rebuilds it. """
+        self.figure = None
+        self.ax = None
+        self.artists = []
+        self.signature = None
+        self.bbox = None
+        self.titles = None
+
+    def get_signature (self, fig = None):
+        """ returns properties of Figure which require the layout to be rebuilt when they change.
+
+        Parameters:
+        -----------
+        fig : Figure
+            Figure rendered with template.
+
+        Returns:
+        --------
+        tuple
+            axis limits and scales, ivals, the label, marker and color of
+            each ival, and the label and ticks of each axis.
+        """
+        fig.refresh()
+        if fig.has_ivals():
+            ivals = tuple(fig.get_unique_ivals(rev = False))
+            styles = tuple((fig.get_label(i), fig.get_marker(i), tuple(np.ravel(fig.get_color(i)))) for i in ivals)
+        else:
+            ivals = (None,)
+            styles = ((None, fig.get_marker(), None),)
+        axes = tuple((fig.get_axis_label(k).get_label(), fig.get_axis_label(k).get_size(),
+            get_ticks(fig.get_axis_major_ticks(k)), get_ticks(fig.get_axis_minor_ticks(k))) for k in ['x', 'y'])
+        return (fig.get_xaxis_min(), fig.get_xaxis_max(), fig.get_yaxis_min(), fig.get_yaxis_max(),
+            fig.get_xaxis_scale(), fig.get_yaxis_scale(), ivals, styles, axes)
+
+    def get_titles (self, fig = None):
+        """ returns text and size of the title and subtitle of Figure. """
+        return tuple((l.get_label(), l.get_size()) if l is not None else None for l in [fig.get_title_label(), fig.get_subtitle_label()])
+
+    def build (self, fig = None):
+        """ builds layout from Figure, drawing every artist from scratch.
+
+        Parameters:
+        -----------
+        fig : Figure
+            Figure rendered with template.
+
+        Returns:
+        --------
+        None
+        """
+        method, figsize = template_generators[self.generator]
+        self.figure = new_figure(figsize = figsize)
+        self.ax = self.figure.add_subplot(111)
+        method(fig, ax = self.ax, show = False, save = False, **self.options)
+        # artists are added in the same order as the ivals, before any fits
+        n = len(self.signature[6])
+        if self.generator == 'plot':
+            self.artists = list(self.ax.lines[:n])
+        else:
+            self.artists = list(self.ax.collections[:n])
+        self.bbox = get_tight_bbox(self.figure, fig.get_dpi())
+        self.titles = self.get_titles(fig)
+        self.n_builds += 1
+
+    def update (self, fig = None):
+        """ replaces the data drawn by each artist with the data in Figure.
+
+        Parameters:
+        -----------
+        fig : Figure
+            Figure rendered with template, with the same signature as the layout.
+
+        Returns:
+        --------
+        None
+        """
+        method = self.options.get('decimate') if self.generator == 'plot' else None
+        n_pixels = get_pixel_width(self.ax, fig.get_dpi()) if method is not None else None
+        for i, artist in zip(self.signature[6], self.artists):
+            x, y = get_plot_arrays(fig, i, method, n_pixels)
+            if self.generator == 'plot':
+                artist.set_data(x, y)
+            else:
+                artist.set_offsets(np.column_stack((x, y)))
+        # titles are updated in place, they do not change the layout of the axes
+        titles = self.get_titles(fig)
+        if titles != self.titles:
+            # titles which are no longer assigned are cleared, rather than left from the previous Figure
+            if fig.get_title_label() is not None:
+                self.figure.suptitle(fig.get_title_label().get_label(), fontsize = fig.get_title_label().get_size())
+            else:
+                self.figure.suptitle("")
+            if fig.get_subtitle_label() is not None:
+                self.ax.set_title(fig.get_subtitle_label().get_label(), fontsize = fig.get_subtitle_label().get_size())
+            else:
+                self.ax.set_title("")
+            # a longer or removed title changes the bounding box of the previous one
+            self.bbox = get_tight_bbox(self.figure, fig.get_dpi())
+            self.titles = titles
+        self.n_updates += 1
+
+    def save (self, fig = None):
+        """ saves figure to the locations assigned to Figure. """
+        save_figure(fig, self.figure, self.bbox)
+
+    def render (self, fig = None, save = True):
+        """ draws Figure with template, rebuilding the layout only if necessary.
+
+        Parameters:
+        -----------
+        fig : Figure
+            Figure rendered with template.
+        save : bool (optional, default is 'True')
+            if 'True', figure is saved to 'fig.get_saveas()'.
+
+        Returns:
+        --------
+        matplotlib.axes.Axes
+            axes containing the plot.
+        """
+        if fig is None:
+            print("ERROR :: Template.render() :: must specify 'fig'.")
+            return None
+        signature = self.get_signature(fig)
+        if self.figure is None or signature != self.signature:
+            self.signature = signature
+            self.build(fig)
+        else:
+            self.update(fig)
+        if save:
+            self.save(fig)
+        return self.ax
@@ -0,0 +1,214 @@
+## Matthew Dorsey
+## @sunprancekid
+## 18.10.2026
+
+## FILENAME: writer.py
+## PURPOSE: contains pool of threads which encode and write rendered figures in the background
+
+##############
+## PACKAGES ##
+##############
+# conda / native
+import os
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+
+################
+## PARAMETERS ##
+################
+
+## constants, defaults for SaveQueue class
+default_writer_threads = 2 # number of threads encoding and writing figures, when more than one cpu is available
+default_max_pending = 8 # maximum number of writes queued before the renderer waits
+
+## queues activated by each thread, most recent last
+active = threading.local()
+
+
+#############
+## METHODS ##
+#############
+
+def get_active_queue ():
+    """ returns SaveQueue activated by the calling thread, or 'None' if figures are saved immediately. """
+    stack = getattr(active, 'stack', None)
+    if not stack or stack[-1].workers == 0:
+        # queue without writer threads, figures are saved by the generator
+        return None
+    return stack[-1]
+
+def get_default_workers ():
+    """ returns number of writer threads used by default, '0' if only one cpu is available.
+
+    with one cpu, encoding in a writer thread competes with the renderer
+    for the same core and is slower than writing each figure immediately.
+    """
+    if (os.cpu_count() or 1) == 1:
+        return 0
+    return default_writer_threads
+
+
+#############
+## CLASSES ##
+#############
+
+class SaveQueue (object):
+    """ bounded pool of threads which write figures while the next figure is rendered.
+
+    while the queue is active, generators hand the RGBA buffer of each
+    raster figure to the queue and return as soon as it has been drawn;
+    encoding and writing the file happens in a writer thread. vector file
+    types are still saved by the generator. at most 'max_pending' writes
+    may be waiting or running at once; a generator which submits another
+    write waits until one finishes, which bounds the memory held by
+    queued buffers. the future of each queued write is recorded by the
+    Figure, see 'Figure.get_save_futures'. if 'workers' is '0', the queue
+    is inactive and generators save each file before returning, raising
+    any error themselves. this is the default when only one cpu is
+    available, see 'get_default_workers'.
+
+    the queue is activated for the calling thread with 'with', which waits
+    for every pending write when the block exits:
+
+        with SaveQueue() as q:
+            for fig in figs:
+                gen_plot(fig, show = False)
+
+    Attributes:
+    -----------
+    workers : int
+        number of writer threads, '0' if files are saved by the generator.
+    max_pending : int
+        maximum number of writes waiting or running at once.
+    pending : List[(str, concurrent.futures.Future)]
+        path and future of each write which is running, or failed since
+        the last flush.
+    n_submitted : int
+        number of writes submitted.
+    n_failed : int
+        number of writes which raised an exception.
+    wait_seconds : float
+        total time renderers waited for a free slot in the queue.
+
+    Methods:
+    --------
+    submit, add_pending, flush, get_futures, start, close
+    """
+
+    def __init__ (self, workers = None, max_pending = default_max_pending):
+        if workers is None or workers < 0:
+            workers = get_default_workers()
+        if max_pending is None or max_pending < 1:
+            max_pending = default_max_pending
+        self.workers = workers
+        self.max_pending = max_pending
+        self.executor = None
+        self.started = False
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.lock = threading.Lock()
+        self.pending = []
+        self.n_submitted = 0
+        self.n_failed = 0
+        self.wait_seconds = 0.
+
+    def __enter__ (self):
+        self.start()
+        return self
+
+    def __exit__ (self, exc_type, exc_value, tb):
+        self.close()
+        return False
+
+    def start (self):
+        """ starts writer threads, and activates queue for the calling thread. """
+        if self.executor is None and self.workers > 0:
+            self.executor = ThreadPoolExecutor(max_workers = self.workers, thread_name_prefix = "plot-writer")
+        self.started = True
+        if getattr(active, 'stack', None) is None:
+            active.stack = []
+        active.stack.append(self)
+
+    def close (self):
+        """ waits for every pending write, then stops writer threads and deactivates queue. """
+        self.flush()
+        stack = getattr(active, 'stack', None)
+        if stack and self in stack:
+            stack.remove(self)
+        if self.executor is not None:
+            self.executor.shutdown(wait = True)
+            self.executor = None
+        self.started = False
+
+    def submit (self, saveas = None, method = None, *args):
+        """ queues call which writes file, waiting if the queue is full.
+
+        Parameters:
+        -----------
+        saveas : str
+            path written by call.
+        method : callable
+            method called in writer thread with 'args'.
+
+        Returns:
+        --------
+        concurrent.futures.Future
+            result of call, which raises any exception raised by the call.
+        """
+        if self.executor is None:
+            if not self.started:
+                print("ERROR :: SaveQueue.submit() :: queue has not been started, writing '{0}' immediately.".format(saveas))
+            # call in the calling thread, returning the completed future
+            future = Future()
+            try:
+                future.set_result(method(*args))
+            except Exception as e:
+                future.set_exception(e)
+            self.add_pending(saveas, future)
+            return future
+        t0 = time.perf_counter()
+        self.slots.acquire()
+        self.wait_seconds += time.perf_counter() - t0
+        try:
+            future = self.executor.submit(method, *args)
+        except Exception:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda fut: self.slots.release())
+        self.add_pending(saveas, future)
+        return future
+
+    def add_pending (self, saveas = None, future = None):
+        """ records future of write to 'saveas', so that it is reported by 'flush'. """
+        with self.lock:
+            # writes which have finished are only kept until flush if they failed
+            self.pending = [(p, fut) for p, fut in self.pending if not fut.done() or fut.exception() is not None]
+            self.pending.append((saveas, future))
+            self.n_submitted += 1
+
+    def get_futures (self, paths = None):
+        """ returns futures of pending writes to any of 'paths'. """
+        paths = set(paths)
+        with self.lock:
+            return [fut for p, fut in self.pending if p in paths]
+
+    def flush (self):
+        """ waits for every pending write to finish, reporting any which failed.
+
+        Returns:
+        --------
+        int
+            number of writes which failed since the last flush.
+        """
+        with self.lock:
+            pending = self.pending
+            self.pending = []
+        wait([fut for p, fut in pending])
+        n = 0
+        for saveas, fut in pending:
+            if fut.exception() is not None:
+                print("ERROR :: SaveQueue.flush() :: unable to write '{0}' :: {1}".format(saveas, repr(fut.exception())))
+                n += 1
+        self.n_failed += n
+        return n
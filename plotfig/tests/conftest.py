@@ -0,0 +1,17 @@
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+# the plotting modules are in 'plot/' at the repository root, next to the
+# 'src/plot' package, add them to the same package so both can be imported
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root not in sys.path:
+    sys.path.insert(0, root)
+
+import plot  # noqa: E402
+
+if os.path.join(root, "plot") not in list(plot.__path__):
+    plot.__path__.append(os.path.join(root, "plot"))
@@ -0,0 +1,103 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from plot.figure import Figure
+from plot.plot import default_other_label, gen_pie_chart, sum_by_category
+
+
+def loop_sum(x, y, keys):
+    # per-row accumulation previously used by gen_bar_chart and gen_pie_chart
+    s = [0.] * len(keys)
+    for j in range(len(x)):
+        if x[j] not in keys:
+            continue
+        s[keys.index(x[j])] += y[j]
+    return s
+
+
+def random_rows(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    cats = np.array(["food", "rent", "fuel", "misc", "gifts"], dtype=object)
+    x = cats[rng.integers(0, len(cats), n)]
+    y = rng.uniform(-5., 50., n)
+    g = np.array(["a", "b", "c"], dtype=object)[rng.integers(0, 3, n)]
+    return x, y, g
+
+
+@pytest.mark.parametrize("keys", [None, ["rent", "food", "other"], []])
+def test_sum_matches_loop(keys):
+    x, y, g = random_rows()
+    if keys is None:
+        keys = list(dict.fromkeys(x))
+    assert np.allclose(sum_by_category(x, y, keys), loop_sum(list(x), list(y), keys))
+
+
+def test_grouped_sum_matches_loop():
+    x, y, g = random_rows(seed=1)
+    keys = list(dict.fromkeys(x))
+    groups = ["c", "a"]
+    s = sum_by_category(x, y, keys, groups=g, group_keys=groups)
+    assert s.shape == (len(groups), len(keys))
+    for k, i in enumerate(groups):
+        assert np.allclose(s[k], loop_sum(list(x[g == i]), list(y[g == i]), keys))
+
+
+def test_numeric_categories():
+    x = np.array([3, 1, 3, 2, 1, 3])
+    y = np.array([1., 2., 3., 4., 5., 6.])
+    assert sum_by_category(x, y, [1, 2, 3]).tolist() == loop_sum(list(x), list(y), [1, 2, 3])
+
+
+def pie_labels(x, y, **kwargs):
+    fig = Figure()
+    fig.append_lists_from_dict({"x": x, "y": y})
+    f, ax = plt.subplots()
+    try:
+        gen_pie_chart(fig, ax=ax, legend=False, show=False, save=False, **kwargs)
+        return [t.get_text() for t in ax.texts if t.get_text()]
+    finally:
+        plt.close(f)
+
+
+def test_pie_other_is_opt_in():
+    x = ["a", "b", "c", "d", "a"]
+    y = [50., 45., 2., 1., 10.]
+    assert sorted(pie_labels(x, y)) == ["a", "b", "c", "d"]
+    assert sorted(pie_labels(x, y, other_max=0.05)) == sorted([default_other_label, "a", "b"])
+
+
+def pie_wedges(x, y, **kwargs):
+    fig = Figure()
+    fig.append_lists_from_dict({"x": x, "y": y})
+    f, ax = plt.subplots()
+    try:
+        gen_pie_chart(fig, ax=ax, legend=True, show=False, save=False, **kwargs)
+        labels = [t.get_text() for t in ax.get_legend().get_texts()]
+        fractions = [(w.theta2 - w.theta1) / 360. for w in ax.patches]
+        return dict(zip(labels, fractions))
+    finally:
+        plt.close(f)
+
+
+def test_pie_other_wedge_sums_small_slices():
+    x = ["a", "b", "c", "d", "e"]
+    y = [60., 30., 4., 3., 3.]
+    wedges = pie_wedges(x, y, other_max=0.05)
+    assert list(wedges) == ["a", "b", default_other_label]
+    assert wedges["a"] == pytest.approx(0.6)
+    assert wedges["b"] == pytest.approx(0.3)
+    assert wedges[default_other_label] == pytest.approx(0.1)
+
+
+def test_pie_single_small_slice_is_not_folded():
+    x = ["a", "b", "c"]
+    y = [60., 37., 3.]
+    assert list(pie_wedges(x, y, other_max=0.05)) == ["a", "b", "c"]
+
+
+def test_pie_drops_empty_slices():
+    x = ["a", "b", "c", "d"]
+    y = [60., 37., 0., 3.]
+    assert list(pie_wedges(x, y)) == ["a", "b", "d"]
+    assert list(pie_wedges(x, y, other_max=0.5)) == ["a", default_other_label]
@@ -0,0 +1,60 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plot.batch import main, render_batch
+from plot.figure import Figure
+
+
+def write_csv(path, n=30):
+    x = np.arange(n)
+    pd.DataFrame({"t": x, "v": np.sqrt(x)}).to_csv(path, index=False)
+
+
+def new_figure(tmp_path, k):
+    fig = Figure()
+    fig.set_saveas(savedir=os.path.join(str(tmp_path), ""), filename="fig{0}".format(k))
+    fig.append_series([(np.arange(10.0), np.arange(10.0) * (k + 1), "k")])
+    return fig
+
+
+@pytest.mark.parametrize("workers, processes", [(1, True), (2, True), (2, False)])
+def test_render_batch(tmp_path, workers, processes):
+    jobs = [(new_figure(tmp_path, k), "plot", {"linewidth": 1.0}) for k in range(3)]
+    jobs.append((None, "plot", None))
+    jobs.append((new_figure(tmp_path, 9), "unknown", None))
+    results = sorted(render_batch(jobs, workers=workers, processes=processes), key=lambda r: r.index)
+    assert [r.index for r in results] == list(range(5))
+    assert [r.is_ok() for r in results] == [True, True, True, False, False]
+    assert "unknown" in results[4].error
+    for k in range(3):
+        assert results[k].saveas == os.path.join(str(tmp_path), "fig{0}.png".format(k))
+        assert os.path.isfile(results[k].saveas)
+
+
+def test_main_csv_and_spec_files(tmp_path, capsys):
+    for k in range(2):
+        write_csv(tmp_path / "data{0}.csv".format(k))
+    fig = Figure()
+    fig.append_csv(str(tmp_path / "data0.csv"), xcol="t", ycol="v")
+    fig.set_saveas(savedir=os.path.join(str(tmp_path / "specs"), ""), filename="from_spec")
+    fig.to_spec("scatter").save(str(tmp_path / "fig.toml"))
+    out = str(tmp_path / "out")
+    args = [str(tmp_path / "data*.csv"), str(tmp_path / "fig.toml"), "-x", "0", "-y", "v", "-o", out, "-t", ".png", ".svg", "-w", "1"]
+    assert main(args) == 0
+    for name in ["data0.png", "data0.svg", "data1.png", "data1.svg"]:
+        assert os.path.isfile(os.path.join(out, name))
+    assert os.path.isfile(str(tmp_path / "specs" / "from_spec.png"))
+    assert "rendered 3 of 3 figures" in capsys.readouterr().out
+
+
+def test_main_reports_failures(tmp_path, capsys):
+    write_csv(tmp_path / "data.csv")
+    cache = str(tmp_path / "cache")
+    args = [str(tmp_path / "data.csv"), str(tmp_path / "missing.csv"), "-x", "t", "-y", "v", "-o", str(tmp_path), "-c", cache, "-w", "1"]
+    assert main(args) == 1
+    assert "rendered 1 of 2 figures" in capsys.readouterr().out
+    assert main(args[:1] + args[2:]) == 0
+    assert "1 copied from cache" in capsys.readouterr().out
@@ -0,0 +1,53 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+
+from plot.figure import Figure
+from plot.plot import gen_plot, gen_scatter
+from plot.render import compact_handles, default_legend_max_entries
+
+
+def many_series(n=40):
+    fig = Figure()
+    x = np.linspace(0.0, 1.0, 25)
+    fig.append_series([(x, x * k, "s{0}".format(k)) for k in range(1, n + 1)])
+    return fig
+
+
+def draw(generator, fig, **options):
+    f, ax = plt.subplots()
+    try:
+        generator(fig, ax=ax, show=False, save=False, **options)
+        return ax, ax.get_legend()
+    finally:
+        plt.close(f)
+
+
+def test_plot_collects_ivals():
+    ax, legend = draw(gen_plot, many_series(), collect=True)
+    lines = [c for c in ax.collections if isinstance(c, LineCollection)]
+    assert len(lines) == 1
+    assert len(lines[0].get_segments()) == 40
+    assert len(ax.lines) == 0
+    assert len(legend.get_texts()) <= default_legend_max_entries
+    # one artist per ival without collecting
+    ax, legend = draw(gen_plot, many_series())
+    assert len(ax.lines) == 40
+
+
+def test_scatter_collects_ivals():
+    fig = many_series()
+    ax, legend = draw(gen_scatter, fig, collect=True, density=False)
+    n_markers = len(set(fig.get_marker(i) for i in fig.get_unique_ivals()))
+    assert len(ax.collections) == n_markers
+    assert sum(len(c.get_offsets()) for c in ax.collections) == len(fig.store)
+
+
+@pytest.mark.parametrize("n", [1, 12, 13, 100])
+def test_compact_handles(n):
+    handles = list(range(n))
+    kept = compact_handles(handles)
+    assert len(kept) == min(n, default_legend_max_entries)
+    assert kept[0] == 0 and kept[-1] == n - 1
+    assert kept == sorted(set(kept))
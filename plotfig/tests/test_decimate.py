@@ -0,0 +1,65 @@
+import numpy as np
+
+from plot.decimate import decimate, lttb_indices, minmax_indices
+from plot.figure import Figure
+from plot.memory import render_rgba
+from plot.plot import gen_plot
+
+
+def random_walk(n=20000, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.arange(n, dtype=float), np.cumsum(rng.normal(size=n))
+
+
+def draw(x, y, ylims, **options):
+    fig = Figure()
+    fig.append_series([(x, y, "walk")])
+    fig.set_dpi(100)
+    fig.set_xaxis_limits(x.min(), x.max())
+    fig.set_yaxis_limits(*ylims)
+    return np.array(render_rgba(fig, gen_plot, markersize=0, legendloc="upper left", **options)).astype(int)
+
+
+def test_minmax_keeps_column_extents():
+    x, y = random_walk(5000)
+    idx = minmax_indices(x, y, 100, (x[0], x[-1]))
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    cols = np.minimum((x / x[-1] * 100).astype(int), 99)
+    for c in range(100):
+        kept = idx[cols[idx] == c]
+        assert y[kept].min() == y[cols == c].min()
+        assert y[kept].max() == y[cols == c].max()
+
+
+def test_minmax_draws_same_raster():
+    x, y = random_walk()
+    ylims = (y.min() - 1.0, y.max() + 1.0)
+    full = draw(x, y, ylims)
+    minmax = draw(x, y, ylims, decimate="minmax")
+    n = len(decimate(x, y, 564, "minmax", (x[0], x[-1]))[0])
+    s = np.linspace(0, len(x) - 1, n).astype(int)
+    stride = draw(x[s], y[s], ylims)
+    assert minmax.shape == full.shape
+    # only antialiased coverage at the edges of each pixel column differs
+    drawn = full[..., :3].min(-1) < 250
+    assert np.count_nonzero(drawn != (minmax[..., :3].min(-1) < 250)) < 0.03 * np.count_nonzero(drawn)
+    assert np.abs(minmax - full).mean() < 0.5 * np.abs(stride - full).mean()
+
+
+def test_lttb_clips_to_limits():
+    x, y = random_walk(1000)
+    idx = lttb_indices(x, y, 200, lims=(100.0, 110.0))
+    assert idx.tolist() == list(range(99, 112))
+
+
+def test_lttb_unsorted_falls_back_to_minmax():
+    x, y = random_walk(5000, seed=1)
+    order = np.random.default_rng(2).permutation(len(x))
+    xu, yu = x[order], y[order]
+    xd, yd = decimate(xu, yu, 50, "lttb", lims=(x[0], x[-1]))
+    xm, ym = decimate(xu, yu, 50, "minmax", lims=(x[0], x[-1]))
+    assert np.array_equal(xd, xm) and np.array_equal(yd, ym)
+    # every pixel column keeps its extremes, so no visible points are dropped
+    for c in range(50):
+        lo, hi = x[0] + c * (x[-1] - x[0]) / 50, x[0] + (c + 1) * (x[-1] - x[0]) / 50
+        assert yd[(xd >= lo) & (xd < hi)].max() == yu[(xu >= lo) & (xu < hi)].max()
@@ -0,0 +1,47 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from plot.density import bin_points, blend_density
+from plot.figure import Figure
+from plot.plot import gen_scatter
+
+
+def new_figure(n=200):
+    rng = np.random.default_rng(0)
+    fig = Figure()
+    fig.append_series([(rng.normal(size=n), rng.normal(size=n), "a"), (rng.normal(size=n) + 2.0, rng.normal(size=n), "b")])
+    return fig
+
+
+def draw(fig, **kwargs):
+    f, ax = plt.subplots()
+    try:
+        gen_scatter(fig, ax=ax, show=False, save=False, **kwargs)
+        return len(ax.images), len(ax.collections)
+    finally:
+        plt.close(f)
+
+
+@pytest.mark.parametrize("threshold, images", [(10, 1), (10000, 0)])
+def test_density_threshold(threshold, images):
+    n_images, n_collections = draw(new_figure(), density_threshold=threshold)
+    assert n_images == images
+    assert n_collections == (0 if images else 2)
+
+
+def test_density_overrides_threshold():
+    assert draw(new_figure(), density=False, density_threshold=10)[0] == 0
+    assert draw(new_figure(), density=True)[0] == 1
+
+
+def test_bin_points_counts_visible_points():
+    x = np.array([0.0, 0.5, 0.99, 1.0, 2.0, -1.0])
+    y = np.array([0.0, 0.5, 0.99, 0.0, 0.5, 0.5])
+    counts = bin_points(x, y, (2, 2), (0.0, 1.0), (0.0, 1.0))
+    assert counts.shape == (2, 2)
+    # rows are y-bins, points on the upper limit are in the last bin, points outside the limits are not counted
+    assert counts.tolist() == [[1, 1], [0, 2]]
+    rgba = blend_density([counts], [(1.0, 0.0, 0.0, 1.0)])
+    assert rgba.shape == (2, 2, 4)
+    assert np.all(rgba[..., 3][counts == 0] == 0)
@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+
+from plot.figure import Figure
+from plot.store import GroupIndex
+
+
+def random_figure(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=n)
+    y = rng.normal(size=n)
+    i = rng.choice([3, 1, 2], size=n)
+    fig = Figure()
+    fig.append_lists_from_dict({"x": list(x), "y": list(y), "i": list(i)})
+    return fig, x, y, i
+
+
+def test_group_slices_match_masks():
+    fig, x, y, i = random_figure()
+    assert fig.get_unique_ivals() == list(dict.fromkeys(i))
+    for ival in [1, 2, 3]:
+        assert np.array_equal(fig.get_xval_array(ival), x[i == ival])
+        assert np.array_equal(fig.get_yval_array(ival), y[i == ival])
+        assert fig.get_xval_list(ival) == list(x[i == ival])
+    assert len(fig.get_xval_array(4)) == 0
+
+
+def test_group_index_reused_until_append():
+    fig, x, y, i = random_figure()
+    index = fig.store.get_group_index("i")
+    fig.get_xval_array(1)
+    assert fig.store.get_group_index("i") is index
+    fig.append_lists([0.5], [0.5], ilist=[4])
+    assert fig.store.get_group_index("i") is not index
+    assert fig.get_xval_array(4).tolist() == [0.5]
+    assert fig.get_unique_ivals()[-1] == 4
+
+
+def test_group_index_skips_missing():
+    index = GroupIndex(np.array(["a", None, "b", "a", None], dtype=object))
+    assert index.get_uniques() == ["a", "b"]
+    assert index.get_count("a") == 2
+    assert index.get_count("b") == 1
+    assert index.get_count("c") == 0
+    start, stop = index.get_bounds("a")
+    assert index.get_order()[start:stop].tolist() == [0, 3]
+
+
+def test_arrays_are_read_only_views():
+    fig, x, y, i = random_figure()
+    xs = fig.get_xval_array()
+    assert np.shares_memory(xs, fig.store.buffers["x"])
+    with pytest.raises(ValueError):
+        xs[0] = 1.0
+    # grouped values are views of one grouped copy of the column
+    a = fig.get_yval_array(2)
+    b = fig.get_yval_array(2)
+    assert np.shares_memory(a, b)
+    assert not a.flags.writeable
+    # lists are still returned by the original accessors
+    assert isinstance(fig.get_yval_list(2), list)
+
+
+def test_running_stats_match_data():
+    fig = Figure()
+    chunks = [np.array([3.0, np.nan, -1.0]), np.array([7.5, 2.0]), np.array([np.nan])]
+    for c in chunks:
+        fig.append_lists_from_dict({"x": list(c), "y": list(c * 2.0)})
+    stats = fig.store.get_stats("x")
+    data = np.concatenate(chunks)
+    assert stats.get_count() == len(data)
+    assert stats.get_nan_count() == 2
+    assert (stats.get_minimum(), stats.get_maximum()) == (np.nanmin(data), np.nanmax(data))
+
+
+def test_limits_computed_from_stats():
+    fig, x, y, i = random_figure()
+    lo, hi = fig.get_xaxis_min(), fig.get_xaxis_max()
+    assert lo <= x.min() and hi >= x.max()
+    assert hi - lo < 1.5 * (x.max() - x.min())
+    # limits are recomputed from the running statistics, not by scanning the column
+    fig.append_lists([0.0], [0.0], ilist=[1])
+    fig.store.get_stats("x").max = 100.0
+    assert 100.0 <= fig.get_xaxis_max() < 150.0
+
+
+def test_stats_stop_for_non_numeric():
+    fig = Figure()
+    fig.append_lists_from_dict({"x": [1.0, 2.0], "y": ["a", "b"]})
+    assert fig.store.get_stats("x").is_numeric()
+    assert not fig.store.get_stats("y").is_numeric()
+    assert fig.store.get_stats("y").get_maximum() is None
+
+
+def test_append_defers_derived_properties(monkeypatch):
+    fig, x, y, i = random_figure()
+    fig.refresh()
+    assert not fig.is_dirty()
+    calls = []
+    monkeypatch.setattr(fig, "set_axis_limits", lambda *a, **k: calls.append(a))
+    for k in range(5):
+        fig.append_lists([float(k)], [float(k)], ilist=[1])
+    assert fig.is_dirty("xlimits") and fig.is_dirty("labels")
+    assert calls == []
+    fig.refresh()
+    assert len(calls) == 2
+    assert not fig.is_dirty("labels") and not fig.is_dirty("markers")
+
+
+def test_assigned_properties_kept_after_append():
+    fig, x, y, i = random_figure()
+    fig.set_label(1, "one")
+    fig.set_marker(2, "x")
+    fig.append_lists([0.0, 1.0], [0.0, 1.0], ilist=[1, 5])
+    fig.set_xaxis_limits(-10.0, 10.0)
+    fig.refresh()
+    assert (fig.get_xaxis_min(), fig.get_xaxis_max()) == (-10.0, 10.0)
+    assert fig.get_label(1) == "one"
+    assert fig.get_label(5) == 5
+    assert fig.get_marker(2) == "x"
+    assert fig.get_marker(5) is not None
+
+
+def test_append_series_matches_append_lists():
+    x = np.linspace(0.0, 1.0, 10)
+    series = [(x, x ** k, "pow{0}".format(k)) for k in range(4)]
+    bulk = Figure()
+    assert bulk.append_series(series)
+    loop = Figure()
+    for xs, ys, label in series:
+        loop.append_lists(list(xs), list(ys), label=label)
+    assert bulk.get_unique_ivals() == loop.get_unique_ivals()
+    for c in ["x", "y", "i"]:
+        assert bulk.store.get_column(c).tolist() == loop.store.get_column(c).tolist()
+
+
+def test_append_series_forms_and_broadcasting():
+    fig = Figure()
+    assert fig.append_series({"a": ([1.0, 2.0], 5.0), "b": {"x": [3.0], "y": [4.0]}})
+    assert fig.append_series([{"x": [0.0, 1.0, 2.0], "y": [1.0, 1.0, 1.0], "label": "c"}])
+    assert fig.get_yval_array("a").tolist() == [5.0, 5.0]
+    assert fig.get_xval_array("b").tolist() == [3.0]
+    assert fig.get_unique_ivals() == ["a", "b", "c"]
+    assert fig.append_series([])
+    assert len(fig.store) == 6
+
+
+def test_append_series_rejects_bad_series():
+    fig = Figure()
+    assert not fig.append_series(None)
+    assert not fig.append_series([([1.0, 2.0], [1.0, 2.0, 3.0], "uneven")])
+    assert fig.append_series([([1.0], [1.0], "a")])
+    assert not fig.append_series([([1.0], [1.0], [2.0], "extra")])
+    assert len(fig.store) == 1
+
+
+def test_compact_dtype_policy_reduces_memory():
+    x = np.linspace(0.0, 1.0, 1000)
+    series = [(x, np.sin(x * k), "series {0}".format(k)) for k in range(5)]
+    full = Figure()
+    full.set_dtype_policy(categorical_ivals=False)
+    full.append_series(series)
+    compact = Figure()
+    compact.set_dtype_policy(float32=True)
+    compact.append_series(series)
+    assert compact.store.get_nbytes() < 0.6 * full.store.get_nbytes()
+    assert compact.get_unique_ivals() == full.get_unique_ivals()
+    assert np.allclose(compact.get_yval_array("series 3"), full.get_yval_array("series 3"), atol=1e-6)
+    assert str(compact.df["i"].dtype) == "category"
+    assert compact.df["x"].dtype == np.float32
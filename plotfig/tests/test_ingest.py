@@ -0,0 +1,167 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plot.cache import DiskCache
+from plot.figure import Figure
+from plot.ingest import read_csv_chunks, read_csv_columns, read_csv_files
+
+
+def write_csv(path, n=25, offset=0):
+    df = pd.DataFrame({
+        "t": np.arange(n) + offset,
+        "v": np.sin(np.arange(n) + offset),
+        "unused": np.zeros(n),
+        "g": ["run{0}".format(k % 3) for k in range(n)]})
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_chunks_match_full_read(tmp_path):
+    df = write_csv(tmp_path / "data.csv")
+    chunks = list(read_csv_chunks(str(tmp_path / "data.csv"), {"x": "t", "y": 1, "i": "g"}, chunksize=10))
+    assert [len(c["x"]) for c in chunks] == [10, 10, 5]
+    assert set(chunks[0].keys()) == {"x", "y", "i"}
+    assert np.array_equal(np.concatenate([c["x"] for c in chunks]), df["t"].to_numpy())
+    assert np.allclose(np.concatenate([c["y"] for c in chunks]), df["v"].to_numpy())
+    assert np.concatenate([c["i"] for c in chunks]).tolist() == df["g"].tolist()
+
+
+def test_missing_column(tmp_path):
+    write_csv(tmp_path / "data.csv")
+    assert read_csv_chunks(str(tmp_path / "data.csv"), {"x": "t", "y": "missing"}) is None
+    assert read_csv_chunks(str(tmp_path / "data.csv"), {"x": 10}) is None
+
+
+def test_append_csv_chunked(tmp_path):
+    df = write_csv(tmp_path / "data.csv")
+    fig = Figure()
+    assert fig.append_csv(str(tmp_path / "data.csv"), xcol="t", ycol="v", icol="g", chunksize=7)
+    assert len(fig.store) == len(df)
+    assert fig.get_unique_ivals() == ["run0", "run1", "run2"]
+    assert np.allclose(fig.get_yval_array("run1"), df["v"][df["g"] == "run1"].to_numpy())
+
+
+def test_cache_round_trip(tmp_path):
+    csv = str(tmp_path / "data.csv")
+    df = write_csv(csv)
+    cache = DiskCache(str(tmp_path / "cache"))
+    cols = {"x": "t", "y": "v", "i": "g"}
+    first = read_csv_columns(csv, cols, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    second = read_csv_columns(csv, cols, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    for k in cols:
+        assert second[k].tolist() == first[k].tolist()
+    assert second["i"].tolist() == df["g"].tolist()
+    # every cached array can be loaded without pickle
+    for root, dirs, files in os.walk(str(tmp_path / "cache")):
+        for f in files:
+            if f.endswith(".npy"):
+                assert np.load(os.path.join(root, f), allow_pickle=False).dtype != object
+
+
+def test_cache_invalidated_when_file_changes(tmp_path):
+    csv = str(tmp_path / "data.csv")
+    write_csv(csv)
+    cache = DiskCache(str(tmp_path / "cache"))
+    read_csv_columns(csv, {"x": "t", "y": "v"}, cache=cache)
+    df = write_csv(csv, n=30, offset=5)
+    cols = read_csv_columns(csv, {"x": "t", "y": "v"}, cache=cache)
+    assert cache.misses == 2
+    assert np.array_equal(cols["x"], df["t"].to_numpy())
+
+
+def test_figure_cache(tmp_path):
+    csv = str(tmp_path / "data.csv")
+    write_csv(csv)
+    figs = []
+    for k in range(2):
+        fig = Figure()
+        fig.set_cache(str(tmp_path / "cache"))
+        assert fig.append_csv(csv, xcol="t", ycol="v", icol="g")
+        figs.append(fig)
+    assert figs[1].get_cache().hits == 1
+    assert np.array_equal(figs[0].get_xval_array("run2"), figs[1].get_xval_array("run2"))
+
+
+def test_missing_file_in_list(tmp_path):
+    write_csv(tmp_path / "a.csv")
+    paths = [str(tmp_path / "a.csv"), str(tmp_path / "missing.csv")]
+    results = read_csv_files(paths, {"x": "t", "y": "v"}, workers=2)
+    assert results[0][1] is not None
+    assert results[1][1] is None
+    assert not Figure().append_csv_files(paths, xcol="t", ycol="v")
+
+
+def test_cache_requires_directory(capsys):
+    with pytest.raises(ValueError):
+        DiskCache()
+    assert capsys.readouterr().out == ""
+
+
+def test_failed_chunk_leaves_figure_unchanged(tmp_path):
+    good = str(tmp_path / "good.csv")
+    write_csv(good, n=5)
+    bad = str(tmp_path / "bad.csv")
+    with open(bad, "w") as f:
+        f.write("t,v,g\n")
+        f.write("".join("{0},{1},run{2}\n".format(k, k * 0.5, k % 4) for k in range(12)))
+        f.write("12,not a number,run9\n")
+    fig = Figure()
+    assert fig.append_csv(good, xcol="t", ycol="v", icol="g")
+    fig.set_xaxis_limits(-10.0, 10.0)
+    assert not fig.append_csv(bad, xcol="t", ycol="v", icol="g", dtype={"y": float}, chunksize=5)
+    assert len(fig.store) == 5
+    assert fig.get_unique_ivals() == ["run0", "run1", "run2"]
+    assert fig.store.get_stats("x").get_maximum() == 4
+    assert (fig.get_xaxis_min(), fig.get_xaxis_max()) == (-10.0, 10.0)
+    assert len(fig.sources) == 1
+    # retrying after the file is fixed does not duplicate rows
+    write_csv(bad, n=12)
+    assert fig.append_csv(bad, xcol="t", ycol="v", icol="g", chunksize=5)
+    assert len(fig.store) == 17
+
+
+def test_failed_first_append(tmp_path):
+    bad = str(tmp_path / "bad.csv")
+    with open(bad, "w") as f:
+        f.write("t,v\n1,2\n2,x\n")
+    fig = Figure()
+    assert not fig.append_csv(bad, xcol="t", ycol="v", dtype={"y": float}, chunksize=1)
+    assert fig.store is None
+    assert fig.get_columns() == []
+
+
+def test_unreadable_header(tmp_path):
+    empty = str(tmp_path / "empty.csv")
+    open(empty, "w").close()
+    assert read_csv_chunks(empty, {"x": "t"}) is None
+    assert not Figure().append_csv(empty, xcol="t", ycol="v")
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_append_csv_files_from_glob(tmp_path, processes):
+    frames = [write_csv(tmp_path / "run{0}.csv".format(k), n=10 + k, offset=k) for k in range(3)]
+    fig = Figure()
+    assert fig.append_csv_files(str(tmp_path / "run*.csv"), xcol="t", ycol="v", label="stem", workers=2, processes=processes)
+    assert fig.get_unique_ivals() == ["run0", "run1", "run2"]
+    for k, df in enumerate(frames):
+        assert np.allclose(fig.get_yval_array("run{0}".format(k)), df["v"].to_numpy())
+    assert fig.sources[0]["rows"] == sum(len(df) for df in frames)
+
+
+def test_append_csv_files_labels(tmp_path):
+    paths = [str(tmp_path / name) for name in ["b.csv", "a.csv"]]
+    for p in paths:
+        write_csv(p, n=4)
+    fig = Figure()
+    assert fig.append_csv_files(paths, xcol="t", ycol="v", label="name")
+    # list order is kept
+    assert fig.get_unique_ivals() == ["b.csv", "a.csv"]
+    fig = Figure()
+    assert fig.append_csv_files(paths, xcol="t", ycol="v", label=lambda p: os.path.basename(p)[0].upper())
+    assert fig.get_unique_ivals() == ["B", "A"]
+    assert not Figure().append_csv_files(str(tmp_path / "none*.csv"), xcol="t", ycol="v")
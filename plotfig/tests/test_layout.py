@@ -0,0 +1,83 @@
+import os
+
+import matplotlib
+import numpy as np
+import pytest
+from PIL import Image
+
+from plot import render
+from plot.figure import Figure
+from plot.plot import default_scatter_figsize, gen_plot, gen_scatter
+from plot.render import clear_layout_cache, layout_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_layout_cache():
+    clear_layout_cache()
+    yield
+    clear_layout_cache()
+
+
+def new_figure(savedir, filename, phase=0.0, title="layout"):
+    fig = Figure()
+    fig.set_saveas(savedir=os.path.join(str(savedir), ""), filename=filename, filetype=".png")
+    x = np.linspace(0.0, 10.0, 50)
+    fig.append_series([(x, np.sin(x + phase), "sin"), (x, np.cos(x + phase), "cos")])
+    fig.set_title_label(title)
+    fig.set_xaxis_label("x")
+    fig.set_yaxis_label("y")
+    return fig
+
+
+def image_size(fig):
+    with Image.open(fig.get_saveas_list()[0]) as im:
+        return im.size
+
+
+@pytest.mark.parametrize("generator, figsize", [
+    (gen_plot, None),
+    (gen_scatter, default_scatter_figsize)])
+def test_fixed_layout_saves_whole_canvas(tmp_path, generator, figsize):
+    fig = new_figure(tmp_path, "fixed")
+    generator(fig, show=False, layout="fixed")
+    w, h = figsize or matplotlib.rcParams["figure.figsize"]
+    dpi = fig.get_dpi()
+    assert image_size(fig) == (round(w * dpi), round(h * dpi))
+    assert len(layout_cache) == 1
+
+
+def test_margins_measured_once_per_shape(tmp_path, monkeypatch):
+    calls = []
+    tight_layout = matplotlib.figure.Figure.tight_layout
+
+    def counted(self, *args, **kwargs):
+        calls.append(self)
+        return tight_layout(self, *args, **kwargs)
+
+    monkeypatch.setattr(matplotlib.figure.Figure, "tight_layout", counted)
+    # same shape, different data: margins are reused
+    gen_plot(new_figure(tmp_path, "a", phase=0.0), show=False, layout="fixed")
+    gen_plot(new_figure(tmp_path, "b", phase=1.0), show=False, layout="fixed")
+    assert len(calls) == 1
+    assert len(layout_cache) == 1
+    # another kind of plot, or a missing title, is another shape
+    gen_scatter(new_figure(tmp_path, "c"), show=False, layout="fixed")
+    gen_plot(new_figure(tmp_path, "d", title=None), show=False, layout="fixed")
+    assert len(calls) == 3
+    assert len(layout_cache) == 3
+
+
+def test_reused_margins_match_measured(tmp_path):
+    gen_plot(new_figure(tmp_path, "a", phase=0.0), show=False, layout="fixed")
+    reused = dict(next(iter(layout_cache.values())))
+    clear_layout_cache()
+    gen_plot(new_figure(tmp_path, "b", phase=1.0), show=False, layout="fixed")
+    measured = next(iter(layout_cache.values()))
+    for side in ["left", "right", "bottom", "top"]:
+        assert reused[side] == pytest.approx(measured[side], abs=1e-3)
+
+
+def test_tight_layout_does_not_cache(tmp_path):
+    gen_plot(new_figure(tmp_path, "tight"), show=False)
+    assert render.default_layout == "tight"
+    assert len(layout_cache) == 0
@@ -0,0 +1,57 @@
+import io
+import os
+
+import numpy as np
+from PIL import Image
+
+from plot.figure import Figure
+from plot.memory import render_bytes, render_rgba
+from plot.plot import gen_pie_chart, gen_plot
+
+
+def new_figure(savedir, filetype=".png"):
+    fig = Figure()
+    fig.set_saveas(savedir=os.path.join(str(savedir), ""), filename="memory", filetype=filetype)
+    x = np.linspace(0.0, 10.0, 50)
+    fig.append_series([(x, np.sin(x), "sin"), (x, np.cos(x), "cos")])
+    fig.set_title_label("memory")
+    return fig
+
+
+def saved_pixels(fig, generator=gen_plot):
+    generator(fig, show=False, save=True)
+    with Image.open(fig.get_saveas_list()[0]) as im:
+        return np.asarray(im.convert("RGBA"))
+
+
+def test_bytes_match_saved_file(tmp_path):
+    data = render_bytes(new_figure(tmp_path), gen_plot)
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    assert os.listdir(str(tmp_path)) == []
+    with Image.open(io.BytesIO(data)) as im:
+        pixels = np.asarray(im.convert("RGBA"))
+    assert np.array_equal(pixels, saved_pixels(new_figure(tmp_path)))
+
+
+def test_bytes_in_other_filetype(tmp_path):
+    data = render_bytes(new_figure(tmp_path), gen_plot, filetype=".svg")
+    assert b"<svg" in data[:1000]
+    assert render_bytes(new_figure(tmp_path), gen_plot, filetype=".jpg") is None
+
+
+def test_rgba_matches_saved_file(tmp_path):
+    rgba = render_rgba(new_figure(tmp_path), gen_plot)
+    assert rgba.dtype == np.uint8
+    assert np.array_equal(rgba, saved_pixels(new_figure(tmp_path)))
+
+
+def test_rgba_without_bounding_box(tmp_path):
+    fig = Figure()
+    fig.set_saveas(savedir=os.path.join(str(tmp_path), ""), filename="pie", filetype=".png")
+    fig.append_lists_from_dict({"x": ["a", "b", "c"], "y": [3., 2., 1.]})
+    rgba = render_rgba(fig, gen_pie_chart)
+    assert np.array_equal(rgba, saved_pixels(fig, gen_pie_chart))
+
+
+def test_generator_without_figure():
+    assert render_rgba(Figure(), lambda fig, **options: None) is None
@@ -0,0 +1,121 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from plot.figure import Figure
+from plot.memory import render_rgba
+from plot.plot import gen_bar_chart, gen_pie_chart, gen_plot, gen_scatter
+from plot.render import is_pyplot_figure
+
+
+def new_figure(savedir, filename, filetype):
+    fig = Figure()
+    fig.set_saveas(savedir=os.path.join(str(savedir), ""), filename=filename, filetype=filetype)
+    x = np.linspace(0.0, 10.0, 50)
+    fig.append_series([(x, np.sin(x), "sin"), (x, np.cos(x), "cos")])
+    fig.set_title_label("formats")
+    return fig
+
+
+def read_pixels(path):
+    with Image.open(path) as im:
+        return np.asarray(im.convert("RGBA"))
+
+
+def test_set_saveas_list():
+    fig = Figure()
+    fig.set_saveas(filetype=[".png", ".pdf", ".png", ".bmp"])
+    assert fig.get_filetypes() == [".png", ".pdf"]
+    assert fig.filetype == ".png"
+    assert fig.get_saveas_list() == ["./figure.png", "./figure.pdf"]
+
+
+def test_set_filetype_options():
+    fig = Figure()
+    fig.set_dpi(150)
+    fig.set_filetype_options(".png", dpi=300, compression=3)
+    fig.set_filetype_options(".tif", compression="tiff_lzw")
+    assert fig.get_filetype_options(".png") == {"dpi": 300, "pil_kwargs": {"compress_level": 3}}
+    assert fig.get_filetype_options(".tif") == {"dpi": 150, "pil_kwargs": {"compression": "tiff_lzw"}}
+    assert fig.get_filetype_options(".pdf") == {"dpi": 150}
+
+
+def test_rasters_from_one_draw_match_separate_saves(tmp_path):
+    gen_plot(new_figure(tmp_path, "multi", [".png", ".tif", ".pdf", ".svg"]), show=False, save=True)
+    for t in [".png", ".tif"]:
+        gen_plot(new_figure(tmp_path, "single", t), show=False, save=True)
+        assert np.array_equal(read_pixels(tmp_path / ("multi" + t)), read_pixels(tmp_path / ("single" + t)))
+
+
+def test_vectors_written_with_rasters(tmp_path):
+    gen_plot(new_figure(tmp_path, "multi", [".png", ".pdf", ".svg"]), show=False, save=True)
+    assert (tmp_path / "multi.pdf").read_bytes().startswith(b"%PDF")
+    assert b"<svg" in (tmp_path / "multi.svg").read_bytes()
+
+
+def test_save_figure_records_every_file(tmp_path):
+    fig = new_figure(tmp_path, "multi", [".png", ".tif", ".svg"])
+    gen_plot(fig, show=False, save=True)
+    saved = fig.get_saved()
+    assert sorted(saved) == sorted(fig.get_saveas_list())
+    assert all(isinstance(t, float) and t >= 0.0 for t in saved.values())
+
+
+def best_time(method, repeat=2):
+    times = []
+    for k in range(repeat):
+        t0 = time.perf_counter()
+        method()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+@pytest.mark.slow
+def test_one_draw_faster_than_one_call_per_type(tmp_path):
+    # reduced version of 'examples/benchmark.py formats', with a loose bound
+    rng = np.random.default_rng(0)
+    x = np.arange(500)
+    series = [(x, rng.random(len(x)), "run{0}".format(j)) for j in range(5)]
+    filetypes = [".png", ".tif"]
+
+    def draw(filename, filetype):
+        fig = Figure()
+        fig.set_saveas(savedir=os.path.join(str(tmp_path), ""), filename=filename, filetype=filetype)
+        fig.append_series(series)
+        gen_plot(fig, show=False, save=True)
+
+    t_separate = best_time(lambda: [draw("separate", t) for t in filetypes])
+    t_single = best_time(lambda: draw("single", filetypes))
+    assert t_single < 0.9 * t_separate
+
+
+@pytest.mark.parametrize("generator", [gen_plot, gen_scatter, gen_pie_chart, gen_bar_chart])
+def test_generators_do_not_use_pyplot(tmp_path, generator):
+    fig = new_figure(tmp_path, generator.__name__, ".png")
+    before = plt.get_fignums()
+    ax = generator(fig, show=False, save=True)
+    assert plt.get_fignums() == before
+    assert not is_pyplot_figure(ax.figure)
+    assert os.path.isfile(fig.get_saveas())
+
+
+def test_generator_draws_onto_supplied_axes(tmp_path):
+    f, ax = plt.subplots()
+    try:
+        assert gen_plot(new_figure(tmp_path, "ax", ".png"), ax=ax, show=False, save=False) is ax
+        assert len(ax.lines) > 0
+        assert plt.fignum_exists(f.number)
+    finally:
+        plt.close(f)
+
+
+def test_threads_render_identical_images(tmp_path):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        images = list(executor.map(lambda k: render_rgba(new_figure(tmp_path, "t", ".png"), gen_plot).copy(), range(4)))
+    for image in images[1:]:
+        assert np.array_equal(image, images[0])
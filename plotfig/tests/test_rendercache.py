@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+
+from plot.figure import Figure
+from plot.plot import gen_plot
+from plot.rendercache import RenderCache
+
+
+def new_figure(savedir, title="cached", n=40):
+    fig = Figure()
+    fig.set_saveas(savedir=os.path.join(str(savedir), ""), filename="fig", filetype=[".png", ".svg"])
+    x = np.linspace(0.0, 5.0, n)
+    fig.append_series([(x, x ** 2, "square")])
+    fig.set_title_label(title)
+    return fig
+
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_miss_then_hit(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"))
+    fig = new_figure(tmp_path / "a")
+    assert not cache.render(fig, gen_plot, linewidth=2.)
+    assert (cache.hits, cache.misses) == (0, 1)
+    drawn = [read_bytes(p) for p in fig.get_saveas_list()]
+
+    fig = new_figure(tmp_path / "b")
+    assert cache.render(fig, gen_plot, linewidth=2.)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert [read_bytes(p) for p in fig.get_saveas_list()] == drawn
+
+
+def test_key_changes(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"))
+    key = cache.get_key(new_figure(tmp_path), gen_plot, {"linewidth": 2.})
+    # options which do not change the image are not part of the key
+    assert cache.get_key(new_figure(tmp_path), gen_plot, {"linewidth": 2., "show": True}) == key
+    assert cache.get_key(new_figure(tmp_path), gen_plot, {"linewidth": 3.}) != key
+    assert cache.get_key(new_figure(tmp_path, title="other"), gen_plot, {"linewidth": 2.}) != key
+    assert cache.get_key(new_figure(tmp_path, n=41), gen_plot, {"linewidth": 2.}) != key
+
+
+def test_changed_figure_is_drawn(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"))
+    cache.render(new_figure(tmp_path / "a"), gen_plot)
+    fig = new_figure(tmp_path / "b", title="other")
+    assert not cache.render(fig, gen_plot)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert all(os.path.isfile(p) for p in fig.get_saveas_list())
@@ -0,0 +1,97 @@
+import http.client
+import io
+import json
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from plot.server import RenderServer, default_max_body_bytes
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = RenderServer(workers=1, processes=False)
+    server.start(port=0, background=True)
+    yield server
+    server.shutdown()
+
+
+def post(server, body, headers=None, path="/render"):
+    conn = http.client.HTTPConnection("127.0.0.1", server.get_port(), timeout=60)
+    try:
+        conn.request("POST", path, body=body, headers=headers or {})
+        response = conn.getresponse()
+        return response.status, response.getheader("Content-Type"), response.read()
+    finally:
+        conn.close()
+
+
+def post_json(server, request):
+    return post(server, json.dumps(request).encode(), {"Content-Type": "application/json"})
+
+
+def spec(**kwargs):
+    request = {"data": {"x": [0., 1., 2.], "y": [1., 0., 1.]}}
+    request.update(kwargs)
+    return request
+
+
+def test_render_returns_image(server):
+    status, content_type, body = post_json(server, spec())
+    assert status == 200
+    assert content_type == "image/png"
+    with Image.open(io.BytesIO(body)) as im:
+        assert np.asarray(im).size > 0
+
+
+@pytest.mark.parametrize("body", [b"{not json", b"[1, 2]", b"\xff\xfe"])
+def test_malformed_body(server, body):
+    status, content_type, data = post(server, body)
+    assert status == 400
+    assert "error" in json.loads(data)
+
+
+@pytest.mark.parametrize("request_", [
+    spec(generator="gen_unknown"),
+    spec(options=[1, 2]),
+    spec(options={"no_such_option": 1}),
+    {"data": {}}])
+def test_invalid_request(server, request_):
+    failed = server.get_stats()["failed"]
+    status, content_type, data = post_json(server, request_)
+    assert status == 400
+    assert "error" in json.loads(data)
+    assert server.get_stats()["failed"] == failed + 1
+
+
+def test_files_not_allowed(server):
+    status, content_type, data = post_json(server, {"sources": [{"path": "/etc/passwd"}]})
+    assert status == 400
+    assert "not allowed" in json.loads(data)["error"]
+
+
+def test_body_size_limits(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.get_port(), timeout=60)
+    try:
+        # the body is rejected from its length, before it is read
+        conn.putrequest("POST", "/render")
+        conn.putheader("Content-Length", str(default_max_body_bytes + 1))
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == 413
+        assert "error" in json.loads(response.read())
+    finally:
+        conn.close()
+    status, content_type, data = post(server, b"")
+    assert status == 400
+
+
+def test_unknown_paths(server):
+    assert post(server, b"{}", path="/draw")[0] == 404
+    conn = http.client.HTTPConnection("127.0.0.1", server.get_port(), timeout=60)
+    try:
+        conn.request("GET", "/health")
+        assert conn.getresponse().read() == b"ok"
+    finally:
+        conn.close()
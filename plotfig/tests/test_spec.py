@@ -0,0 +1,106 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plot.figure import Figure
+from plot.spec import FigureSpec
+
+
+def write_csv(path):
+    x = np.arange(20)
+    pd.DataFrame({"t": x, "v": x * 0.5, "run": ["a", "b"] * 10}).to_csv(path, index=False)
+
+
+def new_spec():
+    return FigureSpec({
+        "generator": "plot",
+        "options": {"linewidth": 2.5, "legendloc": "upper left"},
+        "title": {"label": "spec \"quoted\" title", "size": 14},
+        "axes": {"x": {"label": "time [s]", "min": 0.0, "max": 10.0}},
+        "labels": {"ivals": [["a", "run a"], ["b", "run b"]]},
+        "empty": None,
+        "dpi": np.int64(200)})
+
+
+def test_json_round_trip():
+    spec = new_spec()
+    other = FigureSpec.from_json(spec.to_json(indent=2))
+    assert other == spec
+    assert hash(other) == hash(spec)
+    assert other.get_key() == spec.get_key()
+    # unassigned values are dropped, numpy values are written as built-in types
+    assert "empty" not in spec.to_dict()
+    assert spec.get("dpi") == 200
+
+
+def test_toml_round_trip():
+    spec = new_spec()
+    other = FigureSpec.from_toml(spec.to_toml())
+    assert other == spec
+    assert other.get_options() == {"linewidth": 2.5, "legendloc": "upper left"}
+
+
+def test_pickle_round_trip():
+    spec = new_spec()
+    other = pickle.loads(pickle.dumps(spec))
+    assert other == spec
+    assert other.to_dict() == spec.to_dict()
+
+
+def test_spec_differs():
+    d = new_spec().to_dict()
+    d["options"]["linewidth"] = 3.0
+    assert FigureSpec(d) != new_spec()
+    assert FigureSpec(d).get_key() != new_spec().get_key()
+
+
+@pytest.mark.parametrize("ext", [".json", ".toml"])
+def test_save_load(tmp_path, ext):
+    path = str(tmp_path / ("spec" + ext))
+    assert new_spec().save(path)
+    assert FigureSpec.load(path) == new_spec()
+
+
+def test_load_bad_file(tmp_path):
+    assert not new_spec().save(str(tmp_path / "spec.txt"))
+    assert FigureSpec.load(str(tmp_path / "missing.json")) is None
+    with open(str(tmp_path / "bad.json"), "w") as f:
+        f.write("{not json")
+    assert FigureSpec.load(str(tmp_path / "bad.json")) is None
+
+
+def test_figure_round_trip(tmp_path):
+    csv = str(tmp_path / "data.csv")
+    write_csv(csv)
+    fig = Figure()
+    assert fig.append_csv(csv, xcol="t", ycol="v", icol="run")
+    fig.set_saveas(savedir=os.path.join(str(tmp_path), ""), filename="fig", filetype=[".png", ".pdf"])
+    fig.set_title_label("from csv")
+    fig.set_xaxis_label("time")
+    fig.set_yaxis_limits(-1.0, 12.0)
+    fig.set_label("a", "first")
+    spec = fig.to_spec("plot", {"linewidth": 2.0})
+    assert spec.get("sources")[0]["file"] == csv
+    assert "data" not in spec.to_dict()
+
+    path = str(tmp_path / "fig.toml")
+    assert spec.save(path)
+    other = Figure.from_spec(path)
+    assert other.to_spec("plot", {"linewidth": 2.0}) == spec
+    assert other.get_label("a") == "first"
+    assert other.get_saveas_list() == fig.get_saveas_list()
+    assert np.array_equal(other.get_yval_array("b"), fig.get_yval_array("b"))
+
+
+def test_inline_data():
+    fig = Figure()
+    x = np.linspace(0.0, 1.0, 5)
+    fig.append_series([(x, x ** 2, "square")])
+    assert fig.to_spec("plot") is None
+    spec = fig.to_spec("plot", data=True)
+    other = Figure.from_spec(FigureSpec.from_json(spec.to_json()))
+    assert np.allclose(other.get_yval_array("square"), x ** 2)
+    assert other.to_spec("plot", data=True) == spec
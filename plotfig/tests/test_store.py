@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plot.figure import Figure
+from plot.store import ColumnStore
+
+
+def test_append_grows_buffers():
+    store = ColumnStore(capacity=4)
+    assert store.append({"x": np.arange(3), "y": np.arange(3) * 2.0})
+    assert store.get_capacity() == 4
+    assert store.append({"x": np.arange(3, 10), "y": np.arange(3, 10) * 2.0})
+    assert len(store) == 10
+    assert store.get_capacity() == 16
+    assert np.array_equal(store.get_column("x"), np.arange(10))
+    assert np.array_equal(store.get_column("y"), np.arange(10) * 2.0)
+    assert store.get_stats("y").get_minimum() == 0.0
+    assert store.get_stats("y").get_maximum() == 18.0
+
+
+def test_column_is_read_only_view():
+    store = ColumnStore()
+    store.append({"x": [1.0, 2.0]})
+    with pytest.raises(ValueError):
+        store.get_column("x")[0] = 5.0
+
+
+def test_append_rejects_bad_columns():
+    store = ColumnStore()
+    assert store.append({"x": [1, 2], "y": [1, 2]})
+    assert not store.append({"x": [1, 2]})
+    assert not store.append({"x": [1, 2], "y": [1]})
+    assert len(store) == 2
+
+
+def test_append_promotes_dtype():
+    store = ColumnStore()
+    store.append({"x": np.array([1, 2])})
+    store.append({"x": np.array([0.5])})
+    assert store.get_column("x").dtype == np.float64
+    assert store.get_column("x").tolist() == [1.0, 2.0, 0.5]
+
+
+def test_group_slices_keep_append_order():
+    store = ColumnStore(capacity=2)
+    x = np.arange(9)
+    i = np.array(["b", "a", "b", "c", "a", "b", "c", "a", "a"], dtype=object)
+    store.append({"x": x[:4], "i": i[:4]})
+    assert store.get_group_index("i").get_uniques() == ["b", "a", "c"]
+    # index is rebuilt after more data is appended
+    store.append({"x": x[4:], "i": i[4:]})
+    for ival in ["a", "b", "c"]:
+        assert np.array_equal(store.get_group("x", "i", ival), x[i == ival])
+        assert store.get_group_index("i").get_count(ival) == np.count_nonzero(i == ival)
+    assert len(store.get_group("x", "i", "missing")) == 0
+
+
+@pytest.mark.parametrize("categorical", [True, False])
+def test_categorical_groups_match(categorical):
+    store = ColumnStore()
+    store.set_dtype_policy(categorical=["i"] if categorical else None)
+    i = np.array([3, 1, 3, 2, 1], dtype=object)
+    store.append({"x": np.arange(5.0), "i": i})
+    assert store.is_categorical("i") == categorical
+    assert store.get_group_index("i").get_uniques() == [3, 1, 2]
+    assert store.get_group("x", "i", 3).tolist() == [0.0, 2.0]
+
+
+def test_dtype_policy():
+    store = ColumnStore()
+    store.set_dtype_policy(categorical=["i"], float32=["x"], downcast_ints=True)
+    x = np.linspace(0.0, 1.0, 5)
+    store.append({"x": x, "y": np.array([1, 2, 3, 4, 5], dtype=np.int64), "i": ["a", "b", "a", None, "b"]})
+    assert store.buffers["x"].dtype == np.float32
+    assert store.buffers["y"].dtype.itemsize == 1
+    assert store.buffers["i"].dtype == np.int32
+    assert np.allclose(store.get_column("x"), x)
+    assert store.get_column("y").tolist() == [1, 2, 3, 4, 5]
+    assert store.get_column("i").tolist() == ["a", "b", "a", None, "b"]
+    assert store.categories["i"] == ["a", "b"]
+
+
+def test_figure_dtype_policy_converts_data():
+    fig = Figure()
+    fig.append_lists_from_dict({"x": [1.0, 2.0, 3.0], "y": [4.0, 5.0, 6.0], "i": ["a", "b", "a"]})
+    assert fig.store.is_categorical("i")
+    fig.set_dtype_policy(categorical_ivals=False, float32=True)
+    assert not fig.store.is_categorical("i")
+    assert fig.store.buffers["x"].dtype == np.float32
+    assert fig.get_yval_array("a").tolist() == [4.0, 6.0]
+    assert fig.get_unique_ivals() == ["a", "b"]
+
+
+def test_append_df_does_not_build_df(monkeypatch):
+    df = pd.DataFrame({"a": np.arange(5.0), "b": np.arange(5.0) * 2.0, "g": list("xxyyx")})
+    fig = Figure()
+
+    def fail(self):
+        raise AssertionError("DataFrame built while appending")
+
+    monkeypatch.setattr(ColumnStore, "to_df", fail)
+    for k in range(3):
+        assert fig.append_df(df, xcol="a", ycol="b", label="s{0}".format(k))
+    assert not fig.append_df(df, xcol="a", ycol="b", icol="g", ccol="b")
+    assert not fig.append_df(df, xcol="a", ycol="missing", label="s")
+    assert len(fig.store) == 15
+    assert fig.get_unique_ivals() == ["s0", "s1", "s2"]
+    assert fig.get_yval_array("s1").tolist() == df["b"].tolist()
+
+
+def test_rollback_removes_rows_and_categories():
+    store = ColumnStore()
+    store.set_dtype_policy(categorical=["i"])
+    assert store.append({"x": np.arange(3), "i": ["a", "b", "a"]})
+    state = store.checkpoint()
+    assert store.append({"x": np.arange(10, 14), "i": ["c", "a", "c", "d"]})
+    store.rollback(state)
+    assert len(store) == 3
+    assert store.categories["i"] == ["a", "b"]
+    assert store.get_stats("x").get_maximum() == 2
+    assert store.append({"x": [5], "i": ["e"]})
+    assert store.get_column("i").tolist() == ["a", "b", "a", "e"]
@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from plot.figure import Figure
+from plot.template import Template
+
+
+def new_figure(title=None, subtitle=None, n=20):
+    fig = Figure()
+    x = np.linspace(0.0, 1.0, n)
+    fig.append_series([(x, x ** 2, "a"), (x, x ** 3, "b")])
+    if title is not None:
+        fig.set_title_label(title)
+    if subtitle is not None:
+        fig.set_subtitle_label(subtitle)
+    return fig
+
+
+def test_removed_titles_are_cleared():
+    template = Template("plot")
+    template.render(new_figure("a much longer title than the figure", "subtitle"), save=False)
+    template.render(new_figure(), save=False)
+    assert template.n_builds == 1
+    assert template.figure.get_suptitle() == ""
+    assert template.ax.get_title() == ""
+    fresh = Template("plot")
+    fresh.render(new_figure(), save=False)
+    assert np.allclose(template.bbox.bounds, fresh.bbox.bounds)
+
+
+def new_frame(savedir, k):
+    fig = Figure()
+    fig.set_saveas(savedir=os.path.join(str(savedir), ""), filename="frame{0}".format(k))
+    x = np.linspace(0.0, 1.0, 40)
+    fig.append_series([(x, np.sin(x * 6.0 + k), "a"), (x, np.cos(x * 6.0 + k), "b")])
+    fig.set_xaxis_limits(0.0, 1.0)
+    fig.set_yaxis_limits(-1.5, 1.5)
+    return fig
+
+
+def read_pixels(path):
+    with Image.open(path) as im:
+        return np.asarray(im.convert("RGBA"))
+
+
+@pytest.mark.parametrize("generator", ["plot", "scatter"])
+def test_update_matches_rebuild(tmp_path, generator):
+    template = Template(generator)
+    for k in range(3):
+        template.render(new_frame(tmp_path / "updated", k))
+    assert (template.n_builds, template.n_updates) == (1, 2)
+    for k in range(3):
+        Template(generator).render(new_frame(tmp_path / "built", k))
+        updated = read_pixels(tmp_path / "updated" / "frame{0}.png".format(k))
+        built = read_pixels(tmp_path / "built" / "frame{0}.png".format(k))
+        assert np.array_equal(updated, built)
+
+
+def test_layout_changes_rebuild(tmp_path):
+    template = Template("plot")
+    template.render(new_frame(tmp_path, 0), save=False)
+    fig = new_frame(tmp_path, 1)
+    fig.set_yaxis_limits(-2.0, 2.0)
+    template.render(fig, save=False)
+    fig = new_frame(tmp_path, 2)
+    fig.set_label("a", "renamed")
+    template.render(fig, save=False)
+    fig = new_frame(tmp_path, 3)
+    fig.set_xaxis_label("time")
+    template.render(fig, save=False)
+    fig = new_frame(tmp_path, 4)
+    fig.append_series([([0.5], [0.0], "c")])
+    template.render(fig, save=False)
+    assert (template.n_builds, template.n_updates) == (5, 0)
+    template.reset()
+    template.render(new_frame(tmp_path, 5), save=False)
+    assert template.n_builds == 6
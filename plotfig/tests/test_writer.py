@@ -0,0 +1,75 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from plot import writer
+from plot.figure import Figure
+from plot.plot import gen_plot
+from plot.writer import SaveQueue
+
+
+def new_figure(savedir, filename="fig"):
+    fig = Figure()
+    fig.set_saveas(savedir=os.path.join(str(savedir), ""), filename=filename, filetype=[".png", ".tif"])
+    x = np.linspace(0.0, 10.0, 50)
+    fig.append_series([(x, np.sin(x), "sin"), (x, np.cos(x), "cos")])
+    return fig
+
+
+def read_pixels(path):
+    with Image.open(path) as im:
+        return np.asarray(im.convert("RGBA"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_queued_save_matches_direct_save(tmp_path, workers):
+    direct = new_figure(tmp_path / "direct")
+    gen_plot(direct, show=False)
+    assert direct.get_save_futures() == []
+
+    queued = new_figure(tmp_path / "queued")
+    with SaveQueue(workers=workers) as q:
+        gen_plot(queued, show=False)
+        futures = queued.get_save_futures()
+        assert len(futures) == 2
+        for fut in futures:
+            fut.result()
+    assert q.n_failed == 0
+    for a, b in zip(direct.get_saveas_list(), queued.get_saveas_list()):
+        assert np.array_equal(read_pixels(a), read_pixels(b))
+
+
+def test_failed_save_raises_through_future(tmp_path):
+    fig = new_figure(tmp_path)
+    # each save path is a directory, so writing the file fails
+    for path in fig.get_saveas_list():
+        os.makedirs(path)
+    with SaveQueue(workers=1) as q:
+        gen_plot(fig, show=False)
+        futures = fig.get_save_futures()
+        assert len(futures) == 2
+        with pytest.raises(OSError):
+            futures[0].result()
+    assert q.n_failed == 2
+    # futures are not pickled with the Figure
+    assert pickle.loads(pickle.dumps(fig)).get_save_futures() == []
+
+
+def test_synchronous_with_one_cpu(monkeypatch, tmp_path):
+    monkeypatch.setattr(writer.os, "cpu_count", lambda: 1)
+    assert SaveQueue().workers == 0
+    monkeypatch.setattr(writer.os, "cpu_count", lambda: 4)
+    assert SaveQueue().workers == writer.default_writer_threads
+    fig = new_figure(tmp_path)
+    with SaveQueue(workers=0) as q:
+        assert writer.get_active_queue() is None
+        gen_plot(fig, show=False)
+        # files are written before the generator returns
+        assert fig.get_save_futures() == []
+        assert all(os.path.isfile(p) for p in fig.get_saveas_list())
+        fut = q.submit("path", lambda a: a * 2, 21)
+        assert fut.done() and fut.result() == 42
+    assert q.executor is None